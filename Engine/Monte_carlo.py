@@ -1,12 +1,90 @@
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+from Utils.online_stats import QuantileSketch, RunningMoments
+from Utils.price_panel import PricePanel
+
+from .processes import GeometricBrownianMotion, _gbm_from_shocks
+from .variance_reduction import (
+    VARIANCE_REDUCTION_METHODS,
+    antithetic_normals,
+    moment_matched_normals,
+    sobol_normals,
+    summarize_estimate,
+)
+
+
+def _simulate_chunk(process, initial_value, time_horizon, num_paths, seed_sequence, dtype=np.float64):
+    """
+    Simulate one chunk of paths.
+
+    Module-level so that it can be sent to worker processes.
+
+    Parameters:
+        process (StochasticProcess): The price process to simulate.
+        initial_value (float): The starting value of every path.
+        time_horizon (int): Total number of time steps in the simulation.
+        num_paths (int): Number of paths in the chunk.
+        seed_sequence (np.random.SeedSequence): Seed of the chunk's random stream.
+        dtype (np.dtype): float32 or float64.
+
+    Returns:
+        np.ndarray: Simulated paths (num_paths x time_horizon + 1).
+    """
+    out = np.empty((num_paths, time_horizon + 1), dtype=dtype)
+    return process.simulate(out, np.random.default_rng(seed_sequence), initial_value)
+
+
+def _simulate_into_panel(process, initial_value, panel, column, start, stop, seed_sequence):
+    """
+    Simulate one chunk of paths straight into a shared PricePanel column.
+
+    Module-level so that it can be sent to worker processes; the panel arrives as
+    a handle and is reattached, so nothing is copied back to the parent.
+
+    Parameters:
+        process (StochasticProcess): The price process to simulate.
+        initial_value (float): The starting value of every path.
+        panel (PricePanel): Panel holding the output buffer.
+        column (str): Column of the panel holding the (num_simulations, time_horizon + 1) paths.
+        start (int): First path of the chunk.
+        stop (int): End of the chunk.
+        seed_sequence (np.random.SeedSequence): Seed of the chunk's random stream.
+    """
+    process.simulate(panel[column][start:stop], np.random.default_rng(seed_sequence), initial_value)
+    panel.close()
+
+
+def _summarize_chunk(process, initial_value, time_horizon, num_paths, seed_sequence):
+    """
+    Simulate one chunk of paths and accumulate its final values.
+
+    Parameters:
+        process (StochasticProcess): The price process to simulate.
+        initial_value (float): The starting value of every path.
+        time_horizon (int): Total number of time steps in the simulation.
+        num_paths (int): Number of paths in the chunk.
+        seed_sequence (np.random.SeedSequence): Seed of the chunk's random stream.
+
+    Returns:
+        tuple: (RunningMoments, QuantileSketch) of the chunk's final values.
+    """
+    final_values = _simulate_chunk(process, initial_value, time_horizon, num_paths, seed_sequence)[:, -1]
+    moments = RunningMoments()
+    moments.update(final_values)
+    sketch = QuantileSketch(seed=seed_sequence.spawn(1)[0])
+    sketch.update(final_values)
+    return moments, sketch
+
 class MonteCarloSimulation:
     """
     A class to perform Monte Carlo simulations for financial strategies.
     """
 
-    def __init__(self, initial_value, num_simulations, time_horizon, drift, volatility):
+    def __init__(self, initial_value, num_simulations, time_horizon, drift, volatility, seed=None, chunk_size=10000,
+                 process=None):
         """
         Initialize the Monte Carlo Simulation.
 
@@ -16,35 +94,255 @@ class MonteCarloSimulation:
             time_horizon (int): Total number of time steps in the simulation.
             drift (float): Expected return or mean growth rate.
             volatility (float): Standard deviation or variability of returns.
+            seed (int or np.random.SeedSequence): Seed for reproducible runs. If None,
+                the seed is drawn from the global np.random state.
+            chunk_size (int): Number of paths per independently seeded chunk. The
+                chunking, not the number of workers, determines the random streams.
+            process (StochasticProcess): Price process to simulate, e.g. HestonProcess.
+                Defaults to GeometricBrownianMotion(drift, volatility).
         """
         self.initial_value = initial_value
         self.num_simulations = num_simulations
         self.time_horizon = time_horizon
         self.drift = drift
         self.volatility = volatility
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.process = process if process is not None else GeometricBrownianMotion(drift, volatility)
+
+    def _root_seed(self):
+        """
+        The SeedSequence from which chunk and replicate seeds are spawned.
+
+        A SeedSequence seed is copied, since spawning from it would advance it and
+        change the streams of the next run.
+
+        Returns:
+            np.random.SeedSequence: Root of the simulation's random streams.
+        """
+        if isinstance(self.seed, np.random.SeedSequence):
+            return np.random.SeedSequence(self.seed.entropy, spawn_key=self.seed.spawn_key,
+                                          pool_size=self.seed.pool_size,
+                                          n_children_spawned=self.seed.n_children_spawned)
+        if self.seed is None:
+            return np.random.SeedSequence(np.random.randint(0, 2**32, size=4))
+        return np.random.SeedSequence(self.seed)
+
+    def _chunk_seeds(self, root=None):
+        """
+        Split the simulations into chunks and spawn one seed per chunk.
+
+        Parameters:
+            root (np.random.SeedSequence): Root to spawn from. Defaults to _root_seed().
+
+        Returns:
+            list: (start, stop, seed_sequence) for every chunk.
+        """
+        if root is None:
+            root = self._root_seed()
+        starts = range(0, self.num_simulations, self.chunk_size)
+        return [
+            (start, min(start + self.chunk_size, self.num_simulations), seed_sequence)
+            for start, seed_sequence in zip(starts, root.spawn(len(starts)))
+        ]
 
-    def run_simulation(self):
+    def run_simulation(self, workers=None, out=None, dtype=np.float64):
         """
         Runs the Monte Carlo simulation.
 
+        Paths are generated in chunks, each with its own SeedSequence-spawned
+        generator, so a given seed yields the same paths for any number of workers.
+        In-process chunks are written straight into the output buffer.
+
+        Parameters:
+            workers (int): Number of worker processes. None or 1 runs in this process.
+            out (np.ndarray or PricePanel): Optional C-contiguous buffer of shape
+                (num_simulations, time_horizon + 1) to reuse across runs, or a
+                PricePanel whose first column is such a buffer; workers then write
+                their chunks into the shared panel directly.
+            dtype (np.dtype): float32 or float64, used when ``out`` is not given.
+
+        Returns:
+            np.ndarray: Simulated paths (num_simulations x time_horizon + 1).
+        """
+        shape = (self.num_simulations, self.time_horizon + 1)
+        panel = None
+        if isinstance(out, PricePanel):
+            panel, column = out, out.columns[0]
+            out = panel[column]
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        elif out.shape != shape or not out.flags.c_contiguous:
+            raise ValueError(f"out must be a C-contiguous array of shape {shape}.")
+
+        chunks = self._chunk_seeds()
+
+        if workers is None or workers <= 1 or len(chunks) <= 1:
+            for start, stop, seed_sequence in chunks:
+                self.process.simulate(out[start:stop], np.random.default_rng(seed_sequence), self.initial_value)
+            return out
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            if panel is not None:
+                futures = [
+                    pool.submit(_simulate_into_panel, self.process, self.initial_value, panel, column, start, stop,
+                                seed_sequence)
+                    for start, stop, seed_sequence in chunks
+                ]
+                for future in futures:
+                    future.result()
+                return out
+
+            futures = [
+                (start, stop, pool.submit(
+                    _simulate_chunk, self.process, self.initial_value, self.time_horizon, stop - start, seed_sequence,
+                    out.dtype,
+                ))
+                for start, stop, seed_sequence in chunks
+            ]
+            for start, stop, future in futures:
+                out[start:stop] = future.result()
+        return out
+
+    def summarize_streaming(self, quantiles=(0.05, 0.25, 0.5, 0.75, 0.95), workers=None):
+        """
+        Simulate and summarize final values block by block without keeping the paths.
+
+        Each chunk of chunk_size paths is reduced to online accumulators that are
+        merged in chunk order, so peak memory is bounded by the chunk size rather
+        than num_simulations. The median and quantiles are sketch estimates.
+
+        Parameters:
+            quantiles (tuple of float): Quantiles of the final values to estimate.
+            workers (int): Number of worker processes. None or 1 runs in this process.
+
+        Returns:
+            dict: Statistics with the same keys as summarize_simulation, plus "quantiles".
+        """
+        root = self._root_seed()
+        chunks = self._chunk_seeds(root)
+        params = (self.process, self.initial_value, self.time_horizon)
+        moments = RunningMoments()
+        # The next child after the chunk seeds, so seeded summaries are reproducible
+        sketch = QuantileSketch(seed=root.spawn(1)[0])
+
+        if workers is None or workers <= 1 or len(chunks) <= 1:
+            results = (_summarize_chunk(*params, stop - start, seed_sequence) for start, stop, seed_sequence in chunks)
+            for chunk_moments, chunk_sketch in results:
+                moments.merge(chunk_moments)
+                sketch.merge(chunk_sketch)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_summarize_chunk, *params, stop - start, seed_sequence)
+                    for start, stop, seed_sequence in chunks
+                ]
+                for future in futures:
+                    chunk_moments, chunk_sketch = future.result()
+                    moments.merge(chunk_moments)
+                    sketch.merge(chunk_sketch)
+
+        return {
+            "mean": moments.mean,
+            "median": sketch.quantile(0.5),
+            "std_dev": moments.std,
+            "min": moments.min,
+            "max": moments.max,
+            "quantiles": dict(zip(quantiles, sketch.quantile(quantiles))),
+        }
+
+    def estimate(self, statistic=None, method="plain", confidence=0.95, num_replicates=16):
+        """
+        Estimate the expectation of a path statistic with a variance-reduction technique.
+
+        Parameters:
+            statistic (callable): Maps paths of shape (n, time_horizon + 1) to n values.
+                Defaults to the final value of every path.
+            method (str): "plain" uses the same paths as run_simulation; "antithetic"
+                pairs every shock path with its negation; "control_variate" regresses on
+                the final value, whose expectation initial_value * exp(drift + volatility**2 / 2)
+                is known, and so needs a statistic other than the final value;
+                "moment_matching" rescales the shocks of every time step to sample
+                mean 0 and std 1; "sobol" uses scrambled Sobol points with a
+                Brownian-bridge construction. Methods other than "plain" require
+                a GeometricBrownianMotion process.
+            confidence (float): Confidence level of the interval.
+            num_replicates (int): Independent replicates for "moment_matching" and
+                "sobol", whose paths are not independent; the standard error comes
+                from the spread of the replicate means. Every replicate gets
+                num_simulations // num_replicates paths, at least 2; the remainder
+                is not simulated, and num_paths counts only the paths used.
+
         Returns:
-            np.ndarray: Simulated paths (num_simulations x time_horizon).
+            dict: estimate, std_error, ci_low, ci_high, effective_sample_size and
+                num_paths. effective_sample_size is the number of plain Monte Carlo
+                paths that would give the same standard error.
         """
-        # Time increments
-        dt = 1 / self.time_horizon
+        if method == "control_variate" and statistic is None:
+            raise ValueError("The control variate is the final value itself; pass a different statistic.")
+        if statistic is None:
+            statistic = lambda paths: paths[:, -1]
+        num_steps = self.time_horizon
+        if method != "plain" and not isinstance(self.process, GeometricBrownianMotion):
+            raise ValueError(f"Variance reduction method {method!r} requires a GeometricBrownianMotion process.")
 
-        # Simulating percentage changes using geometric Brownian motion
-        random_shocks = np.random.normal(
-            loc=0, scale=np.sqrt(dt), size=(self.num_simulations, self.time_horizon)
-        )
-        price_changes = self.drift * dt + self.volatility * random_shocks
+        if method in ("moment_matching", "sobol"):
+            if num_replicates < 2 or self.num_simulations < 2 * num_replicates:
+                raise ValueError(f"Method {method!r} needs at least 2 replicates of at least 2 paths each; got "
+                                 f"num_simulations={self.num_simulations}, num_replicates={num_replicates}.")
+            size = self.num_simulations // num_replicates
+            replicates = []
+            for seed_sequence in self._root_seed().spawn(num_replicates):
+                if method == "sobol":
+                    shocks = sobol_normals(size, num_steps, seed_sequence)
+                else:
+                    shocks = moment_matched_normals(np.random.default_rng(seed_sequence), size, num_steps)
+                replicates.append(statistic(self._paths_from_shocks(shocks)))
+            return summarize_estimate([np.mean(values) for values in replicates], np.concatenate(replicates), confidence)
 
-        # Simulating paths
-        paths = np.exp(np.cumsum(price_changes, axis=1))
-        paths = self.initial_value * paths
+        if method not in VARIANCE_REDUCTION_METHODS:
+            raise ValueError(f"Unknown variance reduction method {method!r}; expected one of {VARIANCE_REDUCTION_METHODS}.")
 
-        # Insert initial value at the start of each path
-        return np.insert(paths, 0, self.initial_value, axis=1)
+        values, samples, controls = [], [], []
+        for start, stop, seed_sequence in self._chunk_seeds():
+            rng = np.random.default_rng(seed_sequence)
+            if method == "antithetic":
+                paths = self._paths_from_shocks(antithetic_normals(rng, stop - start, num_steps))
+                chunk_values = statistic(paths)
+                half = len(chunk_values) // 2
+                samples.append((chunk_values[:half] + chunk_values[half:]) / 2)
+            else:
+                paths = self.process.simulate(np.empty((stop - start, num_steps + 1)), rng, self.initial_value)
+                chunk_values = statistic(paths)
+                controls.append(paths[:, -1])
+            values.append(chunk_values)
+        values = np.concatenate(values)
+
+        if method == "antithetic":
+            return summarize_estimate(np.concatenate(samples), values, confidence)
+        if method == "control_variate":
+            controls = np.concatenate(controls)
+            if np.array_equal(values, controls):
+                raise ValueError("The control variate is the final value itself; pass a different statistic.")
+            expected = self.initial_value * np.exp(self.process.drift + self.process.volatility**2 / 2)
+            covariance = np.cov(values, controls)
+            beta = covariance[0, 1] / covariance[1, 1] if covariance[1, 1] > 0 else 0.0
+            return summarize_estimate(values - beta * (controls - expected), values, confidence)
+        return summarize_estimate(values, values, confidence)
+
+    def _paths_from_shocks(self, shocks):
+        """
+        Build GBM paths from a (num_paths, time_horizon) matrix of standard normal shocks.
+
+        Parameters:
+            shocks (np.ndarray): Standard normal shocks.
+
+        Returns:
+            np.ndarray: Paths of shape (num_paths, time_horizon + 1).
+        """
+        out = np.empty((shocks.shape[0], shocks.shape[1] + 1))
+        out[:, 1:] = shocks
+        return _gbm_from_shocks(out, self.initial_value, self.process.drift, self.process.volatility)
 
     def summarize_simulation(self, paths):
         """
@@ -7,15 +7,30 @@ including simulation, backtesting, strategies, and portfolio management.
 
 from .Monte_carlo import MonteCarloSimulation
 from .backtester import Backtester
+from .batch_backtester import BatchBacktester
+from .bootstrap import ReturnBootstrap
+from .costs import ExecutionModel
+from .event_engine import EventDrivenBacktester
+from .multi_asset import MultiAssetMonteCarlo
 from .strategy import Strategy
-from .portfolio import Portfolio
+from .portfolio import ArrayPortfolio, Portfolio
+from .sweep import ParameterSweep
+from .walk_forward import WalkForward
 
 
 __all__ = [
     "MonteCarloSimulation",
+    "MultiAssetMonteCarlo",
     "Backtester",
+    "BatchBacktester",
+    "EventDrivenBacktester",
+    "ExecutionModel",
     "Strategy",
     "Portfolio",
+    "ArrayPortfolio",
+    "ParameterSweep",
+    "WalkForward",
+    "ReturnBootstrap",
 ]
 
 __version__ = "0.1.0"
\ No newline at end of file
@@ -1,69 +1,184 @@
+import numpy as np
 import pandas as pd
 
+from Utils.price_panel import PricePanel
+
+from .costs import ExecutionModel
+from .events import BUY_FILLED, SELL_FILLED, NullSink, PrintSink
+from .execution import execute_signals
+from .ledger import Ledger
+from .strategy import encode_signal, signals_from_rows
+
 
 class Backtester:
     """
     A class to backtest trading strategies using historical data.
     """
 
-    def __init__(self, historical_data, strategy, initial_cash=100000):
+    def __init__(self, historical_data, strategy, initial_cash=100000, history=None, sink=None, execution_model=None):
         """
         Initialize the Backtester.
 
         Parameters:
-            historical_data (pd.DataFrame): Historical price data (e.g., stock prices).
+            historical_data (pd.DataFrame or PricePanel): Historical price data (e.g.,
+                stock prices). A PricePanel is viewed through its 1-D columns. May be
+                None when the data is only passed to run_stream.
             strategy (object): Strategy object that defines buy/sell rules.
             initial_cash (float): Starting cash for the portfolio.
+            history (Ledger): Ledger to record portfolio values into, e.g. one that
+                spills to disk. Defaults to an in-memory ledger.
+            sink (TradeEventSink): Receiver of trade events. Defaults to printing them
+                in the row-by-row mode and to none in the vectorized modes, which do not
+                walk individual trades unless a sink is given.
+            execution_model (ExecutionModel): Transaction costs and position sizing.
+                Defaults to one share per signal at the close, without costs.
         """
+        if isinstance(historical_data, PricePanel):
+            historical_data = historical_data.to_frame()
         self.historical_data = historical_data
         self.strategy = strategy
         self.initial_cash = initial_cash
+        self.execution_model = execution_model if execution_model is not None else ExecutionModel()
         self.portfolio_value = initial_cash
         self.cash = initial_cash
         self.position = 0  # Number of shares currently held
-        self.history = []  # To store transaction history and portfolio value
-
-    def run(self):
+        # To store transaction history and portfolio value
+        self.history = history if history is not None else Ledger(
+            self._history_fields(historical_data, self._position_dtype())
+        )
+        self.sink = sink if sink is not None else PrintSink()
+        self._vectorized_sink = sink if sink is not None else NullSink()
+
+    def run(self, vectorized=False):
         """
         Run the backtest over the historical data.
+
+        Parameters:
+            vectorized (bool): If True, ask the strategy for the whole signal array
+                and compute cash, position and portfolio value paths with NumPy
+                instead of walking the rows.
         """
+        if vectorized:
+            self._run_vectorized(self.historical_data)
+            return
+
         for date, row in self.historical_data.iterrows():
-            signal = self.strategy.generate_signal(row)
+            signal = encode_signal(self.strategy.generate_signal(row))
+            quantity, cash_change = self.execution_model.fill(signal, row["close"], self.cash, self.position)
 
-            if signal == "buy" and self.cash >= row["close"]:
-                self.buy(row["close"], date)
-            elif signal == "sell" and self.position > 0:
-                self.sell(row["close"], date)
+            if quantity > 0:
+                self.buy(row["close"], date, quantity, -cash_change)
+            elif quantity < 0:
+                self.sell(row["close"], date, -quantity, cash_change)
 
             # Calculate the portfolio value at the end of the day
             self.portfolio_value = self.cash + self.position * row["close"]
             self.history.append(
-                {"date": date, "cash": self.cash, "position": self.position, "portfolio_value": self.portfolio_value}
+                date=date, cash=self.cash, position=self.position, portfolio_value=self.portfolio_value
             )
 
-    def buy(self, price, date):
+    def run_stream(self, blocks, prepare=None, warmup=0):
+        """
+        Run the backtest incrementally over a stream of data blocks.
+
+        Each block is run in vectorized mode. Cash and position carry over between
+        blocks, and the last ``warmup`` rows of the previous block are prepended
+        before ``prepare`` is applied so rolling indicators see across block
+        boundaries. Only one block (plus the warmup rows) is in memory at a time.
+
+        Parameters:
+            blocks (iterable of pd.DataFrame): Date-indexed blocks with a "close"
+                column, e.g. from DataLoader.iter_csv.
+            prepare (callable): Optional function adding indicator columns to a block,
+                e.g. ``lambda block: DataLoader.add_moving_averages(block, 20, 50)``.
+            warmup (int): Rows carried into the next block, at least the longest
+                lookback window minus one.
+        """
+        carry = None
+        for block in blocks:
+            frame = block if carry is None else pd.concat([carry, block])
+            if prepare is not None:
+                frame = prepare(frame)
+            self._run_vectorized(frame.iloc[len(frame) - len(block):])
+            if warmup:
+                carry = frame[block.columns].iloc[-warmup:]
+
+    def _run_vectorized(self, data):
+        """
+        Run the backtest over a block of data using array operations.
+
+        Parameters:
+            data (pd.DataFrame): Historical price data with a "close" column.
+        """
+        generate_signals = getattr(self.strategy, "generate_signals", None)
+        if generate_signals is not None:
+            signals = generate_signals(data)
+        else:
+            signals = signals_from_rows(self.strategy, data)
+
+        close = data["close"].to_numpy(dtype=float)
+        cash, position, portfolio_value = execute_signals(signals, close, self.cash, self.position,
+                                                          execution_model=self.execution_model)
+        if self._vectorized_sink.enabled:
+            trades = np.diff(position, prepend=self.position)
+            for i in np.flatnonzero(trades):
+                event = BUY_FILLED if trades[i] > 0 else SELL_FILLED
+                self._vectorized_sink.emit(event, data.index[i], None, close[i], abs(trades[i]).item())
+        if len(data):
+            self.cash = cash[-1]
+            self.position = position[-1].item()
+            self.portfolio_value = portfolio_value[-1]
+
+        self.history.extend(date=data.index.to_numpy(), cash=cash, position=position, portfolio_value=portfolio_value)
+
+    def _position_dtype(self):
+        """
+        dtype of the position history: float when the execution model allows fractional shares.
+        """
+        return np.float64 if self.execution_model.fractional_positions else np.int64
+
+    @staticmethod
+    def _history_fields(historical_data, position_dtype=np.int64):
+        """
+        Ledger fields for the portfolio history, with the date dtype taken from the data index.
+        """
+        if historical_data is None:
+            return {"date": None, "cash": np.float64, "position": position_dtype, "portfolio_value": np.float64}
+        try:
+            date_dtype = np.dtype(historical_data.index.dtype)
+        except TypeError:
+            date_dtype = object
+        return {"date": date_dtype, "cash": np.float64, "position": position_dtype, "portfolio_value": np.float64}
+
+    def buy(self, price, date, quantity=1, cost=None):
         """
         Execute a buy order.
 
         Parameters:
             price (float): Price at which to buy.
             date (str): Date of the transaction.
+            quantity (float): Number of shares bought.
+            cost (float): Cash paid, fees included. Defaults to price * quantity.
         """
-        self.position += 1
-        self.cash -= price
-        print(f"{date}: Bought 1 share at {price:.2f}")
+        self.position += quantity
+        self.cash -= price * quantity if cost is None else cost
+        if self.sink.enabled:
+            self.sink.emit(BUY_FILLED, date, None, price, quantity)
 
-    def sell(self, price, date):
+    def sell(self, price, date, quantity=1, proceeds=None):
         """
         Execute a sell order.
 
         Parameters:
             price (float): Price at which to sell.
             date (str): Date of the transaction.
+            quantity (float): Number of shares sold.
+            proceeds (float): Cash received, net of fees. Defaults to price * quantity.
         """
-        self.position -= 1
-        self.cash += price
-        print(f"{date}: Sold 1 share at {price:.2f}")
+        self.position -= quantity
+        self.cash += price * quantity if proceeds is None else proceeds
+        if self.sink.enabled:
+            self.sink.emit(SELL_FILLED, date, None, price, quantity)
 
     def results(self):
         """
@@ -72,7 +187,7 @@ class Backtester:
         Returns:
             pd.DataFrame: A DataFrame containing the historical portfolio values.
         """
-        return pd.DataFrame(self.history)
+        return self.history.to_frame()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+
+from Utils.metrics import Metrics
+
+from .costs import ExecutionModel
+from .execution import execute_signals
+from .strategy import panel_signals
+
+
+class BatchBacktester:
+    """
+    A class to backtest a strategy over every path of a simulated price panel at once.
+
+    The (paths, time) matrix from MonteCarloSimulation.run_simulation is treated as
+    a panel: signals, cash and positions are evolved for all paths together with
+    the same rules as Backtester.
+    """
+
+    def __init__(self, price_paths, strategy, initial_cash=100000, batch_size=10000, execution_model=None):
+        """
+        Initialize the BatchBacktester.
+
+        Parameters:
+            price_paths (np.ndarray): Close prices of shape (num_paths, time).
+            strategy (object): Strategy object; vectorized strategies implement
+                generate_panel_signals.
+            initial_cash (float): Starting cash on every path.
+            batch_size (int): Number of paths processed per batch.
+            execution_model (ExecutionModel): Transaction costs and position sizing.
+                Defaults to one share per signal without costs.
+        """
+        self.price_paths = np.asarray(price_paths)
+        self.strategy = strategy
+        self.initial_cash = initial_cash
+        self.batch_size = batch_size
+        self.execution_model = execution_model if execution_model is not None else ExecutionModel()
+        self.portfolio_values = None
+        self.cash = None
+        self.positions = None
+
+    def run(self):
+        """
+        Run the backtest over every path.
+
+        Returns:
+            np.ndarray: Portfolio values of shape (num_paths, time).
+        """
+        num_paths = self.price_paths.shape[0]
+        self.portfolio_values = np.empty(self.price_paths.shape)
+        self.cash = np.empty(num_paths)
+        self.positions = np.empty(num_paths, dtype=np.float64 if self.execution_model.fractional_positions else np.int64)
+
+        for start in range(0, num_paths, self.batch_size):
+            batch = slice(start, start + self.batch_size)
+            prices = self.price_paths[batch]
+            cash, position, self.portfolio_values[batch] = execute_signals(
+                panel_signals(self.strategy, prices), prices, self.initial_cash, execution_model=self.execution_model
+            )
+            self.cash[batch] = cash[:, -1]
+            self.positions[batch] = position[:, -1]
+        return self.portfolio_values
+
+    def pnl_distribution(self):
+        """
+        Profit and loss of every path.
+
+        Returns:
+            np.ndarray: Final portfolio value minus initial cash, one per path.
+        """
+        return self.portfolio_values[:, -1] - self.initial_cash
+
+    def summarize_pnl(self):
+        """
+        Summarize the P&L distribution, with the same keys as MonteCarloSimulation.summarize_simulation.
+
+        Returns:
+            dict: Statistics such as mean, median, and standard deviation.
+        """
+        pnl = self.pnl_distribution()
+        return {
+            "mean": np.mean(pnl),
+            "median": np.median(pnl),
+            "std_dev": np.std(pnl),
+            "min": np.min(pnl),
+            "max": np.max(pnl),
+        }
+
+    def metrics(self, **metric_options):
+        """
+        Batch metrics of every path's equity curve.
+
+        Parameters:
+            **metric_options: Passed to Metrics.calculate_batch_metrics.
+
+        Returns:
+            pd.DataFrame: One row per path, one column per metric.
+        """
+        return pd.DataFrame(Metrics.calculate_batch_metrics(self.portfolio_values, **metric_options))
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+
+from Utils.metrics import Metrics
+
+BOOTSTRAP_METHODS = ("iid", "stationary", "circular")
+
+
+class ReturnBootstrap:
+    """
+    A class to resample daily returns into synthetic equity curves.
+
+    Resamples are built from index arrays, so every method generates all curves
+    with NumPy operations and no per-sample Python loop.
+    """
+
+    def __init__(self, returns, initial_value=1.0, seed=None):
+        """
+        Initialize the ReturnBootstrap.
+
+        Parameters:
+            returns (np.ndarray): Daily returns to resample; NaNs are dropped.
+            initial_value (float): Starting value of every synthetic equity curve.
+            seed (int or np.random.SeedSequence): Seed for reproducible resamples.
+        """
+        returns = np.asarray(returns, dtype=float)
+        self.returns = returns[~np.isnan(returns)]
+        self.initial_value = initial_value
+        self.rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_backtest(cls, results, seed=None):
+        """
+        Build a bootstrap from the daily returns of a backtest.
+
+        Parameters:
+            results (pd.DataFrame): Output of Backtester.results().
+            seed (int or np.random.SeedSequence): Seed for reproducible resamples.
+
+        Returns:
+            ReturnBootstrap: Resampler starting from the backtest's first portfolio value.
+        """
+        values = results["portfolio_value"].to_numpy(dtype=float)
+        return cls(np.diff(values) / values[:-1], initial_value=values[0], seed=seed)
+
+    def sample_indices(self, num_samples, length=None, method="iid", block_size=20):
+        """
+        Draw index arrays into the returns.
+
+        Parameters:
+            num_samples (int): Number of synthetic series.
+            length (int): Returns per series. Defaults to the number of returns.
+            method (str): "iid" draws each day independently; "circular" draws blocks
+                of ``block_size`` consecutive days, wrapping around the end; "stationary"
+                draws blocks of geometric length with mean ``block_size`` (Politis-Romano).
+            block_size (int): Block length, or mean block length for "stationary".
+
+        Returns:
+            np.ndarray: Indices of shape (num_samples, length).
+        """
+        num_returns = len(self.returns)
+        length = num_returns if length is None else length
+        offsets = np.arange(length)
+
+        if method == "iid":
+            return self.rng.integers(0, num_returns, size=(num_samples, length))
+        if method == "circular":
+            starts = self.rng.integers(0, num_returns, size=(num_samples, -(-length // block_size)))
+            return (starts[:, offsets // block_size] + offsets % block_size) % num_returns
+        if method == "stationary":
+            new_block = self.rng.random((num_samples, length)) < 1 / block_size
+            new_block[:, 0] = True
+            starts = self.rng.integers(0, num_returns, size=(num_samples, length))
+            block_start = np.maximum.accumulate(np.where(new_block, offsets, 0), axis=1)
+            return (np.take_along_axis(starts, block_start, axis=1) + offsets - block_start) % num_returns
+        raise ValueError(f"Unknown bootstrap method {method!r}; expected one of {BOOTSTRAP_METHODS}.")
+
+    def resample_returns(self, num_samples, length=None, method="iid", block_size=20):
+        """
+        Resample the returns.
+
+        Parameters are as in sample_indices.
+
+        Returns:
+            np.ndarray: Resampled returns of shape (num_samples, length).
+        """
+        return self.returns[self.sample_indices(num_samples, length, method, block_size)]
+
+    def equity_curves(self, num_samples, length=None, method="iid", block_size=20):
+        """
+        Generate synthetic equity curves by compounding resampled returns.
+
+        Parameters are as in sample_indices.
+
+        Returns:
+            np.ndarray: Curves of shape (num_samples, length + 1), starting at initial_value.
+        """
+        returns = self.resample_returns(num_samples, length, method, block_size)
+        curves = np.empty((returns.shape[0], returns.shape[1] + 1))
+        curves[:, 0] = self.initial_value
+        np.cumprod(1 + returns, axis=1, out=curves[:, 1:])
+        curves[:, 1:] *= self.initial_value
+        return curves
+
+    def metric_distributions(self, num_samples, length=None, method="iid", block_size=20, **metric_options):
+        """
+        Distribution of every batch metric over synthetic equity curves.
+
+        Parameters:
+            num_samples (int): Number of synthetic equity curves.
+            length (int): Returns per curve. Defaults to the number of returns.
+            method (str): "iid", "stationary" or "circular".
+            block_size (int): Block length, or mean block length for "stationary".
+            **metric_options: Passed to Metrics.calculate_batch_metrics.
+
+        Returns:
+            pd.DataFrame: One row per synthetic curve, one column per metric.
+        """
+        curves = self.equity_curves(num_samples, length, method, block_size)
+        return pd.DataFrame(Metrics.calculate_batch_metrics(curves, **metric_options))
@@ -1,15 +1,288 @@
 """ Implements functions to analyze cash flows, such as calculating net present value (NPV), internal rate of return (IRR), and modified duration.
+
+Every function works on arrays: cash flows are rows of a padded matrix whose
+column t holds the payment at period t (column 0 is today), so many instruments
+are priced in one NumPy pass.
 """
+import numpy as np
+
+
+def discount_factors(rate, num_periods):
+    """
+    Discount factors (1 + rate)^-t for t = 0..num_periods - 1.
+
+    Args:
+        rate: Periodic rate, scalar or array of shape (n,).
+        num_periods: Number of columns of the cash-flow matrix.
+
+    Returns:
+        Array of shape (num_periods,) or (n, num_periods).
+    """
+    rate = np.asarray(rate, dtype=float)
+    return (1 + rate[..., None]) ** -np.arange(num_periods)
+
+
+def npv(rate, cash_flows):
+    """
+    Calculates the net present value of cash-flow rows.
+
+    Args:
+        rate: Periodic discount rate, scalar or one per row.
+        cash_flows: Array of shape (T,) or (n, T); column t is paid at period t.
+
+    Returns:
+        Net present value, scalar or array of shape (n,).
+    """
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    return np.sum(cash_flows * discount_factors(rate, cash_flows.shape[-1]), axis=-1)
+
+
+def duration_convexity(rate, cash_flows):
+    """
+    Calculates the Macaulay duration, modified duration and convexity of cash-flow rows.
+
+    Measures are in periods; divide durations by the payment frequency (convexity
+    by its square) for years.
+
+    Args:
+        rate: Periodic discount rate, scalar or one per row.
+        cash_flows: Array of shape (T,) or (n, T); column t is paid at period t.
+
+    Returns:
+        Dict with present_value, macaulay_duration, modified_duration and convexity.
+    """
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    rate = np.asarray(rate, dtype=float)
+    periods = np.arange(cash_flows.shape[-1])
+    present_values = cash_flows * discount_factors(rate, len(periods))
+    present_value = present_values.sum(axis=-1)
+    macaulay = (present_values @ periods) / present_value
+    return {
+        "present_value": present_value,
+        "macaulay_duration": macaulay,
+        "modified_duration": macaulay / (1 + rate),
+        "convexity": (present_values @ (periods * (periods + 1))) / (present_value * (1 + rate) ** 2),
+    }
+
+
+def _npv_and_derivative(rate, periods):
+    """
+    NPV and its derivative with respect to the rate, by Horner's rule over the periods.
+
+    Args:
+        rate: Periodic rate of every row, array of shape (n,).
+        periods: Transposed cash flows, array of shape (T, n); row t is paid at period t.
+
+    Returns:
+        Tuple of arrays (npv, d npv / d rate), each of shape (n,).
+    """
+    discount = 1 / (1 + rate)
+    value = np.zeros_like(discount)
+    slope = np.zeros_like(discount)
+    for payments in periods[::-1]:
+        slope *= discount
+        slope += value
+        value *= discount
+        value += payments
+    return value, -discount**2 * slope
+
+
+def solve_irr(cash_flows, guess=0.1, low=-0.99, high=1.0, tolerance=1e-10, max_iterations=100):
+    """
+    Solves for the internal rate of return of many cash-flow rows at once.
+
+    Every row runs Newton-Raphson with the analytic derivative of its NPV inside a
+    bracket [low, high] that shrinks around the sign change; a Newton step that
+    leaves the bracket, or does not halve the step size, is replaced by bisection,
+    so every bracketed row converges.
+    Only rows that have not converged yet are evaluated in each iteration.
+
+    Args:
+        cash_flows: Array of shape (T,) or (n, T); column t is paid at period t.
+        guess: Starting periodic rate, scalar or one per row.
+        low: Lower end of the periodic rate bracket.
+        high: Upper end of the periodic rate bracket.
+        tolerance: Change in the rate at which a root is accepted.
+        max_iterations: Maximum number of Newton or bisection steps.
+
+    Returns:
+        Dict with rate (periodic IRR, NaN where the row did not converge), converged
+        (bool), bracketed (whether the NPV changes sign over [low, high]) and
+        iterations, one entry per row.
+    """
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    shape = cash_flows.shape[:-1]
+    periods = np.ascontiguousarray(cash_flows.reshape(-1, cash_flows.shape[-1]).T)
+    num_rows = periods.shape[1]
+
+    low = np.full(num_rows, low, dtype=float)
+    high = np.full(num_rows, high, dtype=float)
+    npv_low, _ = _npv_and_derivative(low, periods)
+    npv_high, _ = _npv_and_derivative(high, periods)
+    bracketed = (np.sign(npv_low) != np.sign(npv_high)) | (npv_low == 0) | (npv_high == 0)
+
+    guess = np.broadcast_to(np.asarray(guess, dtype=float).reshape(-1), (num_rows,))
+    rate = np.where((low < guess) & (guess < high), guess, (low + high) / 2)
+    last_step = high - low
+    converged = np.zeros(num_rows, dtype=bool)
+    iterations = np.zeros(num_rows, dtype=np.int64)
+    active = np.flatnonzero(bracketed)
 
+    for _ in range(max_iterations):
+        if len(active) == 0:
+            break
+        x, lo, hi = rate[active], low[active], high[active]
+        value, slope = _npv_and_derivative(x, periods if len(active) == num_rows else periods[:, active])
 
-def __init__(self):
-    pass
+        # Shrink the bracket to the side that still contains the sign change
+        below = np.sign(value) == np.sign(npv_low[active])
+        lo = np.where(below, x, lo)
+        hi = np.where(below, hi, x)
+        npv_low[active] = np.where(below, value, npv_low[active])
 
-def duration_convexity(self):
-    """Contains functions to calculate duration and convexity measures, including Macaulay duration, modified duration, and convexity.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = x - value / slope
+        bisect = ~np.isfinite(step) | (step <= lo) | (step >= hi) | (np.abs(step - x) > last_step[active] / 2)
+        step = np.where(bisect, (lo + hi) / 2, step)
+        last_step[active] = np.abs(step - x)
+
+        done = (np.abs(step - x) <= tolerance * (1 + np.abs(x))) | (value == 0)
+        rate[active] = np.where(value == 0, x, step)
+        low[active], high[active] = lo, hi
+        iterations[active] += 1
+        converged[active[done]] = True
+        active = active[~done]
+
+    return {
+        "rate": np.where(converged, rate, np.nan).reshape(shape)[()],
+        "converged": converged.reshape(shape)[()],
+        "bracketed": bracketed.reshape(shape)[()],
+        "iterations": iterations.reshape(shape)[()],
+    }
+
+
+def irr(cash_flows, low=-0.99, high=1.0, tolerance=1e-10, max_iterations=100):
+    """
+    Calculates the internal rate of return of cash-flow rows.
+
+    Args:
+        cash_flows: Array of shape (T,) or (n, T); column t is paid at period t.
+        low: Lower end of the periodic rate bracket.
+        high: Upper end of the periodic rate bracket.
+        tolerance: Change in the rate at which a root is accepted.
+        max_iterations: Maximum number of solver steps.
+
+    Returns:
+        Periodic IRR, scalar or array of shape (n,); NaN where the NPV does not
+        change sign over the bracket. See solve_irr for the convergence status.
+    """
+    return solve_irr(cash_flows, low=low, high=high, tolerance=tolerance, max_iterations=max_iterations)["rate"]
+
+
+def bond_cash_flows(face_value, coupon_rate, periods_to_maturity, frequency=2):
     """
-    
-    pass
+    Builds the padded cash-flow matrix of an array of fixed-coupon bonds.
+
+    Args:
+        face_value: Face value of every bond.
+        coupon_rate: Annual coupon rate of every bond.
+        periods_to_maturity: Number of coupon periods to maturity of every bond.
+        frequency: Number of coupon payments per year of every bond.
+
+    Returns:
+        Array of shape (n, max_periods + 1); column 0 is today and holds no payment,
+        and columns after a bond's maturity are zero.
+    """
+    face_value, coupon_rate, periods_to_maturity, frequency = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(value, dtype=float)) for value in
+          (face_value, coupon_rate, periods_to_maturity, frequency))
+    )
+    periods_to_maturity = periods_to_maturity.astype(np.intp)
+    periods = np.arange(periods_to_maturity.max() + 1)
+    live = (periods > 0) & (periods <= periods_to_maturity[:, None])
+    cash_flows = np.where(live, (coupon_rate * face_value / frequency)[:, None], 0.0)
+    cash_flows[np.arange(len(face_value)), periods_to_maturity] += face_value
+    return cash_flows
+
+
+def price_bonds(face_value, coupon_rate, yield_to_maturity, periods_to_maturity, frequency=2):
+    """
+    Calculates the prices of an array of bonds in one pass.
+
+    Args:
+        face_value: Face value of every bond.
+        coupon_rate: Annual coupon rate of every bond.
+        yield_to_maturity: Annual yield to maturity of every bond.
+        periods_to_maturity: Number of periods to maturity of every bond.
+        frequency: Number of coupon payments per year of every bond.
+
+    Returns:
+        Array of bond prices.
+    """
+    cash_flows = bond_cash_flows(face_value, coupon_rate, periods_to_maturity, frequency)
+    periodic_yield = np.broadcast_to(np.asarray(yield_to_maturity, dtype=float) / frequency, cash_flows.shape[:1])
+    return npv(periodic_yield, cash_flows)
+
+
+def solve_yield_to_maturity(price, face_value, coupon_rate, periods_to_maturity, frequency=2, **solver_options):
+    """
+    Solves for the annual yield to maturity of an array of bonds at once.
+
+    Args:
+        price: Market price of every bond.
+        face_value: Face value of every bond.
+        coupon_rate: Annual coupon rate of every bond.
+        periods_to_maturity: Number of periods to maturity of every bond.
+        frequency: Number of coupon payments per year of every bond.
+        **solver_options: Passed to solve_irr.
+
+    Returns:
+        Dict with yield_to_maturity (annual), converged, bracketed and iterations arrays.
+    """
+    cash_flows = bond_cash_flows(face_value, coupon_rate, periods_to_maturity, frequency)
+    cash_flows[:, 0] -= price
+    face_value, coupon_rate, periods_to_maturity, frequency, price = np.broadcast_arrays(
+        face_value, coupon_rate, periods_to_maturity, frequency, price
+    )
+    # Start from the textbook approximation: coupon plus amortized discount over the average price
+    solver_options.setdefault("guess", (
+        (coupon_rate * face_value / frequency + (face_value - price) / periods_to_maturity)
+        / ((face_value + price) / 2)
+    ).reshape(-1))
+    result = solve_irr(cash_flows, **solver_options)
+    return {
+        "yield_to_maturity": result["rate"] * np.broadcast_to(np.asarray(frequency, dtype=float), cash_flows.shape[:1]),
+        "converged": result["converged"],
+        "bracketed": result["bracketed"],
+        "iterations": result["iterations"],
+    }
+
+
+def bond_duration_convexity(face_value, coupon_rate, yield_to_maturity, periods_to_maturity, frequency=2):
+    """
+    Calculates price, Macaulay and modified duration and convexity of an array of bonds.
+
+    Args:
+        face_value: Face value of every bond.
+        coupon_rate: Annual coupon rate of every bond.
+        yield_to_maturity: Annual yield to maturity of every bond.
+        periods_to_maturity: Number of periods to maturity of every bond.
+        frequency: Number of coupon payments per year of every bond.
+
+    Returns:
+        Dict of arrays: price, macaulay_duration and modified_duration in years,
+        and convexity in years squared.
+    """
+    cash_flows = bond_cash_flows(face_value, coupon_rate, periods_to_maturity, frequency)
+    frequency = np.broadcast_to(np.asarray(frequency, dtype=float), cash_flows.shape[:1])
+    measures = duration_convexity(np.asarray(yield_to_maturity, dtype=float) / frequency, cash_flows)
+    return {
+        "price": measures["present_value"],
+        "macaulay_duration": measures["macaulay_duration"] / frequency,
+        "modified_duration": measures["modified_duration"] / frequency,
+        "convexity": measures["convexity"] / frequency**2,
+    }
+
 
 class Loan():
     def __init__(self, notional, redemption, interest_rate):
@@ -34,22 +307,23 @@ class Loan():
 
     def Yield_to_Maturity(self)-> float:
         """
-        Returns the yield to maturity of the loan.
+        Returns the yield to maturity of the loan: the rate that discounts the
+        redemption back to the notional.
         """
-        return self.interest_rate
+        return float(irr([-self.notional, self.redemption]))
 
     def Duration(self)-> float:
         """
-        Returns the duration of the loan.
+        Returns the modified duration of the loan's redemption payment.
         """
-        return 1 / (1 + self.interest_rate)
+        return float(duration_convexity(self.interest_rate, [0.0, self.redemption])["modified_duration"])
 
     def Convexity(self)-> float:
         """
-        Returns the convexity of the loan.
+        Returns the convexity of the loan's redemption payment.
         """
-        return 1 / (1 + self.interest_rate) ** 2
-    
+        return float(duration_convexity(self.interest_rate, [0.0, self.redemption])["convexity"])
+
 def price_bond(face_value, coupon_rate, yield_to_maturity, periods_to_maturity, frequency=2):
     """
     Calculates the price of a bond.
@@ -64,10 +338,4 @@ def price_bond(face_value, coupon_rate, yield_to_maturity, periods_to_maturity,
     Returns:
         Bond price.
     """
-
-    periodic_coupon_rate = coupon_rate / frequency
-    periodic_yield_to_maturity = yield_to_maturity / frequency
-    discount_factors = [(1 + periodic_yield_to_maturity)**(-i) for i in range(1, periods_to_maturity + 1)]
-
-    return sum(periodic_coupon_rate * face_value * discount_factor for discount_factor in discount_factors) + face_value * discount_factors[-1]
-    
\ No newline at end of file
+    return float(price_bonds(face_value, coupon_rate, yield_to_maturity, periods_to_maturity, frequency)[0])
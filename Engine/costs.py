@@ -0,0 +1,192 @@
+import numpy as np
+
+from .strategy import BUY, SELL
+
+# Position sizing codes, plain integers so the compiled execution kernel can branch on them
+FIXED = 0
+FRACTION = 1
+TARGET_WEIGHT = 2
+SIZING_METHODS = {"fixed": FIXED, "fraction": FRACTION, "target_weight": TARGET_WEIGHT}
+
+
+def fill_order(signal, price, cash, position, buy_factor, sell_factor, fixed_fee, sizing, size, fractional):
+    """
+    Size and cost one order; the scalar rule shared by every execution engine.
+
+    Written for plain Python and Numba alike. A sized buy is rejected when cash
+    does not cover its cost; fraction and target-weight buys are cut down to what
+    cash covers instead.
+
+    Parameters:
+        signal (int): BUY, SELL or HOLD.
+        price (float): Close price.
+        cash (float): Cash before the order.
+        position (float): Shares held before the order.
+        buy_factor (float): Cost per share of a buy relative to the close, fees included.
+        sell_factor (float): Proceeds per share of a sell relative to the close, fees deducted.
+        fixed_fee (float): Fee charged per fill.
+        sizing (int): FIXED, FRACTION or TARGET_WEIGHT.
+        size (float): Shares per order, fraction of cash (sells: of the position),
+            or target weight of the portfolio value.
+        fractional (bool): Whether quantities may be fractional.
+
+    Returns:
+        tuple: (signed quantity, cash change); (0, 0) if nothing is filled.
+    """
+    if signal == BUY:
+        buy_price = price * buy_factor
+        if sizing == FIXED:
+            quantity = size
+            if not cash >= quantity * buy_price + fixed_fee:
+                return 0.0, 0.0
+        else:
+            if sizing == FRACTION:
+                quantity = (cash * size - fixed_fee) / buy_price
+            else:
+                quantity = size * (cash + position * price) / price - position
+            affordable = (cash - fixed_fee) / buy_price
+            if affordable < quantity:
+                quantity = affordable
+            if not fractional:
+                quantity = np.floor(quantity)
+            if not quantity > 0:
+                return 0.0, 0.0
+        return quantity, -(quantity * buy_price + fixed_fee)
+
+    if signal == SELL and position > 0:
+        if sizing == FIXED:
+            quantity = min(size, position)
+        elif sizing == FRACTION:
+            quantity = position * size
+            if not fractional:
+                quantity = np.floor(quantity)
+        else:
+            quantity = position * 1.0
+        if not quantity > 0:
+            return 0.0, 0.0
+        return -quantity, quantity * price * sell_factor - fixed_fee
+    return 0.0, 0.0
+
+
+def fill_orders(signals, price, cash, position, buy_factor, sell_factor, fixed_fee, sizing, size, fractional):
+    """
+    Array version of fill_order for many rows at one bar; results are identical element by element.
+
+    Parameters:
+        signals (np.ndarray): Signal codes, shape (n,).
+        price (np.ndarray): Close prices, shape (n,).
+        cash (np.ndarray): Cash before the orders, shape (n,).
+        position (np.ndarray): Shares held before the orders, shape (n,).
+        Remaining parameters are as in fill_order.
+
+    Returns:
+        tuple: (signed quantities, cash changes), each of shape (n,).
+    """
+    buy_price = price * buy_factor
+    if sizing == FIXED:
+        buy_quantity = np.where(cash >= size * buy_price + fixed_fee, size, 0.0)
+    else:
+        if sizing == FRACTION:
+            buy_quantity = (cash * size - fixed_fee) / buy_price
+        else:
+            buy_quantity = size * (cash + position * price) / price - position
+        buy_quantity = np.minimum(buy_quantity, (cash - fixed_fee) / buy_price)
+        if not fractional:
+            buy_quantity = np.floor(buy_quantity)
+    buy_quantity = np.where((signals == BUY) & (buy_quantity > 0), buy_quantity, 0.0)
+
+    if sizing == FIXED:
+        sell_quantity = np.minimum(size, position)
+    elif sizing == FRACTION:
+        sell_quantity = position * size
+        if not fractional:
+            sell_quantity = np.floor(sell_quantity)
+    else:
+        sell_quantity = position * 1.0
+    sell_quantity = np.where((signals == SELL) & (position > 0) & (sell_quantity > 0), sell_quantity, 0.0)
+
+    cash_change = np.where(
+        buy_quantity > 0,
+        -(buy_quantity * buy_price + fixed_fee),
+        np.where(sell_quantity > 0, sell_quantity * price * sell_factor - fixed_fee, 0.0),
+    )
+    return buy_quantity - sell_quantity, cash_change
+
+
+class ExecutionModel:
+    """
+    Transaction costs and position sizing applied when signals are executed.
+
+    Buys fill at close * (1 + spread / 2 + slippage) and sells at
+    close * (1 - spread / 2 - slippage); the proportional fee is charged on the
+    fill's notional and the fixed fee once per fill. The default model trades one
+    share at the close with no costs, as the Backtester always has.
+    """
+
+    def __init__(self, fixed_fee=0.0, proportional_fee=0.0, spread=0.0, slippage=0.0, sizing="fixed", size=1,
+                 fractional=False):
+        """
+        Initialize the ExecutionModel.
+
+        Parameters:
+            fixed_fee (float): Fee charged per fill, in cash.
+            proportional_fee (float): Fee as a fraction of the fill's notional.
+            spread (float): Full bid-ask spread as a fraction of the close; each
+                fill pays half of it.
+            slippage (float): Additional adverse price move per fill, as a fraction of the close.
+            sizing (str): "fixed" trades ``size`` shares per signal; "fraction" buys
+                with ``size`` of the cash and sells ``size`` of the position;
+                "target_weight" buys up to ``size`` of the portfolio value and sells
+                the whole position.
+            size (float): Parameter of the sizing method.
+            fractional (bool): Allow fractional share quantities.
+        """
+        if sizing not in SIZING_METHODS:
+            raise ValueError(f"Unknown sizing method {sizing!r}; expected one of {tuple(SIZING_METHODS)}.")
+        self.fixed_fee = fixed_fee
+        self.proportional_fee = proportional_fee
+        self.spread = spread
+        self.slippage = slippage
+        self.sizing = sizing
+        self.size = size
+        self.fractional = fractional
+
+    @property
+    def fractional_positions(self):
+        """
+        Whether positions can become fractional, in which case they are stored as floats.
+        """
+        return self.fractional or (self.sizing == "fixed" and not float(self.size).is_integer())
+
+    def parameters(self):
+        """
+        The model as the scalar arguments of fill_order and the execution kernels.
+
+        Returns:
+            tuple: (buy_factor, sell_factor, fixed_fee, sizing, size, fractional).
+        """
+        return (
+            (1 + self.spread / 2 + self.slippage) * (1 + self.proportional_fee),
+            (1 - self.spread / 2 - self.slippage) * (1 - self.proportional_fee),
+            float(self.fixed_fee),
+            SIZING_METHODS[self.sizing],
+            float(self.size),
+            bool(self.fractional),
+        )
+
+    def fill(self, signal, price, cash, position):
+        """
+        Size and cost one order.
+
+        Parameters:
+            signal (int): BUY, SELL or HOLD.
+            price (float): Close price.
+            cash (float): Cash before the order.
+            position (float): Shares held before the order.
+
+        Returns:
+            tuple: (signed quantity, cash change); the quantity is an int unless
+                positions can be fractional.
+        """
+        quantity, cash_change = fill_order(signal, price, cash, position, *self.parameters())
+        return (quantity if self.fractional_positions else int(quantity)), cash_change
@@ -0,0 +1,378 @@
+import heapq
+from operator import attrgetter
+
+import numpy as np
+import pandas as pd
+
+from .ledger import Ledger
+from .portfolio import Portfolio
+
+# Order types
+MARKET = "market"
+LIMIT = "limit"
+STOP = "stop"
+ORDER_TYPES = (MARKET, LIMIT, STOP)
+
+# Order states
+OPEN = "open"
+FILLED = "filled"
+REJECTED = "rejected"
+CANCELLED = "cancelled"
+
+
+class Bar:
+    """
+    One price bar of one symbol, the event the engine dispatches.
+
+    Read like a row of historical data, ``bar["close"]``, so row-by-row strategies
+    can consume bars directly.
+    """
+
+    __slots__ = ("date", "symbol", "open", "high", "low", "close", "volume")
+
+    def __init__(self, date, symbol, open, high, low, close, volume=0.0):
+        self.date = date
+        self.symbol = symbol
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    def __getitem__(self, field):
+        return getattr(self, field)
+
+    def __repr__(self):
+        return f"Bar({self.date}, {self.symbol}, close={self.close})"
+
+
+class Order:
+    """
+    A resting or pending order.
+
+    A positive quantity buys and a negative quantity sells. Limit and stop orders
+    carry their trigger price; market orders fill at the open of the symbol's next bar.
+    """
+
+    __slots__ = ("order_id", "symbol", "quantity", "order_type", "price", "status", "fill_price", "fill_date")
+
+    def __init__(self, order_id, symbol, quantity, order_type=MARKET, price=None):
+        self.order_id = order_id
+        self.symbol = symbol
+        self.quantity = quantity
+        self.order_type = order_type
+        self.price = price
+        self.status = OPEN
+        self.fill_price = None
+        self.fill_date = None
+
+    def __repr__(self):
+        return f"Order({self.order_id}, {self.symbol}, {self.quantity}, {self.order_type}, {self.price}, {self.status})"
+
+
+def bar_stream(symbol, data):
+    """
+    Convert a frame of one symbol's bars into a time-sorted stream of Bar events.
+
+    Columns are converted to Python lists once, so no DataFrame access happens per
+    event. Missing open, high and low columns default to the close, missing volume to 0.
+
+    Parameters:
+        symbol (str): Symbol of the bars.
+        data (pd.DataFrame): Date-indexed bars with at least a "close" column.
+
+    Yields:
+        Bar: One event per row, in index order.
+    """
+    close = data["close"].to_numpy(dtype=float)
+    columns = [
+        data[name].to_numpy(dtype=float).tolist() if name in data else close.tolist()
+        for name in ("open", "high", "low", "close")
+    ]
+    volume = data["volume"].to_numpy(dtype=float).tolist() if "volume" in data else [0.0] * len(data)
+    for date, open, high, low, close, volume in zip(data.index.tolist(), *columns, volume):
+        yield Bar(date, symbol, open, high, low, close, volume)
+
+
+class _OrderBook:
+    """
+    Pending orders of one symbol.
+
+    Resting orders sit in heaps keyed by how close they are to triggering, so a bar
+    only inspects the orders it actually triggers. Cancelled orders stay in place
+    until they are popped or, once they make up half of the book, the book is
+    rebuilt without them, so cancelling is amortized O(1) and the heaps stay bounded.
+    """
+
+    __slots__ = ("market", "buy_limits", "sell_limits", "buy_stops", "sell_stops", "cancelled")
+
+    def __init__(self):
+        self.market = []
+        self.buy_limits = []  # Highest limit first
+        self.sell_limits = []  # Lowest limit first
+        self.buy_stops = []  # Lowest stop first
+        self.sell_stops = []  # Highest stop first
+        self.cancelled = 0  # Cancelled orders still in the book
+
+    def add(self, order):
+        if order.order_type == MARKET:
+            self.market.append(order)
+        elif order.order_type == LIMIT:
+            if order.quantity > 0:
+                heapq.heappush(self.buy_limits, (-order.price, order.order_id, order))
+            else:
+                heapq.heappush(self.sell_limits, (order.price, order.order_id, order))
+        elif order.quantity > 0:
+            heapq.heappush(self.buy_stops, (order.price, order.order_id, order))
+        else:
+            heapq.heappush(self.sell_stops, (-order.price, order.order_id, order))
+
+    def cancel(self, order):
+        """
+        Account for an order of this book that was just cancelled.
+        """
+        self.cancelled += 1
+        if 2 * self.cancelled > len(self):
+            self.market = [order for order in self.market if order.status == OPEN]
+            for name in ("buy_limits", "sell_limits", "buy_stops", "sell_stops"):
+                heap = [entry for entry in getattr(self, name) if entry[2].status == OPEN]
+                heapq.heapify(heap)
+                setattr(self, name, heap)
+            self.cancelled = 0
+
+    def _pop(self, heap, fills, price):
+        """
+        Pop the top order of a heap, adding it to the fills unless it was cancelled.
+        """
+        order = heapq.heappop(heap)[2]
+        if order.status == OPEN:
+            fills.append((order, price(order.price)))
+        else:
+            self.cancelled -= 1
+
+    def triggered(self, bar):
+        """
+        Remove and return the orders the bar fills, with their fill prices.
+
+        Market orders fill at the open. A limit order fills at its limit, or at the
+        open if the bar gaps through it; a stop order fills at its stop, or at the
+        open on a gap.
+
+        Returns:
+            list: (order, fill price) pairs in fill order.
+        """
+        fills = [(order, bar.open) for order in self.market if order.status == OPEN]
+        self.cancelled -= len(self.market) - len(fills)
+        self.market = []
+        at_or_below_open = lambda price: min(bar.open, price)
+        at_or_above_open = lambda price: max(bar.open, price)
+        heap = self.buy_limits
+        while heap and -heap[0][0] >= bar.low:
+            self._pop(heap, fills, at_or_below_open)
+        heap = self.sell_limits
+        while heap and heap[0][0] <= bar.high:
+            self._pop(heap, fills, at_or_above_open)
+        heap = self.buy_stops
+        while heap and heap[0][0] <= bar.high:
+            self._pop(heap, fills, at_or_above_open)
+        heap = self.sell_stops
+        while heap and -heap[0][0] >= bar.low:
+            self._pop(heap, fills, at_or_below_open)
+        return fills
+
+    def __len__(self):
+        return len(self.market) + len(self.buy_limits) + len(self.sell_limits) + len(self.buy_stops) + len(
+            self.sell_stops
+        )
+
+
+class EventDrivenBacktester:
+    """
+    An event-driven backtester over the bars of many symbols.
+
+    The time-sorted bar stream of every symbol is merged with a heap-based k-way
+    merge, so streams are consumed lazily and may come from disk. For every bar the
+    symbol's pending orders are matched first, then the strategy sees the bar and
+    may submit orders. Orders become active once the date advances, so they fill on
+    bars after the one the strategy reacted to, never on bars of the same date.
+    Fills are routed to a Portfolio or ArrayPortfolio, whose cash and position
+    checks accept or reject them.
+
+    Strategies implement ``on_bar(bar, engine)`` and call ``engine.submit_order``.
+    Row-by-row strategies with ``generate_signal(row)`` also work: "buy" and "sell"
+    become market orders of ``order_size`` units.
+    """
+
+    def __init__(self, data, strategy, portfolio=None, initial_cash=100000, order_size=1, sink=None):
+        """
+        Initialize the EventDrivenBacktester.
+
+        Parameters:
+            data (dict): Symbol to a date-indexed DataFrame with a "close" column and
+                optional "open", "high", "low" and "volume" columns, or to an
+                iterable of Bar events sorted by date.
+            strategy (object): Object with on_bar(bar, engine) or generate_signal(row).
+            portfolio (Portfolio or ArrayPortfolio): Receiver of the fills. Defaults to
+                a new Portfolio with ``initial_cash``.
+            initial_cash (float): Starting cash of the default portfolio.
+            order_size (float): Units per order of a generate_signal strategy.
+            sink (TradeEventSink): Receiver of trade events of the default portfolio.
+                Defaults to printing them; use NullSink for silent runs.
+        """
+        self.data = data
+        self.strategy = strategy
+        self.portfolio = portfolio if portfolio is not None else Portfolio(initial_cash, sink=sink)
+        self.order_size = order_size
+        self.books = {symbol: _OrderBook() for symbol in data}
+        self.orders = {}  # Order id -> open order
+        self._incoming = []  # Orders submitted on the current date, not yet active
+        self.last_prices = {}  # Symbol -> latest close
+        self.events_processed = 0
+        self.history = Ledger({"date": None, "cash": np.float64, "portfolio_value": np.float64})
+        self._next_order_id = 0
+        if hasattr(self.portfolio, "add_assets"):
+            self.portfolio.add_assets(list(data))
+
+    def submit_order(self, symbol, quantity, order_type=MARKET, price=None):
+        """
+        Submit an order; it can fill from the symbol's next bar on.
+
+        Parameters:
+            symbol (str): Symbol to trade.
+            quantity (float): Units to buy, or negative units to sell.
+            order_type (str): MARKET, LIMIT or STOP.
+            price (float): Limit or stop price; ignored for market orders.
+
+        Returns:
+            Order: The submitted order, whose status changes when it fills or is rejected.
+        """
+        if order_type not in ORDER_TYPES:
+            raise ValueError(f"Unknown order type {order_type!r}; expected one of {ORDER_TYPES}.")
+        if order_type != MARKET and price is None:
+            raise ValueError(f"A {order_type} order needs a price.")
+        if quantity == 0:
+            raise ValueError("Order quantity must be non-zero.")
+        if symbol not in self.books:
+            raise ValueError(f"Unknown symbol {symbol!r}.")
+        order = Order(self._next_order_id, symbol, quantity, order_type, price)
+        self._next_order_id += 1
+        self._incoming.append(order)
+        self.orders[order.order_id] = order
+        return order
+
+    def cancel_order(self, order):
+        """
+        Cancel an open order.
+
+        Parameters:
+            order (Order): Order returned by submit_order.
+
+        Returns:
+            bool: Whether the order was still open.
+        """
+        if self.orders.pop(order.order_id, None) is None:
+            return False
+        order.status = CANCELLED
+        if order in self._incoming:
+            self._incoming.remove(order)
+        else:
+            self.books[order.symbol].cancel(order)
+        return True
+
+    def position(self, symbol):
+        """
+        Units of a symbol currently held.
+        """
+        return self.portfolio.get_position(symbol)
+
+    def run(self):
+        """
+        Process every bar of every symbol in date order.
+
+        Bars with equal dates are processed in the order of the symbols in ``data``.
+        The portfolio value is recorded once per date, after all its bars.
+
+        Returns:
+            pd.DataFrame: Cash and portfolio value per date.
+        """
+        streams = [
+            bar_stream(symbol, bars) if isinstance(bars, pd.DataFrame) else iter(bars)
+            for symbol, bars in self.data.items()
+        ]
+        books = self.books
+        last_prices = self.last_prices
+        portfolio = self.portfolio
+        on_bar = getattr(self.strategy, "on_bar", None)
+        if on_bar is None:
+            on_bar = self._on_signal
+        current_date = None
+        events = 0
+
+        for bar in heapq.merge(*streams, key=attrgetter("date")):
+            if bar.date != current_date:
+                if current_date is not None:
+                    self._record(current_date)
+                current_date = bar.date
+                if self._incoming:
+                    self._activate()
+            book = books[bar.symbol]
+            if book.market or book.buy_limits or book.sell_limits or book.buy_stops or book.sell_stops:
+                for order, price in book.triggered(bar):
+                    self._fill(order, price, bar.date, portfolio)
+            last_prices[bar.symbol] = bar.close
+            on_bar(bar, self)
+            events += 1
+
+        if current_date is not None:
+            self._record(current_date)
+        self.events_processed += events
+        return self.results()
+
+    def _activate(self):
+        """
+        Move the orders submitted on the previous date into their order books.
+        """
+        for order in self._incoming:
+            self.books[order.symbol].add(order)
+        self._incoming = []
+
+    def _fill(self, order, price, date, portfolio):
+        """
+        Route a triggered order to the portfolio and record whether it was accepted.
+        """
+        if order.quantity > 0:
+            filled = portfolio.buy(order.symbol, price, order.quantity, date)
+        else:
+            filled = portfolio.sell(order.symbol, price, -order.quantity, date)
+        order.status = FILLED if filled else REJECTED
+        order.fill_price = price
+        order.fill_date = date
+        del self.orders[order.order_id]
+
+    def _on_signal(self, bar, engine):
+        """
+        Adapter turning generate_signal strategies into market orders.
+        """
+        signal = self.strategy.generate_signal(bar)
+        if signal == "buy":
+            self.submit_order(bar.symbol, self.order_size)
+        elif signal == "sell":
+            position = self.position(bar.symbol)
+            if position > 0:
+                self.submit_order(bar.symbol, -min(self.order_size, position))
+
+    def _record(self, date):
+        """
+        Append the portfolio value at the latest prices to the history.
+        """
+        value = self.portfolio.calculate_portfolio_value(self.last_prices)
+        self.history.append(date=date, cash=self.portfolio.cash, portfolio_value=value)
+
+    def results(self):
+        """
+        Return the results of the backtest.
+
+        Returns:
+            pd.DataFrame: Cash and portfolio value per date.
+        """
+        return self.history.to_frame()
@@ -0,0 +1,140 @@
+import logging
+
+# Trade event types
+BUY_FILLED = "buy"
+SELL_FILLED = "sell"
+BUY_REJECTED = "buy_rejected"
+SELL_REJECTED = "sell_rejected"
+
+
+def format_event(event, date, asset, price, quantity):
+    """
+    Format a trade event as the human-readable message the engine used to print.
+
+    Parameters:
+        event (str): Event type (BUY_FILLED, SELL_FILLED, BUY_REJECTED or SELL_REJECTED).
+        date (object): Date of the transaction.
+        asset (str): Asset traded, or None for the Backtester's single instrument.
+        price (float): Price per unit.
+        quantity (float): Number of units.
+
+    Returns:
+        str: The message.
+    """
+    if asset is None:
+        units = "share" if quantity == 1 else "shares"
+        if event == BUY_FILLED:
+            return f"{date}: Bought {quantity} {units} at {price:.2f}"
+        if event == SELL_FILLED:
+            return f"{date}: Sold {quantity} {units} at {price:.2f}"
+        if event == BUY_REJECTED:
+            return f"{date}: Insufficient cash to buy {quantity} {units} at {price:.2f}"
+        return f"{date}: Insufficient position to sell {quantity} {units}"
+
+    if event == BUY_FILLED:
+        return f"{date}: Bought {quantity} of {asset} at {price:.2f} each."
+    if event == SELL_FILLED:
+        return f"{date}: Sold {quantity} of {asset} at {price:.2f} each."
+    if event == BUY_REJECTED:
+        return f"{date}: Insufficient cash to buy {quantity} of {asset} at {price:.2f} each."
+    return f"{date}: Insufficient quantity of {asset} to sell {quantity}."
+
+
+class TradeEventSink:
+    """
+    Base class for receivers of trade events.
+
+    Callers check ``enabled`` before building an event, so a disabled sink costs
+    a single attribute lookup per trade.
+    """
+
+    enabled = True
+
+    def emit(self, event, date, asset, price, quantity):
+        """
+        Receive a trade event.
+
+        Parameters:
+            event (str): Event type (BUY_FILLED, SELL_FILLED, BUY_REJECTED or SELL_REJECTED).
+            date (object): Date of the transaction.
+            asset (str): Asset traded, or None for the Backtester's single instrument.
+            price (float): Price per unit.
+            quantity (float): Number of units.
+        """
+        raise NotImplementedError("Subclasses must implement the emit method.")
+
+
+class NullSink(TradeEventSink):
+    """
+    Silent sink: trade events are never built.
+    """
+
+    enabled = False
+
+    def emit(self, event, date, asset, price, quantity):
+        pass
+
+
+class PrintSink(TradeEventSink):
+    """
+    Print every trade event to stdout (the engine's historical behaviour).
+    """
+
+    def emit(self, event, date, asset, price, quantity):
+        print(format_event(event, date, asset, price, quantity))
+
+
+class BufferedSink(TradeEventSink):
+    """
+    Keep trade events in memory as (event, date, asset, price, quantity) tuples.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event, date, asset, price, quantity):
+        self.events.append((event, date, asset, price, quantity))
+
+    def messages(self):
+        """
+        Returns:
+            list: The buffered events formatted as messages.
+        """
+        return [format_event(*event) for event in self.events]
+
+    def clear(self):
+        """
+        Drop all buffered events.
+        """
+        self.events.clear()
+
+
+class LoggingSink(TradeEventSink):
+    """
+    Send trade events to a ``logging`` logger.
+
+    Fills are logged at ``level`` and rejections at ``rejected_level``. The event
+    fields are attached to the log record as ``trade_event`` for structured handlers.
+    """
+
+    def __init__(self, logger=None, level=logging.INFO, rejected_level=logging.WARNING):
+        """
+        Initialize the LoggingSink.
+
+        Parameters:
+            logger (logging.Logger): Logger to use. Defaults to the "Engine.trades" logger.
+            level (int): Level for fills.
+            rejected_level (int): Level for rejected orders.
+        """
+        self.logger = logger if logger is not None else logging.getLogger("Engine.trades")
+        self.level = level
+        self.rejected_level = rejected_level
+
+    def emit(self, event, date, asset, price, quantity):
+        level = self.rejected_level if event in (BUY_REJECTED, SELL_REJECTED) else self.level
+        if self.logger.isEnabledFor(level):
+            self.logger.log(
+                level,
+                format_event(event, date, asset, price, quantity),
+                extra={"trade_event": {"event": event, "date": date, "asset": asset, "price": price, "quantity": quantity}},
+            )
@@ -0,0 +1,208 @@
+import types
+
+import numpy as np
+
+from .costs import FIXED, ExecutionModel, fill_order, fill_orders
+from .strategy import BUY, SELL
+
+
+try:
+    import numba
+except ImportError:  # numba is an optional extra
+    numba = None
+
+ENGINES = ("auto", "numpy", "numba", "python")
+
+# Below this many rows the scalar loop beats stepping all rows through time with
+# array operations, whose per-bar overhead only pays off on wide panels
+STEPWISE_MIN_ROWS = 24
+
+
+def execute_signals(signals, close, initial_cash, initial_position=0, engine="auto", execution_model=None):
+    """
+    Execute signal arrays with the Backtester rules using array operations.
+
+    A buy signal buys one share if cash covers the close price, a sell signal
+    sells one share if a position is held; an ExecutionModel changes the order
+    size and adds fees, spread and slippage. Every engine produces results
+    identical to Backtester.run:
+
+    - "numpy" finds positions with a running sum reflected at zero, which is
+      exact as long as cash never runs short, and replays rows from the first
+      buy the cash check would have rejected. Fraction and target-weight sizing
+      depend on the cash, so they run the reference loop, or step through time
+      for all rows together on panels of at least STEPWISE_MIN_ROWS rows.
+    - "numba" runs the state machine as a compiled loop (requires numba).
+    - "python" runs the same loop uncompiled; it is the reference implementation.
+    - "auto" uses "numba" when it is installed and "numpy" otherwise.
+
+    Parameters:
+        signals (np.ndarray): Signal codes (BUY, SELL or HOLD), shape (T,) or (n, T).
+        close (np.ndarray): Close prices, broadcastable against signals.
+        initial_cash (float): Cash held before the first bar.
+        initial_position (int): Shares held before the first bar.
+        engine (str): One of ENGINES.
+        execution_model (ExecutionModel): Costs and sizing. Defaults to one share
+            per signal without costs.
+
+    Returns:
+        tuple: (cash, position, portfolio_value) arrays shaped like the broadcast inputs.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}.")
+    if engine == "auto":
+        engine = "numpy" if numba is None else "numba"
+    if engine == "numba" and numba is None:
+        raise ImportError("numba is required for engine='numba'.")
+    if execution_model is None:
+        execution_model = ExecutionModel()
+    params = execution_model.parameters()
+    position_dtype = np.float64 if execution_model.fractional_positions else np.int64
+
+    signals, close = np.broadcast_arrays(np.asarray(signals), np.asarray(close, dtype=np.float64))
+    shape = signals.shape
+    if signals.size == 0:
+        return np.full(shape, float(initial_cash)), np.full(shape, initial_position), np.full(shape, float(initial_cash))
+    num_bars = shape[-1]
+    signals = signals.reshape(-1, num_bars)
+    close = close.reshape(-1, num_bars)
+
+    _, _, _, sizing, size, _ = params
+    if engine == "numpy" and sizing == FIXED and size > 0 and size.is_integer() and initial_position % size == 0:
+        cash, position = _execute_reflected(signals, close, initial_cash, initial_position, params)
+    else:
+        num_rows = signals.shape[0]
+        cash = np.empty(signals.shape)
+        position = np.empty(signals.shape, dtype=position_dtype)
+        kernel = {"numba": _execute_rows_compiled, "python": _execute_rows}.get(engine) or _loop_kernel(num_rows)
+        kernel(np.ascontiguousarray(signals), np.ascontiguousarray(close), np.full(num_rows, float(initial_cash)),
+               np.full(num_rows, initial_position, dtype=position_dtype), cash, position, *params)
+
+    portfolio_value = cash + position * close
+    return cash.reshape(shape), position.reshape(shape), portfolio_value.reshape(shape)
+
+
+def _execute_reflected(signals, close, initial_cash, initial_position, params):
+    """
+    NumPy engine: reflected running sums, with replay of cash-constrained rows.
+
+    Positions move in lots of the fixed order size, so they are counted in lots.
+
+    Parameters:
+        signals (np.ndarray): Signal codes, shape (n, T).
+        close (np.ndarray): Close prices, shape (n, T).
+        initial_cash (float): Cash held before the first bar.
+        initial_position (int): Shares held before the first bar, a multiple of the order size.
+        params (tuple): ExecutionModel.parameters() with fixed, whole-share sizing.
+
+    Returns:
+        tuple: (cash, position) arrays of shape (n, T).
+    """
+    buy_factor, sell_factor, fixed_fee, _, size, _ = params
+    num_bars = signals.shape[1]
+    lot = int(size)
+    delta = (signals == BUY).astype(np.int64) - (signals == SELL)
+    running = initial_position // lot + np.cumsum(delta, axis=1)
+    lots = running - np.minimum(np.minimum.accumulate(running, axis=1), 0)
+    trades = np.diff(lots, axis=1, prepend=initial_position // lot)
+    position = lots * lot
+
+    # Same expressions as fill_order, so the cash matches the reference loop exactly
+    buy_cost = size * (close * buy_factor) + fixed_fee
+    cash_flows = np.empty((close.shape[0], num_bars + 1))
+    cash_flows[:, 0] = initial_cash
+    cash_flows[:, 1:] = np.where(trades > 0, -buy_cost, np.where(trades < 0, size * close * sell_factor - fixed_fee, 0.0))
+    cash = np.cumsum(cash_flows, axis=1)
+
+    # Buys the reflection assumed but the cash check would have rejected
+    rejected = (trades == 1) & ~(cash[:, :-1] >= buy_cost)
+    cash = cash[:, 1:]
+    replay = np.flatnonzero(rejected.any(axis=1))
+    if len(replay):
+        start = np.argmax(rejected[replay], axis=1).min()
+        start_cash = cash[replay, start - 1] if start else np.full(len(replay), float(initial_cash))
+        start_position = position[replay, start - 1] if start else np.full(len(replay), initial_position)
+        replay_cash = cash[replay, start:]
+        replay_position = position[replay, start:]
+        # Rows that ran short of cash run the state machine from the earliest rejection
+        _loop_kernel(len(replay))(signals[replay, start:], close[replay, start:], start_cash, start_position,
+                                  replay_cash, replay_position, *params)
+        cash[replay, start:] = replay_cash
+        position[replay, start:] = replay_position
+    return cash, position
+
+
+def _loop_kernel(num_rows):
+    """
+    The uncompiled kernel that is fastest for a number of rows.
+
+    Parameters:
+        num_rows (int): Number of rows to execute.
+
+    Returns:
+        function: _execute_rows for few rows, _execute_stepwise for wide panels.
+    """
+    return _execute_rows if num_rows < STEPWISE_MIN_ROWS else _execute_stepwise
+
+
+def _execute_rows(signals, close, cash, position, cash_out, position_out,
+                  buy_factor, sell_factor, fixed_fee, sizing, size, fractional):
+    """
+    Reference implementation of the Backtester state machine, one row at a time.
+
+    Written for plain Python and Numba alike; ``_execute_rows_compiled`` is the
+    JIT-compiled version, calling a compiled fill_order, when Numba is installed.
+
+    Parameters:
+        signals (np.ndarray): Signal codes, shape (n, T).
+        close (np.ndarray): Close prices, shape (n, T).
+        cash (np.ndarray): Cash before the first bar, shape (n,).
+        position (np.ndarray): Shares held before the first bar, shape (n,).
+        cash_out (np.ndarray): Output array for cash after each bar, shape (n, T).
+        position_out (np.ndarray): Output array for the position after each bar, shape (n, T).
+        Remaining parameters are ExecutionModel.parameters(), as in fill_order.
+    """
+    for row in range(signals.shape[0]):
+        row_cash = cash[row]
+        row_position = position[row] * 1.0
+        for i in range(signals.shape[1]):
+            quantity, cash_change = fill_order(signals[row, i], close[row, i], row_cash, row_position,
+                                               buy_factor, sell_factor, fixed_fee, sizing, size, fractional)
+            row_position += quantity
+            row_cash += cash_change
+            cash_out[row, i] = row_cash
+            position_out[row, i] = row_position
+
+
+if numba is not None:
+    # The same loop, resolving fill_order to its compiled version
+    _execute_rows_compiled = numba.njit(cache=True, nogil=True)(types.FunctionType(
+        _execute_rows.__code__, dict(globals(), fill_order=numba.njit(cache=True)(fill_order)), "_execute_rows"
+    ))
+else:
+    _execute_rows_compiled = None
+
+
+def _execute_stepwise(signals, close, cash, position, cash_out, position_out,
+                      buy_factor, sell_factor, fixed_fee, sizing, size, fractional):
+    """
+    Run the Backtester state machine for many rows at once, one bar at a time.
+
+    Parameters:
+        signals (np.ndarray): Signal codes, shape (n, T).
+        close (np.ndarray): Close prices, shape (n, T).
+        cash (np.ndarray): Cash before the first bar, shape (n,).
+        position (np.ndarray): Shares held before the first bar, shape (n,).
+        cash_out (np.ndarray): Output array for cash after each bar, shape (n, T).
+        position_out (np.ndarray): Output array for the position after each bar, shape (n, T).
+        Remaining parameters are ExecutionModel.parameters(), as in fill_order.
+    """
+    cash = np.array(cash, dtype=np.float64)
+    position = np.array(position, dtype=np.float64)
+    for i in range(signals.shape[1]):
+        quantity, cash_change = fill_orders(signals[:, i], close[:, i], cash, position,
+                                            buy_factor, sell_factor, fixed_fee, sizing, size, fractional)
+        position += quantity
+        cash += cash_change
+        cash_out[:, i] = cash
+        position_out[:, i] = position
@@ -0,0 +1,248 @@
+import os
+import shutil
+import tempfile
+import weakref
+
+import numpy as np
+import pandas as pd
+
+
+class LedgerRecord:
+    """
+    A lightweight view of one ledger row, read like a dict: ``record["cash"]``.
+    """
+
+    __slots__ = ("_ledger", "_index")
+
+    def __init__(self, ledger, index):
+        self._ledger = ledger
+        self._index = index
+
+    def __getitem__(self, field):
+        return self._ledger.value(field, self._index)
+
+    def keys(self):
+        return self._ledger.fields.keys()
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: The row as {field: value}.
+        """
+        return {field: self[field] for field in self.keys()}
+
+    def __repr__(self):
+        return f"LedgerRecord({self.to_dict()})"
+
+
+class Ledger:
+    """
+    A columnar, growable record of trades or equity values.
+
+    Rows are stored in preallocated NumPy arrays, one per field, that double in
+    capacity when full. Once ``spill_threshold`` rows are held in memory they are
+    appended to one file per numeric field, which exports memory-map instead of
+    loading. Object fields cannot be mapped; they spill to pickled ``.npy``
+    segments that are loaded when the column is exported.
+    """
+
+    def __init__(self, fields, capacity=1024, spill_threshold=None, spill_dir=None):
+        """
+        Initialize the Ledger.
+
+        Parameters:
+            fields (dict): Field name to NumPy dtype, in column order. A dtype of None
+                is taken from the first values written to the field.
+            capacity (int): Number of rows to preallocate.
+            spill_threshold (int): Rows held in memory before spilling to disk. None disables spilling.
+            spill_dir (str): Directory in which the ledger creates its own spill
+                subdirectory, so ledgers sharing a directory never read each other's
+                files. Defaults to a temporary directory that is removed with the ledger.
+        """
+        self.fields = {name: None if dtype is None else np.dtype(dtype) for name, dtype in fields.items()}
+        self.spill_threshold = spill_threshold
+        self.spill_dir = spill_dir
+        self._capacity = capacity
+        self._columns = {
+            name: None if dtype is None else np.empty(capacity, dtype=dtype) for name, dtype in self.fields.items()
+        }
+        self._untyped = None in self.fields.values()  # Some dtypes still to be inferred
+        self._size = 0  # Rows held in memory
+        self._segments = []  # Row counts of the spilled segments
+
+        if spill_threshold is not None:
+            self.spill_dir = tempfile.mkdtemp(prefix="ledger_", dir=spill_dir)
+            if spill_dir is None:
+                self._cleanup = weakref.finalize(self, shutil.rmtree, self.spill_dir, True)
+
+    def __len__(self):
+        return sum(self._segments) + self._size
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Ledger index out of range.")
+        return LedgerRecord(self, index)
+
+    def __iter__(self):
+        return (LedgerRecord(self, index) for index in range(len(self)))
+
+    def __repr__(self):
+        return f"Ledger({len(self)} rows, fields={list(self.fields)})"
+
+    def append(self, **values):
+        """
+        Append one row.
+
+        Parameters:
+            **values: One value per field.
+        """
+        if self._untyped:
+            self._infer_dtypes({name: np.asarray([value]) for name, value in values.items()})
+        if self._size == self._capacity:
+            self._reserve(self._size + 1)
+        for name, column in self._columns.items():
+            column[self._size] = values[name]
+        self._size += 1
+        self._maybe_spill()
+
+    def extend(self, **columns):
+        """
+        Append many rows from equally long arrays.
+
+        Parameters:
+            **columns: One array per field.
+        """
+        count = len(next(iter(columns.values())))
+        if self._untyped:
+            self._infer_dtypes(columns)
+        self._reserve(self._size + count)
+        for name, column in self._columns.items():
+            column[self._size:self._size + count] = columns[name]
+        self._size += count
+        self._maybe_spill()
+
+    def _infer_dtypes(self, columns):
+        """
+        Allocate the fields whose dtype is still unknown from sample values.
+        """
+        for name, dtype in self.fields.items():
+            if dtype is None:
+                self.fields[name] = np.asarray(columns[name]).dtype
+                self._columns[name] = np.empty(self._capacity, dtype=self.fields[name])
+        self._untyped = False
+
+    def _reserve(self, size):
+        """
+        Grow the in-memory arrays to hold at least ``size`` rows.
+        """
+        if size <= self._capacity:
+            return
+        self._capacity = max(size, 2 * self._capacity)
+        for name, column in self._columns.items():
+            grown = np.empty(self._capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def _maybe_spill(self):
+        """
+        Write the in-memory rows to disk once the spill threshold is reached.
+        """
+        if self.spill_threshold is None or self._size < self.spill_threshold:
+            return
+        self._spill()
+
+    def _spill(self):
+        """
+        Move the in-memory rows to disk: appended to the field file, or as a new segment for object fields.
+        """
+        segment = len(self._segments)
+        for name, column in self._columns.items():
+            if column.dtype == object:
+                np.save(self._segment_path(segment, name), column[:self._size], allow_pickle=True)
+            else:
+                with open(self._field_path(name), "ab") as file:
+                    column[:self._size].tofile(file)
+        self._segments.append(self._size)
+        self._size = 0
+
+    def _segment_path(self, segment, name):
+        return os.path.join(self.spill_dir, f"segment_{segment:06d}_{name}.npy")
+
+    def _field_path(self, name):
+        return os.path.join(self.spill_dir, f"field_{name}.bin")
+
+    def value(self, name, index):
+        """
+        Get one value without exporting the column.
+
+        Parameters:
+            name (str): Field name.
+            index (int): Row number, 0 <= index < len(self).
+
+        Returns:
+            object: The value.
+        """
+        spilled = sum(self._segments)
+        if index >= spilled:
+            return self._columns[name][index - spilled]
+        if self.fields[name] != object:
+            return np.memmap(self._field_path(name), dtype=self.fields[name], mode="r", shape=(spilled,))[index]
+        for segment, count in enumerate(self._segments):
+            if index < count:
+                return np.load(self._segment_path(segment, name), allow_pickle=True)[index]
+            index -= count
+
+    def column(self, name):
+        """
+        Get a whole column.
+
+        Parameters:
+            name (str): Field name.
+
+        Returns:
+            np.ndarray: A view of the in-memory rows. Once the ledger has spilled,
+                numeric columns are memory-mapped from disk while no rows are held
+                in memory, and joined with the in-memory rows otherwise; object
+                columns are loaded from their segments.
+        """
+        if self._columns[name] is None:
+            return np.empty(0)
+        in_memory = self._columns[name][:self._size]
+        if not self._segments:
+            return in_memory
+        dtype = self.fields[name]
+        if dtype == object:
+            parts = [
+                np.load(self._segment_path(segment, name), allow_pickle=True)
+                for segment in range(len(self._segments))
+            ]
+            return np.concatenate(parts + [in_memory])
+        spilled = np.memmap(self._field_path(name), dtype=dtype, mode="r", shape=(sum(self._segments),))
+        return np.concatenate([spilled, in_memory]) if self._size else spilled
+
+    def to_frame(self):
+        """
+        Export the ledger as a DataFrame.
+
+        Without spilled segments the frame wraps the ledger arrays without copying;
+        after a spill, numeric columns are memory-mapped while no rows are held in memory.
+
+        Returns:
+            pd.DataFrame: One column per field.
+        """
+        return pd.DataFrame({name: self.column(name) for name in self.fields}, copy=False)
+
+    def to_arrow(self):
+        """
+        Export the ledger as a pyarrow Table (zero-copy for numeric columns).
+
+        Returns:
+            pyarrow.Table: One column per field.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as error:
+            raise ImportError("pyarrow is required for Ledger.to_arrow().") from error
+        return pa.table({name: self.column(name) for name in self.fields})
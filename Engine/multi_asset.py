@@ -0,0 +1,209 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .Monte_carlo import MonteCarloSimulation
+
+
+def factorize_covariance(covariance, tolerance=1e-10):
+    """
+    Factor a covariance matrix as ``factor @ factor.T``.
+
+    Uses the Cholesky decomposition, falling back to an eigendecomposition with
+    clipped eigenvalues for positive semi-definite matrices (e.g. perfectly
+    correlated assets or sample covariances with fewer observations than names).
+
+    Parameters:
+        covariance (np.ndarray): Symmetric (assets x assets) covariance matrix.
+        tolerance (float): Relative size of the negative eigenvalues tolerated as rounding error.
+
+    Returns:
+        np.ndarray: The (assets x assets) factor.
+    """
+    covariance = np.asarray(covariance, dtype=float)
+    if covariance.ndim != 2 or covariance.shape[0] != covariance.shape[1]:
+        raise ValueError("covariance must be a square matrix.")
+    if not np.allclose(covariance, covariance.T):
+        raise ValueError("covariance must be symmetric.")
+    try:
+        return np.linalg.cholesky(covariance)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+        if eigenvalues.min() < -tolerance * max(eigenvalues.max(), 1.0):
+            raise ValueError("covariance must be positive semi-definite.")
+        return eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+
+
+def simulate_correlated_paths(out, rng, initial_values, drifts, factor):
+    """
+    Fill a preallocated buffer with correlated geometric Brownian motion paths, in place.
+
+    Parameters:
+        out (np.ndarray): Buffer of shape (num_paths, time_horizon + 1, assets);
+            time step 0 receives the initial values.
+        rng (np.random.Generator): Source of the standard normal shocks.
+        initial_values (np.ndarray): Starting value of every asset.
+        drifts (np.ndarray): Expected return of every asset.
+        factor (np.ndarray): Factor of the covariance matrix, from factorize_covariance.
+
+    Returns:
+        np.ndarray: The filled ``out`` buffer.
+    """
+    num_paths, num_times, num_assets = out.shape
+    dt = 1 / (num_times - 1)
+    steps = out[:, 1:]
+
+    shocks = rng.standard_normal((num_paths, num_times - 1, num_assets))
+    np.matmul(shocks, factor.T * np.sqrt(dt), out=steps)
+    np.add(steps, drifts * dt, out=steps)
+    np.cumsum(steps, axis=1, out=steps)
+    np.exp(steps, out=steps)
+    np.multiply(steps, initial_values, out=steps)
+    out[:, 0] = initial_values
+    return out
+
+
+def _simulate_correlated_chunk(initial_values, drifts, factor, time_horizon, num_paths, seed_sequence):
+    """
+    Simulate one chunk of correlated paths; module-level so that it can be sent to worker processes.
+
+    Returns:
+        np.ndarray: Simulated paths (num_paths x time_horizon + 1 x assets).
+    """
+    out = np.empty((num_paths, time_horizon + 1, len(initial_values)))
+    return simulate_correlated_paths(out, np.random.default_rng(seed_sequence), initial_values, drifts, factor)
+
+
+class MultiAssetMonteCarlo:
+    """
+    A class to simulate correlated price paths for many assets.
+
+    The covariance matrix is factored once; every chunk of paths is then a single
+    batched matrix multiplication of the shocks by that factor. Seeding and
+    chunking follow MonteCarloSimulation, so results do not depend on the number
+    of workers.
+    """
+
+    def __init__(self, initial_values, drifts, covariance, num_simulations, time_horizon,
+                 symbols=None, seed=None, chunk_size=10000):
+        """
+        Initialize the MultiAssetMonteCarlo.
+
+        Parameters:
+            initial_values (array-like): Starting value of every asset.
+            drifts (array-like): Expected return of every asset over the horizon.
+            covariance (array-like): (assets x assets) covariance of the log returns over the horizon.
+            num_simulations (int): Number of simulation runs.
+            time_horizon (int): Total number of time steps in the simulation.
+            symbols (list of str): Name of every asset. Defaults to "asset_0", "asset_1", ...
+            seed (int or np.random.SeedSequence): Seed for reproducible runs. If None,
+                the seed is drawn from the global np.random state.
+            chunk_size (int): Number of paths per independently seeded chunk.
+        """
+        self.initial_values = np.asarray(initial_values, dtype=float)
+        self.drifts = np.broadcast_to(np.asarray(drifts, dtype=float), self.initial_values.shape)
+        self.covariance = np.asarray(covariance, dtype=float)
+        if self.covariance.shape != (len(self.initial_values),) * 2:
+            raise ValueError("covariance must have one row and column per asset.")
+        self.factor = factorize_covariance(self.covariance)
+        self.num_simulations = num_simulations
+        self.time_horizon = time_horizon
+        self.symbols = list(symbols) if symbols is not None else [f"asset_{i}" for i in range(len(self.initial_values))]
+        self.seed = seed
+        self.chunk_size = chunk_size
+
+    # Same root seed and chunk partition as the single-asset engine
+    _root_seed = MonteCarloSimulation._root_seed
+    _chunk_seeds = MonteCarloSimulation._chunk_seeds
+
+    def _params(self):
+        return self.initial_values, self.drifts, self.factor
+
+    def run_simulation(self, workers=None, out=None):
+        """
+        Runs the simulation for every asset.
+
+        Parameters:
+            workers (int): Number of worker processes. None or 1 runs in this process.
+            out (np.ndarray): Optional buffer of shape (num_simulations, time_horizon + 1, assets)
+                to reuse across runs.
+
+        Returns:
+            np.ndarray: Simulated paths (num_simulations x time_horizon + 1 x assets).
+        """
+        shape = (self.num_simulations, self.time_horizon + 1, len(self.initial_values))
+        if out is None:
+            out = np.empty(shape)
+        elif out.shape != shape:
+            raise ValueError(f"out must be an array of shape {shape}.")
+
+        chunks = self._chunk_seeds()
+        if workers is None or workers <= 1 or len(chunks) <= 1:
+            for start, stop, seed_sequence in chunks:
+                simulate_correlated_paths(out[start:stop], np.random.default_rng(seed_sequence), *self._params())
+            return out
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                (start, stop, pool.submit(
+                    _simulate_correlated_chunk, *self._params(), self.time_horizon, stop - start, seed_sequence
+                ))
+                for start, stop, seed_sequence in chunks
+            ]
+            for start, stop, future in futures:
+                out[start:stop] = future.result()
+        return out
+
+    def iter_chunks(self):
+        """
+        Generate the paths chunk by chunk, reusing one chunk-sized buffer.
+
+        The yielded array is overwritten by the next chunk; copy it to keep it.
+        The chunks concatenate to the output of run_simulation.
+
+        Yields:
+            tuple: (start, stop, paths) with paths of shape (stop - start, time_horizon + 1, assets).
+        """
+        buffer = np.empty((min(self.chunk_size, self.num_simulations), self.time_horizon + 1, len(self.initial_values)))
+        for start, stop, seed_sequence in self._chunk_seeds():
+            paths = simulate_correlated_paths(
+                buffer[:stop - start], np.random.default_rng(seed_sequence), *self._params()
+            )
+            yield start, stop, paths
+
+    def portfolio_values(self, portfolio):
+        """
+        Value a portfolio's holdings along every simulated path, chunk by chunk.
+
+        Only one chunk of the price tensor is held in memory at a time.
+
+        Parameters:
+            portfolio (ArrayPortfolio): Holdings to value; matched to the simulated
+                assets by symbol.
+
+        Returns:
+            np.ndarray: Portfolio values of shape (num_simulations, time_horizon + 1).
+        """
+        values = np.empty((self.num_simulations, self.time_horizon + 1))
+        for start, stop, paths in self.iter_chunks():
+            values[start:stop] = portfolio.calculate_portfolio_values(paths, self.symbols)
+        return values
+
+    def summarize_simulation(self, paths):
+        """
+        Summarize the final values of every asset.
+
+        Parameters:
+            paths (np.ndarray): Simulated paths from the simulation.
+
+        Returns:
+            dict: Statistics such as mean, median, and standard deviation, one value per asset.
+        """
+        final_values = paths[:, -1]
+        return {
+            "mean": np.mean(final_values, axis=0),
+            "median": np.median(final_values, axis=0),
+            "std_dev": np.std(final_values, axis=0),
+            "min": np.min(final_values, axis=0),
+            "max": np.max(final_values, axis=0),
+        }
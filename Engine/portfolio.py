@@ -1,18 +1,28 @@
+import numpy as np
+
+from .events import BUY_FILLED, BUY_REJECTED, SELL_FILLED, SELL_REJECTED, PrintSink
+from .ledger import Ledger
+
+# Ledger fields of the transaction history
+TRANSACTION_FIELDS = {"date": object, "action": object, "asset": object, "price": np.float64, "quantity": np.float64}
+
 class Portfolio:
     """
     A class to manage a portfolio of assets during backtesting.
     """
 
-    def __init__(self, initial_cash=100000):
+    def __init__(self, initial_cash=100000, sink=None):
         """
         Initialize the Portfolio.
 
         Parameters:
             initial_cash (float): Starting cash amount for the portfolio.
+            sink (TradeEventSink): Receiver of trade events. Defaults to printing them.
         """
         self.cash = initial_cash
         self.positions = {}  # Dictionary to store positions: {asset: quantity}
-        self.transaction_history = []  # List to log all transactions
+        self.transaction_history = Ledger(TRANSACTION_FIELDS)  # Columnar log of all transactions
+        self.sink = sink if sink is not None else PrintSink()
 
     def buy(self, asset, price, quantity, date):
         """
@@ -23,17 +33,21 @@ class Portfolio:
             price (float): Price per unit of the asset.
             quantity (int): Number of units to buy.
             date (str): Date of the transaction.
+
+        Returns:
+            bool: Whether the order was filled.
         """
         total_cost = price * quantity
         if self.cash >= total_cost:
             self.cash -= total_cost
             self.positions[asset] = self.positions.get(asset, 0) + quantity
-            self.transaction_history.append(
-                {"date": date, "action": "buy", "asset": asset, "price": price, "quantity": quantity}
-            )
-            print(f"{date}: Bought {quantity} of {asset} at {price:.2f} each.")
-        else:
-            print(f"{date}: Insufficient cash to buy {quantity} of {asset} at {price:.2f} each.")
+            self.transaction_history.append(date=date, action="buy", asset=asset, price=price, quantity=quantity)
+            if self.sink.enabled:
+                self.sink.emit(BUY_FILLED, date, asset, price, quantity)
+            return True
+        if self.sink.enabled:
+            self.sink.emit(BUY_REJECTED, date, asset, price, quantity)
+        return False
 
     def sell(self, asset, price, quantity, date):
         """
@@ -44,6 +58,9 @@ class Portfolio:
             price (float): Price per unit of the asset.
             quantity (int): Number of units to sell.
             date (str): Date of the transaction.
+
+        Returns:
+            bool: Whether the order was filled.
         """
         if self.positions.get(asset, 0) >= quantity:
             total_revenue = price * quantity
@@ -51,12 +68,13 @@ class Portfolio:
             self.positions[asset] -= quantity
             if self.positions[asset] == 0:
                 del self.positions[asset]
-            self.transaction_history.append(
-                {"date": date, "action": "sell", "asset": asset, "price": price, "quantity": quantity}
-            )
-            print(f"{date}: Sold {quantity} of {asset} at {price:.2f} each.")
-        else:
-            print(f"{date}: Insufficient quantity of {asset} to sell {quantity}.")
+            self.transaction_history.append(date=date, action="sell", asset=asset, price=price, quantity=quantity)
+            if self.sink.enabled:
+                self.sink.emit(SELL_FILLED, date, asset, price, quantity)
+            return True
+        if self.sink.enabled:
+            self.sink.emit(SELL_REJECTED, date, asset, price, quantity)
+        return False
 
     def calculate_portfolio_value(self, market_prices):
         """
@@ -74,6 +92,18 @@ class Portfolio:
                 total_value += market_prices[asset] * quantity
         return total_value
 
+    def get_position(self, asset):
+        """
+        Get the quantity held of one asset.
+
+        Parameters:
+            asset (str): Name of the asset.
+
+        Returns:
+            float: Quantity held, 0 if none.
+        """
+        return self.positions.get(asset, 0)
+
     def get_positions(self):
         """
         Get the current positions in the portfolio.
@@ -88,10 +118,289 @@ class Portfolio:
         Get the transaction history of the portfolio.
 
         Returns:
-            list: List of all transactions made during backtesting.
+            Ledger: Columnar log of all transactions made during backtesting.
+        """
+        return self.transaction_history
+
+class ArrayPortfolio:
+    """
+    A class to manage a portfolio of many assets with NumPy position vectors.
+
+    Each asset gets an integer index; positions are stored in a vector aligned with
+    that index so valuation is a single dot product against a price vector.
+    """
+
+    def __init__(self, symbols=(), initial_cash=100000, sink=None):
+        """
+        Initialize the ArrayPortfolio.
+
+        Parameters:
+            symbols (iterable of str): Assets to register up front, in index order.
+            initial_cash (float): Starting cash amount for the portfolio.
+            sink (TradeEventSink): Receiver of trade events. Defaults to printing them.
+        """
+        self.cash = initial_cash
+        self.symbols = []  # Index -> asset
+        self.asset_index = {}  # Asset -> index
+        self.positions = np.zeros(0)  # Quantity held, aligned with the asset index
+        self.transaction_history = Ledger(TRANSACTION_FIELDS)  # Columnar log of all transactions
+        self.sink = sink if sink is not None else PrintSink()
+        self.add_assets(symbols)
+
+    def add_assets(self, symbols):
+        """
+        Register assets that are not in the index yet.
+
+        Parameters:
+            symbols (iterable of str): Asset names.
+
+        Returns:
+            np.ndarray: Index of every given asset.
+        """
+        for symbol in symbols:
+            if symbol not in self.asset_index:
+                self.asset_index[symbol] = len(self.symbols)
+                self.symbols.append(symbol)
+        if len(self.positions) < len(self.symbols):
+            self.positions = np.concatenate([self.positions, np.zeros(len(self.symbols) - len(self.positions))])
+        return np.array([self.asset_index[symbol] for symbol in symbols], dtype=np.intp)
+
+    def _indices(self, assets):
+        """
+        Resolve assets given as names or integer indices to an index array.
+
+        Parameters:
+            assets (iterable): Asset names, or an integer array of asset indices.
+
+        Returns:
+            np.ndarray: Asset indices.
+        """
+        assets = np.asarray(assets)
+        if np.issubdtype(assets.dtype, np.integer):
+            return assets.astype(np.intp, copy=False)
+        return self.add_assets(assets.tolist())
+
+    def buy(self, asset, price, quantity, date):
+        """
+        Buy an asset and update the portfolio.
+
+        Orders with a non-positive quantity or a negative price are rejected.
+
+        Parameters:
+            asset (str): Name of the asset being bought.
+            price (float): Price per unit of the asset.
+            quantity (float): Number of units to buy.
+            date (str): Date of the transaction.
+
+        Returns:
+            bool: Whether the order was filled.
+        """
+        total_cost = price * quantity
+        if quantity > 0 and price >= 0 and self.cash >= total_cost:
+            self.cash -= total_cost
+            self.positions[self.add_assets([asset])[0]] += quantity
+            self.transaction_history.append(date=date, action="buy", asset=asset, price=price, quantity=quantity)
+            if self.sink.enabled:
+                self.sink.emit(BUY_FILLED, date, asset, price, quantity)
+            return True
+        if self.sink.enabled:
+            self.sink.emit(BUY_REJECTED, date, asset, price, quantity)
+        return False
+
+    def sell(self, asset, price, quantity, date):
+        """
+        Sell an asset and update the portfolio.
+
+        Orders with a non-positive quantity or a negative price are rejected.
+
+        Parameters:
+            asset (str): Name of the asset being sold.
+            price (float): Price per unit of the asset.
+            quantity (float): Number of units to sell.
+            date (str): Date of the transaction.
+
+        Returns:
+            bool: Whether the order was filled.
+        """
+        index = self.asset_index.get(asset)
+        if index is not None and quantity > 0 and price >= 0 and self.positions[index] >= quantity:
+            self.cash += price * quantity
+            self.positions[index] -= quantity
+            self.transaction_history.append(date=date, action="sell", asset=asset, price=price, quantity=quantity)
+            if self.sink.enabled:
+                self.sink.emit(SELL_FILLED, date, asset, price, quantity)
+            return True
+        if self.sink.enabled:
+            self.sink.emit(SELL_REJECTED, date, asset, price, quantity)
+        return False
+
+    def buy_many(self, assets, prices, quantities, date):
+        """
+        Buy many assets in one call.
+
+        Orders with a non-positive quantity or a negative price are rejected; the
+        others are filled in the given order for as long as their cumulative cost
+        is covered by cash, and the remaining orders are rejected.
+
+        Parameters:
+            assets (iterable): Asset names, or an integer array of asset indices.
+            prices (np.ndarray): Price per unit for every order.
+            quantities (np.ndarray): Number of units for every order.
+            date (str): Date of the transactions.
+
+        Returns:
+            np.ndarray: Boolean mask of the filled orders.
+        """
+        indices = self._indices(assets)
+        prices, quantities = np.broadcast_arrays(np.asarray(prices, dtype=float), np.asarray(quantities, dtype=float))
+        valid = (quantities > 0) & (prices >= 0)
+        costs = np.where(valid, prices * quantities, 0.0)
+        filled = valid & (np.cumsum(costs) <= self.cash)
+
+        np.add.at(self.positions, indices[filled], quantities[filled])
+        self.cash -= costs[filled].sum()
+        self._record("buy", indices[filled], prices[filled], quantities[filled], date)
+        if self.sink.enabled:
+            self._emit_many(BUY_FILLED, BUY_REJECTED, filled, indices, prices, quantities, date)
+        return filled
+
+    def sell_many(self, assets, prices, quantities, date):
+        """
+        Sell many assets in one call.
+
+        Orders with a non-positive quantity or a negative price are rejected, and
+        all other orders for an asset are rejected if together they exceed its position.
+
+        Parameters:
+            assets (iterable): Asset names, or an integer array of asset indices.
+            prices (np.ndarray): Price per unit for every order.
+            quantities (np.ndarray): Number of units for every order.
+            date (str): Date of the transactions.
+
+        Returns:
+            np.ndarray: Boolean mask of the filled orders.
+        """
+        indices = self._indices(assets)
+        prices, quantities = np.broadcast_arrays(np.asarray(prices, dtype=float), np.asarray(quantities, dtype=float))
+        valid = (quantities > 0) & (prices >= 0)
+        requested = np.bincount(indices, weights=np.where(valid, quantities, 0.0), minlength=len(self.positions))
+        filled = valid & (self.positions >= requested)[indices]
+
+        np.subtract.at(self.positions, indices[filled], quantities[filled])
+        revenue = (prices[filled] * quantities[filled]).sum()
+        self.cash += revenue
+        self._record("sell", indices[filled], prices[filled], quantities[filled], date)
+        if self.sink.enabled:
+            self._emit_many(SELL_FILLED, SELL_REJECTED, filled, indices, prices, quantities, date)
+        return filled
+
+    def _record(self, action, indices, prices, quantities, date):
+        """
+        Log filled orders to the transaction history.
+        """
+        count = len(indices)
+        self.transaction_history.extend(
+            date=np.full(count, date, dtype=object),
+            action=np.full(count, action, dtype=object),
+            asset=np.asarray(self.symbols, dtype=object)[indices],
+            price=prices,
+            quantity=quantities,
+        )
+
+    def _emit_many(self, event, rejected_event, filled, indices, prices, quantities, date):
+        """
+        Send one trade event per order of a bulk call to the sink.
+        """
+        for is_filled, index, price, quantity in zip(filled, indices, prices, quantities):
+            self.sink.emit(event if is_filled else rejected_event, date, self.symbols[index], price, quantity)
+
+    def price_vector(self, market_prices):
+        """
+        Convert a {asset: price} dict to a price vector aligned with the asset index.
+
+        Assets without a price are valued at zero, as in Portfolio.
+
+        Parameters:
+            market_prices (dict): Current market prices of assets: {asset: price}.
+
+        Returns:
+            np.ndarray: Prices aligned with the asset index.
+        """
+        prices = np.zeros(len(self.symbols))
+        for asset, price in market_prices.items():
+            index = self.asset_index.get(asset)
+            if index is not None:
+                prices[index] = price
+        return prices
+
+    def calculate_portfolio_value(self, market_prices):
+        """
+        Calculate the total value of the portfolio, including cash and positions.
+
+        Parameters:
+            market_prices (dict or np.ndarray): {asset: price}, or a price vector
+                aligned with the asset index.
+
+        Returns:
+            float: Total portfolio value.
+        """
+        if isinstance(market_prices, dict):
+            market_prices = self.price_vector(market_prices)
+        return self.cash + self.positions @ np.asarray(market_prices, dtype=float)
+
+    def calculate_portfolio_values(self, price_tensor, symbols=None):
+        """
+        Value the current holdings against many price scenarios at once.
+
+        Parameters:
+            price_tensor (np.ndarray): Prices with the assets on the last axis, e.g.
+                simulated paths of shape (paths, time, assets).
+            symbols (list of str): Asset of every column of the last axis. Defaults to
+                the portfolio's own asset index; unknown assets are held at zero.
+
+        Returns:
+            np.ndarray: Portfolio values with the asset axis reduced away.
+        """
+        positions = self.positions
+        if symbols is not None:
+            positions = np.array([
+                self.positions[self.asset_index[symbol]] if symbol in self.asset_index else 0.0
+                for symbol in symbols
+            ])
+        return self.cash + np.asarray(price_tensor) @ positions
+
+    def get_position(self, asset):
+        """
+        Get the quantity held of one asset without building the positions dict.
+
+        Parameters:
+            asset (str): Name of the asset.
+
+        Returns:
+            float: Quantity held, 0 if none.
+        """
+        index = self.asset_index.get(asset)
+        return 0 if index is None else self.positions[index].item()
+
+    def get_positions(self):
+        """
+        Get the current positions in the portfolio.
+
+        Returns:
+            dict: Current non-zero positions in the portfolio: {asset: quantity}.
+        """
+        return {self.symbols[index]: self.positions[index] for index in np.flatnonzero(self.positions)}
+
+    def get_transaction_history(self):
+        """
+        Get the transaction history of the portfolio.
+
+        Returns:
+            Ledger: Columnar log of all transactions made during backtesting.
         """
         return self.transaction_history
 
+
 if __name__ == "__main__":
     portfolio = Portfolio(initial_cash=100000)
     
@@ -111,4 +420,4 @@ if __name__ == "__main__":
     print("Current Positions:", portfolio.get_positions())
 
     # Transaction history
-    print("Transaction History:", portfolio.get_transaction_history())
+    print("Transaction History:", portfolio.get_transaction_history().to_frame())
@@ -0,0 +1,313 @@
+import numpy as np
+from scipy.signal import lfilter
+
+
+def simulate_gbm_paths(out, rng, initial_value, drift, volatility):
+    """
+    Fill a preallocated buffer with geometric Brownian motion paths, in place.
+
+    Every step writes into ``out`` with ufunc ``out=`` semantics, so no temporary
+    arrays are allocated. The buffer can be reused across repeated runs.
+
+    Parameters:
+        out (np.ndarray): C-contiguous float32 or float64 buffer of shape
+            (num_paths, time_horizon + 1); column 0 receives the initial value.
+        rng (np.random.Generator): Source of the standard normal shocks.
+        initial_value (float): The starting value of every path.
+        drift (float): Expected return or mean growth rate.
+        volatility (float): Standard deviation or variability of returns.
+
+    Returns:
+        np.ndarray: The filled ``out`` buffer.
+    """
+    if not out.flags.c_contiguous:
+        # A flat view of a strided buffer would be a copy, leaving out unfilled
+        raise ValueError("out must be a C-contiguous array.")
+    # Shocks fill the contiguous buffer from its second element; column 0 is overwritten below
+    rng.standard_normal(out=out.reshape(-1)[1:], dtype=out.dtype)
+    return _gbm_from_shocks(out, initial_value, drift, volatility)
+
+
+def _gbm_from_shocks(out, initial_value, drift, volatility):
+    """
+    Turn standard normal shocks stored in ``out[:, 1:]`` into GBM paths, in place.
+
+    Parameters:
+        out (np.ndarray): Buffer of shape (num_paths, time_horizon + 1) whose columns
+            1..time_horizon hold the shocks; column 0 receives the initial value.
+        initial_value (float): The starting value of every path.
+        drift (float): Expected return or mean growth rate.
+        volatility (float): Standard deviation or variability of returns.
+
+    Returns:
+        np.ndarray: The filled ``out`` buffer.
+    """
+    time_horizon = out.shape[1] - 1
+    dt = 1 / time_horizon
+    steps = out[:, 1:]
+    np.multiply(steps, volatility * np.sqrt(dt), out=steps)
+    np.add(steps, drift * dt, out=steps)
+    return _paths_from_log_increments(out, initial_value)
+
+
+def _paths_from_log_increments(out, initial_value):
+    """
+    Compound log increments stored in ``out[:, 1:]`` into price paths, in place.
+
+    Returns:
+        np.ndarray: The filled ``out`` buffer.
+    """
+    steps = out[:, 1:]
+    np.cumsum(steps, axis=1, out=steps)
+    np.exp(steps, out=steps)
+    np.multiply(steps, initial_value, out=steps)
+    out[:, 0] = initial_value
+    return out
+
+
+class StochasticProcess:
+    """
+    Base class of the price processes simulated by MonteCarloSimulation.
+
+    A process fills a (num_paths, time_horizon + 1) buffer in place. The default
+    ``simulate`` is the shared time-stepping engine: it loops over time steps only,
+    and ``step`` advances the state of every path at once with array operations.
+    Time is measured in units of the whole horizon, so dt = 1 / time_horizon.
+    """
+
+    num_shocks = 1  # Independent standard normals drawn per path and step
+
+    def simulate(self, out, rng, initial_value):
+        """
+        Fill a preallocated buffer with simulated paths, in place.
+
+        Parameters:
+            out (np.ndarray): Buffer of shape (num_paths, time_horizon + 1); column 0
+                receives the initial value.
+            rng (np.random.Generator): Source of the random shocks.
+            initial_value (float): The starting value of every path.
+
+        Returns:
+            np.ndarray: The filled ``out`` buffer.
+        """
+        num_paths, num_times = out.shape
+        dt = 1 / (num_times - 1)
+        state = self.initial_state(initial_value, num_paths)
+        out[:, 0] = initial_value
+        for t in range(1, num_times):
+            state = self.step(state, rng.standard_normal((self.num_shocks, num_paths)), dt)
+            out[:, t] = self.observe(state)
+        return out
+
+    def initial_state(self, initial_value, num_paths):
+        """
+        State of every path at time 0.
+        """
+        raise NotImplementedError("Subclasses must implement initial_state or simulate.")
+
+    def step(self, state, shocks, dt):
+        """
+        Advance the state of every path by one time step.
+
+        Parameters:
+            state (tuple of np.ndarray): Current state, one array entry per path.
+            shocks (np.ndarray): Standard normals of shape (num_shocks, num_paths).
+            dt (float): Length of the time step.
+
+        Returns:
+            tuple of np.ndarray: The next state.
+        """
+        raise NotImplementedError("Subclasses must implement step or simulate.")
+
+    def observe(self, state):
+        """
+        Price of every path given its state.
+        """
+        return np.exp(state[0])
+
+
+class LogIncrementProcess(StochasticProcess):
+    """
+    Base class of processes with independent log-price increments.
+
+    All increments are drawn at once and compounded with a single cumulative sum,
+    so there is no loop over time steps.
+    """
+
+    def simulate(self, out, rng, initial_value):
+        steps = out[:, 1:]
+        steps[...] = self.log_increments(rng, steps.shape, 1 / steps.shape[1])
+        return _paths_from_log_increments(out, initial_value)
+
+    def log_increments(self, rng, shape, dt):
+        """
+        Draw the log-price increments.
+
+        Parameters:
+            rng (np.random.Generator): Source of the random shocks.
+            shape (tuple): (num_paths, time_horizon).
+            dt (float): Length of a time step.
+
+        Returns:
+            np.ndarray: Log increments of the given shape.
+        """
+        raise NotImplementedError("Subclasses must implement log_increments.")
+
+
+class GeometricBrownianMotion(LogIncrementProcess):
+    """
+    Geometric Brownian motion, the default process of MonteCarloSimulation.
+    """
+
+    def __init__(self, drift, volatility):
+        """
+        Parameters:
+            drift (float): Expected return or mean growth rate.
+            volatility (float): Standard deviation or variability of returns.
+        """
+        self.drift = drift
+        self.volatility = volatility
+
+    def simulate(self, out, rng, initial_value):
+        return simulate_gbm_paths(out, rng, initial_value, self.drift, self.volatility)
+
+    def log_increments(self, rng, shape, dt):
+        return self.drift * dt + self.volatility * np.sqrt(dt) * rng.standard_normal(shape)
+
+
+class MertonJumpDiffusion(LogIncrementProcess):
+    """
+    Geometric Brownian motion with compound Poisson jumps in the log price.
+    """
+
+    def __init__(self, drift, volatility, jump_intensity, jump_mean, jump_std):
+        """
+        Parameters:
+            drift (float): Drift of the diffusion part.
+            volatility (float): Volatility of the diffusion part.
+            jump_intensity (float): Expected number of jumps over the horizon.
+            jump_mean (float): Mean of the log jump size.
+            jump_std (float): Standard deviation of the log jump size.
+        """
+        self.drift = drift
+        self.volatility = volatility
+        self.jump_intensity = jump_intensity
+        self.jump_mean = jump_mean
+        self.jump_std = jump_std
+
+    def log_increments(self, rng, shape, dt):
+        # The sum of n normal jumps is normal with n times the mean and variance
+        num_jumps = rng.poisson(self.jump_intensity * dt, size=shape)
+        jumps = num_jumps * self.jump_mean + np.sqrt(num_jumps) * self.jump_std * rng.standard_normal(shape)
+        return self.drift * dt + self.volatility * np.sqrt(dt) * rng.standard_normal(shape) + jumps
+
+
+class HestonProcess(StochasticProcess):
+    """
+    Heston stochastic volatility, discretized with full-truncation Euler steps.
+    """
+
+    num_shocks = 2
+
+    def __init__(self, drift, initial_variance, mean_reversion, long_term_variance, vol_of_vol, correlation):
+        """
+        Parameters:
+            drift (float): Drift of the log price, as in GeometricBrownianMotion.
+            initial_variance (float): Variance at time 0.
+            mean_reversion (float): Speed at which the variance reverts (kappa).
+            long_term_variance (float): Level the variance reverts to (theta).
+            vol_of_vol (float): Volatility of the variance (xi).
+            correlation (float): Correlation of the price and variance shocks (rho).
+        """
+        self.drift = drift
+        self.initial_variance = initial_variance
+        self.mean_reversion = mean_reversion
+        self.long_term_variance = long_term_variance
+        self.vol_of_vol = vol_of_vol
+        self.correlation = correlation
+
+    def initial_state(self, initial_value, num_paths):
+        return np.full(num_paths, np.log(initial_value)), np.full(num_paths, float(self.initial_variance))
+
+    def step(self, state, shocks, dt):
+        log_price, variance = state
+        positive = np.maximum(variance, 0)
+        diffusion = np.sqrt(positive * dt)
+        variance_shock = self.correlation * shocks[0] + np.sqrt(1 - self.correlation**2) * shocks[1]
+        log_price = log_price + self.drift * dt + diffusion * shocks[0]
+        variance = (variance + self.mean_reversion * (self.long_term_variance - positive) * dt
+                    + self.vol_of_vol * diffusion * variance_shock)
+        return log_price, variance
+
+
+class Garch11Process(StochasticProcess):
+    """
+    Log returns with GARCH(1,1) conditional variance.
+
+    Unlike the continuous-time processes, the parameters are per time step:
+    r_t = mean_return + sqrt(h_t) z_t and h_{t+1} = omega + alpha (r_t - mean_return)^2 + beta h_t.
+    """
+
+    def __init__(self, mean_return, omega, alpha, beta, initial_variance=None):
+        """
+        Parameters:
+            mean_return (float): Mean log return per step.
+            omega (float): Constant term of the variance recursion.
+            alpha (float): Weight of the last squared shock.
+            beta (float): Weight of the last variance.
+            initial_variance (float): Variance of the first step. Defaults to the
+                unconditional variance omega / (1 - alpha - beta).
+        """
+        if initial_variance is None:
+            if alpha + beta >= 1:
+                raise ValueError("alpha + beta must be below 1 for an unconditional variance to exist.")
+            initial_variance = omega / (1 - alpha - beta)
+        self.mean_return = mean_return
+        self.omega = omega
+        self.alpha = alpha
+        self.beta = beta
+        self.initial_variance = initial_variance
+
+    def initial_state(self, initial_value, num_paths):
+        return np.full(num_paths, np.log(initial_value)), np.full(num_paths, float(self.initial_variance))
+
+    def step(self, state, shocks, dt):
+        log_price, variance = state
+        innovation = np.sqrt(variance) * shocks[0]
+        return log_price + self.mean_return + innovation, self.omega + self.alpha * innovation**2 + self.beta * variance
+
+
+class OrnsteinUhlenbeckProcess(StochasticProcess):
+    """
+    Mean-reverting Ornstein-Uhlenbeck process in levels, e.g. for rates or spreads.
+
+    Uses the exact discretization x_{t+1} = mean + a (x_t - mean) + s z_t, a linear
+    recursion that is solved along the time axis with one lfilter call.
+    """
+
+    def __init__(self, mean_reversion, long_term_mean, volatility):
+        """
+        Parameters:
+            mean_reversion (float): Speed of mean reversion (theta).
+            long_term_mean (float): Level the process reverts to (mu).
+            volatility (float): Instantaneous volatility (sigma).
+        """
+        self.mean_reversion = mean_reversion
+        self.long_term_mean = long_term_mean
+        self.volatility = volatility
+
+    def simulate(self, out, rng, initial_value):
+        num_paths, num_times = out.shape
+        dt = 1 / (num_times - 1)
+        decay = np.exp(-self.mean_reversion * dt)
+        if self.mean_reversion > 0:
+            noise_std = self.volatility * np.sqrt((1 - decay**2) / (2 * self.mean_reversion))
+        else:
+            noise_std = self.volatility * np.sqrt(dt)
+
+        noise = noise_std * rng.standard_normal((num_paths, num_times - 1))
+        initial = np.full((num_paths, 1), decay * (initial_value - self.long_term_mean))
+        out[:, 1:], _ = lfilter([1.0], [1.0, -decay], noise, axis=1, zi=initial)
+        out[:, 1:] += self.long_term_mean
+        out[:, 0] = initial_value
+        return out
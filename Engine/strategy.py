@@ -1,3 +1,89 @@
+import numpy as np
+import pandas as pd
+
+from Utils.indicators import rolling_mean
+
+# Integer signal codes used by the vectorized execution paths.
+BUY = 1
+SELL = -1
+HOLD = 0
+
+_SIGNAL_CODES = {"buy": BUY, "sell": SELL}
+
+
+def encode_signal(signal):
+    """
+    Convert a generate_signal result ('buy', 'sell' or None) to its signal code.
+
+    Returns:
+        int: BUY, SELL or HOLD.
+    """
+    return _SIGNAL_CODES.get(signal, HOLD)
+
+
+def encode_signals(buy, sell):
+    """
+    Combine boolean buy/sell masks into an integer signal array.
+
+    Parameters:
+        buy (np.ndarray): Boolean mask of bars with a buy signal.
+        sell (np.ndarray): Boolean mask of bars with a sell signal.
+
+    Returns:
+        np.ndarray: Signal codes (BUY, SELL or HOLD). Buy takes precedence, as in generate_signal.
+    """
+    return np.select([buy, sell], [BUY, SELL], HOLD).astype(np.int8)
+
+
+def signals_from_rows(strategy, data):
+    """
+    Build a signal array by calling ``strategy.generate_signal`` on every row.
+
+    This is the slow fallback for strategies that do not provide a vectorized
+    ``generate_signals`` implementation.
+
+    Parameters:
+        strategy (object): Object with a ``generate_signal(row)`` method.
+        data (pd.DataFrame): Market data, one row per bar.
+
+    Returns:
+        np.ndarray: Signal codes (BUY, SELL or HOLD), one per row.
+    """
+    return np.fromiter(
+        (encode_signal(strategy.generate_signal(row)) for _, row in data.iterrows()),
+        dtype=np.int8,
+        count=len(data),
+    )
+
+
+def _signals_per_path(generate_signals, prices):
+    """
+    Run a DataFrame signal generator on every path of a panel, each wrapped with a "close" column.
+    """
+    return np.array([generate_signals(pd.DataFrame({"close": path})) for path in prices], dtype=np.int8)
+
+
+def panel_signals(strategy, prices):
+    """
+    Generate signals for every path of a (paths, time) price panel.
+
+    Uses ``strategy.generate_panel_signals`` when available; otherwise each path is
+    wrapped in a DataFrame with a "close" column and passed to generate_signals.
+
+    Parameters:
+        strategy (object): Strategy object.
+        prices (np.ndarray): Close prices of shape (paths, time).
+
+    Returns:
+        np.ndarray: Signal codes of shape (paths, time).
+    """
+    generate_panel_signals = getattr(strategy, "generate_panel_signals", None)
+    if generate_panel_signals is not None:
+        return generate_panel_signals(prices)
+    generate_signals = getattr(strategy, "generate_signals", None) or (lambda data: signals_from_rows(strategy, data))
+    return _signals_per_path(generate_signals, prices)
+
+
 class Strategy:
     """
     Base class for trading strategies.
@@ -15,6 +101,36 @@ class Strategy:
         """
         raise NotImplementedError("Subclasses must implement the generate_signal method.")
 
+    def generate_signals(self, data):
+        """
+        Generate trading signals for every bar at once.
+
+        Subclasses should override this with a vectorized implementation; the
+        default falls back to calling generate_signal row by row.
+
+        Parameters:
+            data (pd.DataFrame): Market data, one row per bar.
+
+        Returns:
+            np.ndarray: Signal codes (BUY, SELL or HOLD), one per row.
+        """
+        return signals_from_rows(self, data)
+
+    def generate_panel_signals(self, prices):
+        """
+        Generate trading signals for a panel of price paths at once.
+
+        Subclasses should override this with a vectorized implementation; the
+        default runs generate_signals on each path.
+
+        Parameters:
+            prices (np.ndarray): Close prices of shape (paths, time).
+
+        Returns:
+            np.ndarray: Signal codes of shape (paths, time).
+        """
+        return _signals_per_path(self.generate_signals, prices)
+
 
 class MovingAverageCrossoverStrategy(Strategy):
     """
@@ -54,6 +170,36 @@ class MovingAverageCrossoverStrategy(Strategy):
         else:
             return None
 
+    def generate_signals(self, data):
+        """
+        Generate moving average crossover signals for every bar at once.
+
+        Parameters:
+            data (pd.DataFrame): Market data with moving average columns.
+
+        Returns:
+            np.ndarray: Signal codes (BUY, SELL or HOLD), one per row.
+        """
+        short_ma = data[f"short_ma_{self.short_window}"].to_numpy(dtype=float)
+        long_ma = data[f"long_ma_{self.long_window}"].to_numpy(dtype=float)
+        return encode_signals(short_ma > long_ma, short_ma < long_ma)
+
+    def generate_panel_signals(self, prices):
+        """
+        Generate moving average crossover signals for a panel of price paths.
+
+        The moving averages are computed along the time axis of every path.
+
+        Parameters:
+            prices (np.ndarray): Close prices of shape (paths, time).
+
+        Returns:
+            np.ndarray: Signal codes of shape (paths, time).
+        """
+        short_ma = rolling_mean(prices, self.short_window)
+        long_ma = rolling_mean(prices, self.long_window)
+        return encode_signals(short_ma > long_ma, short_ma < long_ma)
+
 
 class ThresholdStrategy(Strategy):
     """
@@ -92,7 +238,30 @@ class ThresholdStrategy(Strategy):
         else:
             return None
 
-import pandas as pd
+    def generate_signals(self, data):
+        """
+        Generate price threshold signals for every bar at once.
+
+        Parameters:
+            data (pd.DataFrame): Market data with a "close" column.
+
+        Returns:
+            np.ndarray: Signal codes (BUY, SELL or HOLD), one per row.
+        """
+        price = data["close"].to_numpy(dtype=float)
+        return encode_signals(price < self.lower_threshold, price > self.upper_threshold)
+
+    def generate_panel_signals(self, prices):
+        """
+        Generate price threshold signals for a panel of price paths.
+
+        Parameters:
+            prices (np.ndarray): Close prices of shape (paths, time).
+
+        Returns:
+            np.ndarray: Signal codes of shape (paths, time).
+        """
+        return encode_signals(prices < self.lower_threshold, prices > self.upper_threshold)
 
 # Sample historical data with moving averages
 data = pd.DataFrame({
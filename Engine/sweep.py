@@ -0,0 +1,107 @@
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+from Utils.indicators import Indicators
+from Utils.metrics import Metrics
+
+from .execution import execute_signals
+from .strategy import encode_signals
+
+
+class ParameterSweep:
+    """
+    A class to evaluate a strategy over a grid of parameters in batched array computations.
+    """
+
+    def __init__(self, historical_data, initial_cash=100000, batch_size=1000, warmup=0, execution_model=None):
+        """
+        Initialize the ParameterSweep.
+
+        Parameters:
+            historical_data (pd.DataFrame): Historical price data with a "close" column.
+            initial_cash (float): Starting cash for every backtest.
+            batch_size (int): Number of parameter combinations evaluated per 2-D batch.
+            warmup (int): Leading bars that only feed the indicators; trading and
+                metrics start after them.
+            execution_model (ExecutionModel): Transaction costs and position sizing
+                applied to every backtest. Defaults to one share per signal without costs.
+        """
+        self.historical_data = historical_data
+        self.initial_cash = initial_cash
+        self.batch_size = batch_size
+        self.warmup = warmup
+        self.execution_model = execution_model
+
+    def moving_average_crossover(self, short_windows, long_windows):
+        """
+        Sweep MovingAverageCrossoverStrategy over every (short_window, long_window) pair.
+
+        Each distinct rolling window is computed once and shared by all combinations.
+
+        Parameters:
+            short_windows (iterable of int): Candidate short-term lookback periods.
+            long_windows (iterable of int): Candidate long-term lookback periods.
+
+        Returns:
+            pd.DataFrame: One row per combination with its parameters and metrics.
+        """
+        grid = pd.DataFrame(list(product(short_windows, long_windows)), columns=["short_window", "long_window"])
+        indicators = Indicators(self.historical_data["close"].to_numpy(dtype=float))
+        windows = np.unique(grid.to_numpy())
+        moving_averages = np.array([indicators.sma(window) for window in windows])
+        short_rows = np.searchsorted(windows, grid["short_window"].to_numpy())
+        long_rows = np.searchsorted(windows, grid["long_window"].to_numpy())
+
+        def signals(batch):
+            short_ma = moving_averages[short_rows[batch]]
+            long_ma = moving_averages[long_rows[batch]]
+            return encode_signals(short_ma > long_ma, short_ma < long_ma)
+
+        return self._evaluate(grid, signals)
+
+    def threshold(self, lower_thresholds, upper_thresholds):
+        """
+        Sweep ThresholdStrategy over every (lower_threshold, upper_threshold) pair.
+
+        Parameters:
+            lower_thresholds (iterable of float): Candidate buy thresholds.
+            upper_thresholds (iterable of float): Candidate sell thresholds.
+
+        Returns:
+            pd.DataFrame: One row per combination with its parameters and metrics.
+        """
+        grid = pd.DataFrame(
+            list(product(lower_thresholds, upper_thresholds)), columns=["lower_threshold", "upper_threshold"]
+        )
+        price = self.historical_data["close"].to_numpy(dtype=float)
+        lower = grid["lower_threshold"].to_numpy(dtype=float)
+        upper = grid["upper_threshold"].to_numpy(dtype=float)
+
+        def signals(batch):
+            return encode_signals(price < lower[batch, None], price > upper[batch, None])
+
+        return self._evaluate(grid, signals)
+
+    def _evaluate(self, grid, signals):
+        """
+        Backtest every combination of the grid in batches and collect the metrics.
+
+        Parameters:
+            grid (pd.DataFrame): Parameter combinations, one per row.
+            signals (callable): Maps a slice of grid rows to a 2-D signal array.
+
+        Returns:
+            pd.DataFrame: The grid with one column per metric appended.
+        """
+        close = self.historical_data["close"].to_numpy(dtype=float)[self.warmup:]
+        portfolio_values = np.empty((len(grid), len(close)))
+        for start in range(0, len(grid), self.batch_size):
+            batch = slice(start, start + self.batch_size)
+            _, _, portfolio_values[batch] = execute_signals(signals(batch)[:, self.warmup:], close, self.initial_cash,
+                                                            execution_model=self.execution_model)
+
+        metrics = pd.DataFrame(Metrics.calculate_batch_metrics(portfolio_values), index=grid.index)
+        metrics.insert(0, "final_value", portfolio_values[:, -1])
+        return pd.concat([grid, metrics], axis=1)
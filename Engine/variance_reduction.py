@@ -0,0 +1,154 @@
+from statistics import NormalDist
+
+import numpy as np
+
+VARIANCE_REDUCTION_METHODS = ("plain", "antithetic", "control_variate", "moment_matching", "sobol")
+
+
+def antithetic_normals(rng, num_paths, num_steps):
+    """
+    Standard normal shocks in antithetic pairs: row i + half is the negation of row i.
+
+    Parameters:
+        rng (np.random.Generator): Source of the normals.
+        num_paths (int): Number of paths (rounded up to an even number).
+        num_steps (int): Number of time steps.
+
+    Returns:
+        np.ndarray: Shocks of shape (2 * ceil(num_paths / 2), num_steps).
+    """
+    half = rng.standard_normal((-(-num_paths // 2), num_steps))
+    return np.concatenate([half, -half])
+
+
+def moment_matched_normals(rng, num_paths, num_steps):
+    """
+    Standard normal shocks rescaled so every time step has sample mean 0 and std 1.
+
+    Parameters:
+        rng (np.random.Generator): Source of the normals.
+        num_paths (int): Number of paths.
+        num_steps (int): Number of time steps.
+
+    Returns:
+        np.ndarray: Shocks of shape (num_paths, num_steps).
+    """
+    shocks = rng.standard_normal((num_paths, num_steps))
+    shocks -= shocks.mean(axis=0)
+    shocks /= shocks.std(axis=0)
+    return shocks
+
+
+def sobol_normals(num_paths, num_steps, seed=None):
+    """
+    Scrambled Sobol points mapped to normals and ordered with a Brownian bridge.
+
+    The first Sobol coordinates, which are the most uniform, set the terminal
+    value and the coarse shape of each path; the returned per-step increments
+    are standard normal.
+
+    Parameters:
+        num_paths (int): Number of paths; powers of two keep the Sobol balance.
+        num_steps (int): Number of time steps (Sobol dimension).
+        seed (int or np.random.SeedSequence): Seed of the scrambling.
+
+    Returns:
+        np.ndarray: Shocks of shape (num_paths, num_steps).
+    """
+    from scipy.special import ndtri
+    from scipy.stats import qmc
+
+    uniforms = qmc.Sobol(d=num_steps, scramble=True, seed=np.random.default_rng(seed)).random(num_paths)
+    return brownian_bridge_increments(ndtri(np.clip(uniforms, 1e-12, 1 - 1e-12)))
+
+
+def _bridge_schedule(num_steps):
+    """
+    Construction order and weights of a Brownian bridge on times 1, ..., num_steps.
+
+    Returns:
+        tuple: (bridge, left, right, left_weight, right_weight, std_dev) arrays.
+    """
+    times = np.arange(1, num_steps + 1, dtype=float)
+    mapped = np.zeros(num_steps, dtype=bool)
+    bridge = np.zeros(num_steps, dtype=np.intp)
+    left = np.zeros(num_steps, dtype=np.intp)
+    right = np.zeros(num_steps, dtype=np.intp)
+    left_weight = np.zeros(num_steps)
+    right_weight = np.zeros(num_steps)
+    std_dev = np.zeros(num_steps)
+
+    mapped[-1] = True
+    bridge[0] = num_steps - 1
+    std_dev[0] = np.sqrt(times[-1])
+    j = 0
+    for i in range(1, num_steps):
+        while mapped[j]:
+            j += 1
+        k = j
+        while not mapped[k]:
+            k += 1
+        point = j + ((k - 1 - j) >> 1)
+        mapped[point] = True
+        bridge[i], left[i], right[i] = point, j, k
+        start = times[j - 1] if j else 0.0
+        left_weight[i] = (times[k] - times[point]) / (times[k] - start)
+        right_weight[i] = (times[point] - start) / (times[k] - start)
+        std_dev[i] = np.sqrt((times[point] - start) * (times[k] - times[point]) / (times[k] - start))
+        j = k + 1
+        if j >= num_steps:
+            j = 0
+    return bridge, left, right, left_weight, right_weight, std_dev
+
+
+def brownian_bridge_increments(normals):
+    """
+    Turn independent normals into Brownian increments via Brownian-bridge construction.
+
+    Parameters:
+        normals (np.ndarray): Independent standard normals of shape (num_paths, num_steps),
+            in order of importance.
+
+    Returns:
+        np.ndarray: Standard normal increments of shape (num_paths, num_steps).
+    """
+    num_steps = normals.shape[1]
+    bridge, left, right, left_weight, right_weight, std_dev = _bridge_schedule(num_steps)
+    path = np.empty_like(normals)
+    path[:, -1] = std_dev[0] * normals[:, 0]
+    for i in range(1, num_steps):
+        value = right_weight[i] * path[:, right[i]] + std_dev[i] * normals[:, i]
+        if left[i]:
+            value += left_weight[i] * path[:, left[i] - 1]
+        path[:, bridge[i]] = value
+    return np.diff(path, axis=1, prepend=0.0)
+
+
+def summarize_estimate(samples, values, confidence=0.95):
+    """
+    Point estimate, confidence interval and effective sample size.
+
+    Parameters:
+        samples (np.ndarray): Independent, identically distributed estimates whose
+            mean is the estimator (per-path values, antithetic pair means, or
+            replicate means).
+        values (np.ndarray): Raw per-path values, used to find how many plain Monte
+            Carlo paths would give the same standard error.
+        confidence (float): Confidence level of the interval.
+
+    Returns:
+        dict: estimate, std_error, ci_low, ci_high, effective_sample_size, num_paths.
+    """
+    estimate = np.mean(samples)
+    std_error = np.std(samples, ddof=1) / np.sqrt(len(samples))
+    half_width = NormalDist().inv_cdf((1 + confidence) / 2) * std_error
+    with np.errstate(divide="ignore"):
+        effective_sample_size = np.var(values, ddof=1) / std_error**2
+    return {
+        "estimate": estimate,
+        "std_error": std_error,
+        "ci_low": estimate - half_width,
+        "ci_high": estimate + half_width,
+        "effective_sample_size": effective_sample_size,
+        "num_paths": len(values),
+    }
@@ -0,0 +1,167 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from Utils.price_panel import PricePanel
+
+from .sweep import ParameterSweep
+
+
+def _evaluate_window(prices, window, sweep_name, grid, initial_cash, objective, batch_size, execution_model=None):
+    """
+    Sweep the train window, then backtest the best parameters on the test window.
+
+    Module-level so that it can be sent to worker processes.
+
+    Parameters:
+        prices (np.ndarray or PricePanel): Close prices, or a panel with a "close"
+            column that workers reattach to instead of receiving a pickled copy.
+        window (tuple): (train_start, train_stop, test_stop) bar positions.
+        sweep_name (str): ParameterSweep method, e.g. "moving_average_crossover".
+        grid (tuple): Candidate values of each parameter, passed to the sweep method.
+        initial_cash (float): Starting cash of every backtest.
+        objective (str): Metric column maximized on the train window.
+        batch_size (int): Number of parameter combinations evaluated per 2-D batch.
+        execution_model (ExecutionModel): Transaction costs and position sizing.
+
+    Returns:
+        tuple: (chosen parameters as a dict, train objective, test metrics as a dict).
+    """
+    if isinstance(prices, PricePanel):
+        prices = prices["close"]
+    train_start, train_stop, test_stop = window
+
+    train = pd.DataFrame({"close": prices[train_start:train_stop]})
+    results = getattr(ParameterSweep(train, initial_cash, batch_size, execution_model=execution_model), sweep_name)(*grid)
+    best = int(np.argmax(results[objective].fillna(-np.inf).to_numpy()))
+    parameters = {name: results[name].iloc[best] for name in results.columns[:len(grid)]}
+
+    # The train window supplies the indicator history of the test window
+    history = pd.DataFrame({"close": prices[train_start:test_stop]})
+    test_sweep = ParameterSweep(history, initial_cash, batch_size, warmup=train_stop - train_start,
+                                execution_model=execution_model)
+    test = getattr(test_sweep, sweep_name)(*([value] for value in parameters.values())).iloc[0, len(grid):]
+    return parameters, results[objective].iloc[best], test.to_dict()
+
+
+class WalkForward:
+    """
+    A class to run walk-forward optimization over train/test windows of price history.
+
+    Every train window is swept with ParameterSweep; the parameters that maximize
+    the objective are then backtested on the following test window. Windows are
+    independent and can run on a process pool; the close prices are placed once
+    in a shared PricePanel that every worker maps instead of receiving a copy.
+    """
+
+    def __init__(self, historical_data, train_size, test_size, step=None, anchored=False,
+                 initial_cash=100000, objective="sharpe_ratio", batch_size=1000, execution_model=None):
+        """
+        Initialize the WalkForward orchestrator.
+
+        Parameters:
+            historical_data (pd.DataFrame): Historical price data with a "close" column.
+            train_size (int): Bars per train window.
+            test_size (int): Bars per test window.
+            step (int): Bars between consecutive windows. Defaults to test_size, so
+                test windows tile the history without overlap.
+            anchored (bool): If True, every train window starts at the first bar and grows.
+            initial_cash (float): Starting cash of every backtest.
+            objective (str): Metric column of ParameterSweep maximized on each train window.
+            batch_size (int): Number of parameter combinations evaluated per 2-D batch.
+            execution_model (ExecutionModel): Transaction costs and position sizing
+                applied in every window.
+        """
+        self.historical_data = historical_data
+        self.train_size = train_size
+        self.test_size = test_size
+        self.step = step if step is not None else test_size
+        self.anchored = anchored
+        self.initial_cash = initial_cash
+        self.objective = objective
+        self.batch_size = batch_size
+        self.execution_model = execution_model
+
+    def windows(self):
+        """
+        Bar positions of every train/test split.
+
+        Returns:
+            list: (train_start, train_stop, test_stop) for every window; the test
+                window is [train_stop, test_stop).
+        """
+        num_bars = len(self.historical_data)
+        windows = []
+        for train_stop in range(self.train_size, num_bars, self.step):
+            train_start = 0 if self.anchored else train_stop - self.train_size
+            windows.append((train_start, train_stop, min(train_stop + self.test_size, num_bars)))
+        return windows
+
+    def moving_average_crossover(self, short_windows, long_windows, workers=None):
+        """
+        Walk forward MovingAverageCrossoverStrategy.
+
+        Parameters:
+            short_windows (iterable of int): Candidate short-term lookback periods.
+            long_windows (iterable of int): Candidate long-term lookback periods.
+            workers (int): Number of worker processes. None or 1 runs in this process.
+
+        Returns:
+            pd.DataFrame: One row per window; see run.
+        """
+        return self.run("moving_average_crossover", (list(short_windows), list(long_windows)), workers)
+
+    def threshold(self, lower_thresholds, upper_thresholds, workers=None):
+        """
+        Walk forward ThresholdStrategy.
+
+        Parameters:
+            lower_thresholds (iterable of float): Candidate buy thresholds.
+            upper_thresholds (iterable of float): Candidate sell thresholds.
+            workers (int): Number of worker processes. None or 1 runs in this process.
+
+        Returns:
+            pd.DataFrame: One row per window; see run.
+        """
+        return self.run("threshold", (list(lower_thresholds), list(upper_thresholds)), workers)
+
+    def run(self, sweep_name, grid, workers=None):
+        """
+        Optimize on every train window and evaluate on the following test window.
+
+        Parameters:
+            sweep_name (str): ParameterSweep method to run on every window.
+            grid (tuple): Candidate values of each parameter of the sweep method.
+            workers (int): Number of worker processes. None or 1 runs in this process.
+
+        Returns:
+            pd.DataFrame: One row per window with its train and test dates, the
+                chosen parameters, the train objective ("train_<objective>") and the
+                test metrics.
+        """
+        windows = self.windows()
+        close = self.historical_data["close"].to_numpy(dtype=float)
+        options = (sweep_name, grid, self.initial_cash, self.objective, self.batch_size, self.execution_model)
+
+        if workers is None or workers <= 1 or len(windows) <= 1:
+            results = [_evaluate_window(close, window, *options) for window in windows]
+        else:
+            with PricePanel({"close": close}) as panel, ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_evaluate_window, panel, window, *options) for window in windows]
+                results = [future.result() for future in futures]
+
+        index = self.historical_data.index
+        rows = []
+        for (train_start, train_stop, test_stop), (parameters, train_objective, test) in zip(windows, results):
+            row = {
+                "train_start": index[train_start],
+                "train_end": index[train_stop - 1],
+                "test_start": index[train_stop],
+                "test_end": index[test_stop - 1],
+            }
+            row.update(parameters)
+            row[f"train_{self.objective}"] = train_objective
+            row.update(test)
+            rows.append(row)
+        return pd.DataFrame(rows)
@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+from Engine.portfolio import ArrayPortfolio
+
+
+class TestArrayPortfolio(unittest.TestCase):
+    """
+    Unit tests for the NumPy-backed ArrayPortfolio.
+    """
+
+    def setUp(self):
+        self.portfolio = ArrayPortfolio(symbols=["AAPL", "GOOGL", "MSFT"], initial_cash=10000)
+
+    def test_buy_and_sell(self):
+        self.portfolio.buy(asset="AAPL", price=150, quantity=10, date="2025-03-14")
+        self.portfolio.sell(asset="AAPL", price=155, quantity=5, date="2025-03-15")
+        self.assertEqual(self.portfolio.get_positions(), {"AAPL": 5})
+        self.assertEqual(self.portfolio.cash, 10000 - 150 * 10 + 155 * 5)
+
+    def test_buy_many_fills_while_cash_lasts(self):
+        filled = self.portfolio.buy_many(["AAPL", "MSFT", "GOOGL", "AAPL"], [100, 200, 3000, 100], [10, 5, 3, 1], "2025-03-14")
+        np.testing.assert_array_equal(filled, [True, True, False, False])
+        np.testing.assert_array_equal(self.portfolio.positions, [10, 0, 5])
+        self.assertEqual(self.portfolio.cash, 10000 - 1000 - 1000)
+
+    def test_sell_many_rejects_oversized_assets(self):
+        self.portfolio.buy_many(np.array([0, 2]), [100, 200], [10, 5], "2025-03-14")
+        filled = self.portfolio.sell_many(["AAPL", "MSFT", "MSFT"], [110, 210, 210], [4, 3, 3], "2025-03-15")
+        np.testing.assert_array_equal(filled, [True, False, False])
+        np.testing.assert_array_equal(self.portfolio.positions, [6, 0, 5])
+        self.assertEqual(len(self.portfolio.get_transaction_history()), 3)
+
+    def test_invalid_orders_are_rejected(self):
+        filled = self.portfolio.buy_many(["AAPL", "GOOGL", "MSFT"], [10, 1, -5], [10, -50, 2], "2025-03-14")
+        np.testing.assert_array_equal(filled, [True, False, False])
+        np.testing.assert_array_equal(self.portfolio.positions, [10, 0, 0])
+        self.assertEqual(self.portfolio.cash, 10000 - 100)
+        filled = self.portfolio.sell_many(["AAPL", "AAPL"], [10, 10], [-5, 0], "2025-03-15")
+        np.testing.assert_array_equal(filled, [False, False])
+        self.assertFalse(self.portfolio.buy("MSFT", 1, -50, "2025-03-15"))
+        self.assertFalse(self.portfolio.sell("AAPL", 10, -5, "2025-03-15"))
+        self.assertFalse(self.portfolio.buy("MSFT", -1, 50, "2025-03-15"))
+        np.testing.assert_array_equal(self.portfolio.positions, [10, 0, 0])
+        self.assertEqual(self.portfolio.cash, 10000 - 100)
+
+    def test_portfolio_value(self):
+        self.portfolio.buy_many(["AAPL", "MSFT"], [100, 200], [10, 5], "2025-03-14")
+        expected = self.portfolio.cash + 10 * 120 + 5 * 190
+        self.assertEqual(self.portfolio.calculate_portfolio_value({"AAPL": 120, "MSFT": 190}), expected)
+        self.assertEqual(self.portfolio.calculate_portfolio_value(np.array([120, 2800, 190])), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+import pandas as pd
+from Engine.backtester import Backtester
+from Engine.batch_backtester import BatchBacktester
+from Engine.events import NullSink
+from Engine.Monte_carlo import MonteCarloSimulation
+from Engine.strategy import MovingAverageCrossoverStrategy, ThresholdStrategy
+from Utils.data_loader import DataLoader
+
+
+class TestBatchBacktester(unittest.TestCase):
+    """
+    Unit tests for backtesting strategies over batched price panels.
+    """
+
+    def setUp(self):
+        self.paths = MonteCarloSimulation(100, 12, 60, 0.05, 0.3, seed=9, chunk_size=5).run_simulation()
+
+    def assert_matches_backtester(self, strategy, prepare=lambda data: data):
+        batch = BatchBacktester(self.paths, strategy, initial_cash=500, batch_size=5)
+        values = batch.run()
+        for row, path in enumerate(self.paths):
+            data = prepare(pd.DataFrame({"close": path}))
+            backtester = Backtester(data, strategy, initial_cash=500, sink=NullSink())
+            backtester.run()
+            np.testing.assert_array_equal(values[row], backtester.results()["portfolio_value"])
+            self.assertEqual(batch.positions[row], backtester.position)
+
+    def test_threshold_strategy_matches_backtester(self):
+        self.assert_matches_backtester(ThresholdStrategy(95, 105))
+
+    def test_moving_average_strategy_matches_backtester(self):
+        self.assert_matches_backtester(
+            MovingAverageCrossoverStrategy(3, 10), lambda data: DataLoader.add_moving_averages(data, 3, 10)
+        )
+
+    def test_pnl_distribution(self):
+        batch = BatchBacktester(self.paths, ThresholdStrategy(95, 105), initial_cash=500)
+        batch.run()
+        pnl = batch.pnl_distribution()
+        self.assertEqual(pnl.shape, (12,))
+        self.assertEqual(batch.summarize_pnl()["max"], pnl.max())
+        self.assertEqual(len(batch.metrics()), 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import numpy as np
+import pandas as pd
+from Engine.backtester import Backtester
+from Engine.bootstrap import ReturnBootstrap
+from Engine.events import NullSink
+from Engine.strategy import ThresholdStrategy
+
+
+class TestReturnBootstrap(unittest.TestCase):
+    """
+    Unit tests for bootstrap resampling of backtest equity curves.
+    """
+
+    def setUp(self):
+        self.returns = np.random.default_rng(0).normal(0.001, 0.01, 250)
+        self.bootstrap = ReturnBootstrap(self.returns, initial_value=1000, seed=1)
+
+    def test_index_shapes_and_range(self):
+        for method in ("iid", "stationary", "circular"):
+            indices = self.bootstrap.sample_indices(40, length=100, method=method, block_size=10)
+            self.assertEqual(indices.shape, (40, 100))
+            self.assertTrue(np.all((indices >= 0) & (indices < 250)))
+
+    def test_circular_blocks_are_consecutive(self):
+        indices = self.bootstrap.sample_indices(5, length=30, method="circular", block_size=10)
+        steps = np.diff(indices, axis=1) % 250
+        np.testing.assert_array_equal(np.delete(steps, [9, 19], axis=1), 1)
+
+    def test_stationary_mean_block_length(self):
+        indices = self.bootstrap.sample_indices(200, length=250, method="stationary", block_size=10)
+        breaks = np.mean((np.diff(indices, axis=1) % 250) != 1)
+        self.assertAlmostEqual(1 / breaks, 10, delta=1)
+
+    def test_equity_curves_and_metrics(self):
+        curves = self.bootstrap.equity_curves(50, method="iid")
+        self.assertEqual(curves.shape, (50, 251))
+        self.assertTrue(np.all(curves[:, 0] == 1000))
+        distributions = self.bootstrap.metric_distributions(50, method="circular")
+        self.assertEqual(len(distributions), 50)
+        self.assertIn("sharpe_ratio", distributions.columns)
+
+    def test_from_backtest(self):
+        data = pd.DataFrame({"close": 100 + np.cumsum(self.returns * 100)}, index=pd.date_range("2025-01-01", periods=250))
+        backtester = Backtester(data, ThresholdStrategy(99, 103), initial_cash=1000, sink=NullSink())
+        backtester.run(vectorized=True)
+        bootstrap = ReturnBootstrap.from_backtest(backtester.results(), seed=3)
+        self.assertEqual(len(bootstrap.returns), 249)
+        self.assertEqual(bootstrap.initial_value, 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import numpy as np
+from Engine.cash_flow_analysis import (
+    Loan,
+    bond_cash_flows,
+    bond_duration_convexity,
+    irr,
+    npv,
+    price_bond,
+    price_bonds,
+    solve_irr,
+    solve_yield_to_maturity,
+)
+
+
+class TestCashFlowAnalysis(unittest.TestCase):
+    """
+    Unit tests for the vectorized fixed-income analytics.
+    """
+
+    def test_price_bonds_matches_scalar_formula(self):
+        def reference(face, coupon, ytm, periods, frequency):
+            discount = [(1 + ytm / frequency) ** -i for i in range(1, periods + 1)]
+            return sum(coupon / frequency * face * d for d in discount) + face * discount[-1]
+
+        face = np.array([1000, 500, 100])
+        coupon = np.array([0.05, 0.0, 0.08])
+        ytm = np.array([0.06, 0.03, 0.08])
+        periods = np.array([20, 7, 4])
+        frequency = np.array([2, 1, 4])
+        expected = [reference(*bond) for bond in zip(face, coupon, ytm, periods, frequency)]
+        np.testing.assert_allclose(price_bonds(face, coupon, ytm, periods, frequency), expected)
+        self.assertAlmostEqual(price_bond(1000, 0.08, 0.08, 4, 4), 1000)
+        self.assertEqual(bond_cash_flows(face, coupon, periods, frequency).shape, (3, 21))
+
+    def test_duration_and_convexity_match_finite_differences(self):
+        measures = bond_duration_convexity(1000, 0.05, 0.06, 20)
+        step = 1e-5
+        up, down = price_bond(1000, 0.05, 0.06 + step, 20), price_bond(1000, 0.05, 0.06 - step, 20)
+        price = measures["price"][0]
+        self.assertAlmostEqual(measures["modified_duration"][0], -(up - down) / (2 * step) / price, places=5)
+        self.assertAlmostEqual(measures["convexity"][0], (up - 2 * price + down) / step**2 / price, places=2)
+        self.assertAlmostEqual(measures["macaulay_duration"][0], measures["modified_duration"][0] * 1.03)
+
+        zero = bond_duration_convexity(100, 0.0, 0.04, 10, 1)
+        self.assertAlmostEqual(zero["macaulay_duration"][0], 10)
+
+    def test_npv_and_irr(self):
+        cash_flows = np.array([[-100, 10, 10, 110], [-100, 0, 0, 133.1], [100, 10, 10, 10]])
+        self.assertAlmostEqual(npv(0.1, cash_flows[0]), 0, places=10)
+        np.testing.assert_allclose(irr(cash_flows), [0.1, 0.1, np.nan], atol=1e-9)
+
+    def test_solver_reports_convergence_status(self):
+        cash_flows = np.array([[-100, 10, 10, 110], [-100, 0, 0, 133.1], [100, 10, 10, 10], [-100, 230, -132, 0]])
+        result = solve_irr(cash_flows)
+        np.testing.assert_allclose(result["rate"][:2], [0.1, 0.1], atol=1e-10)
+        np.testing.assert_array_equal(result["converged"], [True, True, False, False])
+        np.testing.assert_array_equal(result["bracketed"], [True, True, False, False])
+        self.assertTrue(np.isnan(result["rate"][2:]).all())
+        # Both roots (10% and 20%) lie inside a narrower bracket around one of them
+        self.assertAlmostEqual(solve_irr(cash_flows[3], low=0.15, high=0.5)["rate"], 0.2, places=10)
+
+    def test_yield_to_maturity_recovers_pricing_yield(self):
+        rng = np.random.default_rng(0)
+        num_bonds = 5000
+        face = rng.uniform(100, 1000, num_bonds)
+        coupon = rng.uniform(0, 0.1, num_bonds)
+        ytm = rng.uniform(0.0, 0.15, num_bonds)
+        periods = rng.integers(1, 61, num_bonds)
+        frequency = rng.choice([1, 2, 4], num_bonds)
+        price = price_bonds(face, coupon, ytm, periods, frequency)
+
+        result = solve_yield_to_maturity(price, face, coupon, periods, frequency)
+        self.assertTrue(result["converged"].all())
+        np.testing.assert_allclose(result["yield_to_maturity"], ytm, atol=1e-8)
+        self.assertLess(result["iterations"].max(), 50)
+
+    def test_loan_measures(self):
+        loan = Loan(notional=100, redemption=110, interest_rate=0.05)
+        self.assertAlmostEqual(loan.Duration(), 1 / 1.05)
+        self.assertAlmostEqual(loan.Convexity(), 2 / 1.05**2)
+        self.assertAlmostEqual(loan.Yield_to_Maturity(), 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+import numpy as np
+import pandas as pd
+from Engine.backtester import Backtester
+from Engine.costs import ExecutionModel, fill_order, fill_orders
+from Engine.events import NullSink
+from Engine.execution import (
+    STEPWISE_MIN_ROWS, _execute_rows, _execute_stepwise, _loop_kernel, execute_signals, numba,
+)
+from Engine.strategy import BUY, SELL, HOLD, ThresholdStrategy
+
+
+class TestExecutionModel(unittest.TestCase):
+    """
+    Unit tests for transaction costs and position sizing.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.signals = rng.choice([BUY, SELL, HOLD], size=(20, 120))
+        self.close = 50 + np.cumsum(rng.normal(0, 1, size=(20, 120)), axis=1)
+
+    def test_default_model_matches_unit_trades(self):
+        expected = execute_signals(self.signals, self.close, 500)
+        result = execute_signals(self.signals, self.close, 500, execution_model=ExecutionModel())
+        for expected_array, array in zip(expected, result):
+            np.testing.assert_array_equal(array, expected_array)
+
+    def test_fees_spread_and_slippage(self):
+        model = ExecutionModel(fixed_fee=1.0, proportional_fee=0.01, spread=0.02, slippage=0.005, size=10)
+        quantity, cash_change = model.fill(BUY, 100.0, 10000.0, 0)
+        self.assertEqual(quantity, 10)
+        self.assertAlmostEqual(cash_change, -(10 * 100 * 1.015 * 1.01 + 1))
+        quantity, cash_change = model.fill(SELL, 100.0, 0.0, 4)
+        self.assertEqual(quantity, -4)
+        self.assertAlmostEqual(cash_change, 4 * 100 * 0.985 * 0.99 - 1)
+        # A fixed-size buy that cash does not cover is rejected outright
+        self.assertEqual(model.fill(BUY, 100.0, 1000.0, 0), (0, 0.0))
+
+    def test_fraction_and_target_weight_sizing(self):
+        fraction = ExecutionModel(sizing="fraction", size=0.5)
+        self.assertEqual(fraction.fill(BUY, 30.0, 1000.0, 0)[0], 16)
+        self.assertEqual(fraction.fill(SELL, 30.0, 0.0, 7)[0], -3)
+        target = ExecutionModel(sizing="target_weight", size=0.5, fractional=True)
+        quantity, cash_change = target.fill(BUY, 10.0, 600.0, 40)
+        self.assertAlmostEqual(quantity, 10.0)
+        self.assertAlmostEqual(cash_change, -100.0)
+        self.assertEqual(target.fill(SELL, 10.0, 600.0, 40)[0], -40)
+        with self.assertRaises(ValueError):
+            ExecutionModel(sizing="kelly")
+
+    def test_array_rule_matches_scalar_rule(self):
+        models = [
+            ExecutionModel(fixed_fee=2.0, proportional_fee=0.001, spread=0.01, size=3),
+            ExecutionModel(sizing="fraction", size=0.3, fixed_fee=1.0),
+            ExecutionModel(sizing="target_weight", size=0.8, fractional=True),
+        ]
+        cash = np.linspace(0, 400, 20)
+        position = np.arange(20) % 5 * 1.0
+        for model in models:
+            params = model.parameters()
+            for signal in (BUY, SELL, HOLD):
+                signals = np.full(20, signal)
+                quantity, cash_change = fill_orders(signals, self.close[:, 0], cash, position, *params)
+                for i in range(20):
+                    expected = fill_order(signal, self.close[i, 0], cash[i], position[i], *params)
+                    self.assertEqual((quantity[i], cash_change[i]), expected)
+
+    def test_engines_and_backtester_agree(self):
+        models = [
+            ExecutionModel(fixed_fee=1.0, proportional_fee=0.002, spread=0.004, slippage=0.001, size=2),
+            ExecutionModel(sizing="fraction", size=0.25, fixed_fee=0.5),
+            ExecutionModel(sizing="target_weight", size=0.6, fractional=True),
+        ]
+        engines = ["numpy", "numba"] if numba is not None else ["numpy"]
+        for model in models:
+            expected = execute_signals(self.signals, self.close, 1000, engine="python", execution_model=model)
+            for engine in engines:
+                with self.subTest(sizing=model.sizing, engine=engine):
+                    result = execute_signals(self.signals, self.close, 1000, engine=engine, execution_model=model)
+                    for expected_array, array in zip(expected, result):
+                        np.testing.assert_array_equal(array, expected_array)
+
+            data = pd.DataFrame({"close": self.close[0]}, index=pd.date_range("2024-01-01", periods=120))
+            strategy = ThresholdStrategy(48, 52)
+            loop = Backtester(data, strategy, initial_cash=1000, sink=NullSink(), execution_model=model)
+            loop.run()
+            vectorized = Backtester(data, strategy, initial_cash=1000, sink=NullSink(), execution_model=model)
+            vectorized.run(vectorized=True)
+            pd.testing.assert_frame_equal(loop.results(), vectorized.results())
+
+    def test_cash_dependent_sizing_avoids_stepwise_on_few_rows(self):
+        # Stepping a single row through time with array operations is far slower than the scalar loop
+        self.assertIs(_loop_kernel(1), _execute_rows)
+        self.assertIs(_loop_kernel(STEPWISE_MIN_ROWS - 1), _execute_rows)
+        self.assertIs(_loop_kernel(STEPWISE_MIN_ROWS), _execute_stepwise)
+        model = ExecutionModel(sizing="fraction", size=0.1)
+        signals = np.tile(self.signals, (2, 1))
+        close = np.tile(self.close, (2, 1))
+        self.assertGreaterEqual(len(signals), STEPWISE_MIN_ROWS)
+        for rows in (signals[:1], signals):
+            expected = execute_signals(rows, close[:len(rows)], 1000, engine="python", execution_model=model)
+            result = execute_signals(rows, close[:len(rows)], 1000, engine="numpy", execution_model=model)
+            for expected_array, array in zip(expected, result):
+                np.testing.assert_array_equal(array, expected_array)
+
+
+if __name__ == "__main__":
+    unittest.main()
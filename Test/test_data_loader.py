@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from Utils.data_loader import DataLoader
+from Utils.disk_cache import DiskCache
+
+
+class TestLoadCsvCache(unittest.TestCase):
+    """
+    Unit tests for the memory-mapped binary cache of DataLoader.load_csv.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmp.name, "prices.csv")
+        pd.DataFrame({
+            "Date": pd.date_range(start="2025-01-01", periods=50).strftime("%Y-%m-%d"),
+            "Close": np.linspace(100, 150, 50),
+            "Volume": np.arange(50),
+        }).to_csv(self.csv_path, index=False)
+        self.cache = DiskCache(os.path.join(self.tmp.name, "cache"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_cache_hit_matches_parsed_frame(self):
+        parsed = DataLoader.load_csv(self.csv_path, "Date", "Close")
+        first = DataLoader.load_csv(self.csv_path, "Date", "Close", cache=self.cache)
+        cached = DataLoader.load_csv(self.csv_path, "Date", "Close", cache=self.cache)
+        pd.testing.assert_frame_equal(first, parsed)
+        pd.testing.assert_frame_equal(cached, parsed, check_freq=False)
+        self.assertEqual(len(self.cache.entries()), 1)
+
+    def test_modified_file_misses_and_invalidate(self):
+        DataLoader.load_csv(self.csv_path, "Date", "Close", cache=self.cache)
+        with open(self.csv_path, "a") as file:
+            file.write("2025-02-20,200.0,50\n")
+        reloaded = DataLoader.load_csv(self.csv_path, "Date", "Close", cache=self.cache)
+        self.assertEqual(len(reloaded), 51)
+        self.assertEqual(len(self.cache.entries()), 2)
+
+        self.cache.invalidate(source=os.path.abspath(self.csv_path))
+        self.assertEqual(self.cache.entries(), [])
+
+    def test_eviction_keeps_cache_under_limit(self):
+        cache = DiskCache(os.path.join(self.tmp.name, "small"), max_bytes=3000)
+        for i in range(5):
+            cache.store(cache.make_key(i), {"values": np.zeros(200)})
+        entries = cache.entries()
+        self.assertLessEqual(sum(entry[2] for entry in entries), 3000)
+        self.assertIsNotNone(cache.load(cache.make_key(4)))
+        self.assertIsNone(cache.load(cache.make_key(0)))
+
+
+class TestStreamingCsv(unittest.TestCase):
+    """
+    Unit tests for streaming CSV files in chunks.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmp.name, "prices.csv")
+        rng = np.random.default_rng(2)
+        pd.DataFrame({
+            "Date": pd.date_range(start="2020-01-01", periods=400).strftime("%Y-%m-%d"),
+            "Close": 100 + np.cumsum(rng.normal(0, 1, 400)),
+            "Volume": np.arange(400),
+        }).to_csv(self.csv_path, index=False)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_blocks_concatenate_to_full_frame(self):
+        blocks = list(DataLoader.iter_csv(self.csv_path, "Date", "Close", chunksize=64))
+        self.assertEqual(len(blocks), 7)
+        self.assertEqual(list(blocks[0].columns), ["close"])
+        pd.testing.assert_frame_equal(pd.concat(blocks), DataLoader.load_csv(self.csv_path, "Date", "Close"))
+
+    def test_backtester_run_stream_matches_full_run(self):
+        from Engine.backtester import Backtester
+        from Engine.events import NullSink
+        from Engine.strategy import MovingAverageCrossoverStrategy
+
+        strategy = MovingAverageCrossoverStrategy(short_window=5, long_window=20)
+        full_data = DataLoader.add_moving_averages(DataLoader.load_csv(self.csv_path, "Date", "Close"), 5, 20)
+        full = Backtester(full_data, strategy, initial_cash=1000, sink=NullSink())
+        full.run(vectorized=True)
+
+        streamed = Backtester(None, strategy, initial_cash=1000, sink=NullSink())
+        streamed.run_stream(
+            DataLoader.iter_csv(self.csv_path, "Date", "Close", chunksize=50),
+            prepare=lambda block: DataLoader.add_moving_averages(block, 5, 20),
+            warmup=19,
+        )
+        pd.testing.assert_frame_equal(streamed.results(), full.results())
+        self.assertEqual(streamed.cash, full.cash)
+
+
+if __name__ == "__main__":
+    unittest.main()
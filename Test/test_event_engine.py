@@ -0,0 +1,135 @@
+import unittest
+import numpy as np
+import pandas as pd
+from Engine.event_engine import (
+    CANCELLED, FILLED, LIMIT, OPEN, REJECTED, STOP, Bar, EventDrivenBacktester, bar_stream,
+)
+from Engine.events import NullSink
+from Engine.portfolio import ArrayPortfolio
+from Engine.strategy import ThresholdStrategy
+
+
+class RecordingStrategy:
+    """
+    Records the bars it sees and submits scripted orders on given (symbol, bar number) pairs.
+    """
+
+    def __init__(self, orders=None):
+        self.bars = []
+        self.orders = orders or {}
+        self.submitted = []
+        self.counts = {}
+
+    def on_bar(self, bar, engine):
+        self.bars.append((bar.date, bar.symbol))
+        count = self.counts.get(bar.symbol, 0)
+        self.counts[bar.symbol] = count + 1
+        for arguments in self.orders.get((bar.symbol, count), []):
+            self.submitted.append(engine.submit_order(bar.symbol, *arguments))
+
+
+class TestEventDrivenBacktester(unittest.TestCase):
+    """
+    Unit tests for the event-driven multi-asset backtester.
+    """
+
+    def setUp(self):
+        dates = pd.date_range("2024-01-01", periods=5)
+        self.data = {
+            "AAA": pd.DataFrame({
+                "open": [10.0, 11.0, 12.0, 9.0, 10.0],
+                "high": [10.5, 12.0, 12.5, 10.0, 11.0],
+                "low": [9.5, 10.5, 11.0, 8.5, 9.5],
+                "close": [10.0, 11.5, 11.5, 9.5, 10.5],
+            }, index=dates),
+            "BBB": pd.DataFrame({"close": [50.0, 52.0, 51.0]}, index=dates[[0, 2, 4]]),
+        }
+
+    def test_streams_are_merged_in_date_order(self):
+        strategy = RecordingStrategy()
+        engine = EventDrivenBacktester(self.data, strategy, sink=NullSink())
+        results = engine.run()
+        dates = [date for date, _ in strategy.bars]
+        self.assertEqual(dates, sorted(dates))
+        self.assertEqual(strategy.bars[:3], [(dates[0], "AAA"), (dates[0], "BBB"), (dates[2], "AAA")])
+        self.assertEqual(engine.events_processed, 8)
+        self.assertEqual(len(results), 5)
+        np.testing.assert_array_equal(results["portfolio_value"], 100000.0)
+
+    def test_market_order_fills_at_next_open(self):
+        strategy = RecordingStrategy({("AAA", 0): [(10,)], ("AAA", 2): [(-4,)]})
+        engine = EventDrivenBacktester(self.data, strategy, initial_cash=1000, sink=NullSink())
+        results = engine.run()
+        buy, sell = strategy.submitted
+        self.assertEqual((buy.status, buy.fill_price, buy.fill_date), (FILLED, 11.0, self.data["AAA"].index[1]))
+        self.assertEqual((sell.status, sell.fill_price), (FILLED, 9.0))
+        self.assertEqual(engine.portfolio.get_positions(), {"AAA": 6})
+        self.assertAlmostEqual(results["cash"].iloc[-1], 1000 - 110 + 36)
+        self.assertAlmostEqual(results["portfolio_value"].iloc[-1], 1000 - 110 + 36 + 6 * 10.5)
+
+    def test_limit_and_stop_orders(self):
+        strategy = RecordingStrategy({
+            ("AAA", 0): [(1, LIMIT, 9.0), (1, STOP, 11.8), (1, LIMIT, 5.0)],
+            ("AAA", 1): [(-1, STOP, 10.0)],
+        })
+        engine = EventDrivenBacktester(self.data, strategy, sink=NullSink())
+        engine.run()
+        limit, stop, far_limit, sell_stop = strategy.submitted
+        # Triggered on the bar whose range reaches the price; a gap fills at the open
+        self.assertEqual((limit.status, limit.fill_price, limit.fill_date), (FILLED, 9.0, self.data["AAA"].index[3]))
+        self.assertEqual((stop.status, stop.fill_price, stop.fill_date), (FILLED, 11.8, self.data["AAA"].index[1]))
+        self.assertEqual((sell_stop.status, sell_stop.fill_price), (FILLED, 9.0))
+        self.assertEqual(far_limit.status, OPEN)
+        self.assertTrue(engine.cancel_order(far_limit))
+        self.assertEqual(far_limit.status, CANCELLED)
+        self.assertFalse(engine.cancel_order(far_limit))
+        with self.assertRaises(ValueError):
+            engine.submit_order("AAA", 1, LIMIT)
+
+    def test_cancelled_orders_leave_the_book(self):
+        engine = EventDrivenBacktester(self.data, RecordingStrategy(), sink=NullSink())
+        book = engine.books["AAA"]
+        orders = [engine.submit_order("AAA", 1, LIMIT, 1.0 + i) for i in range(10)]
+        engine._activate()
+        for order in orders[:8]:
+            engine.cancel_order(order)
+        self.assertLessEqual(len(book), 5)
+        self.assertEqual(sorted(entry[2].order_id for entry in book.buy_limits if entry[2].status == OPEN),
+                         [orders[8].order_id, orders[9].order_id])
+        pending = engine.submit_order("AAA", 1)
+        engine.cancel_order(pending)
+        self.assertEqual(engine._incoming, [])
+
+    def test_rejected_fills_and_array_portfolio(self):
+        strategy = RecordingStrategy({("BBB", 0): [(5,), (-5,)], ("AAA", 0): [(1000,)]})
+        portfolio = ArrayPortfolio(initial_cash=300, sink=NullSink())
+        engine = EventDrivenBacktester(self.data, strategy, portfolio=portfolio)
+        engine.run()
+        buy_aaa, buy_bbb, sell_bbb = strategy.submitted
+        self.assertEqual(buy_bbb.status, FILLED)
+        self.assertEqual(sell_bbb.status, FILLED)
+        self.assertEqual(buy_aaa.status, REJECTED)
+        self.assertEqual(portfolio.symbols, ["AAA", "BBB"])
+        self.assertAlmostEqual(portfolio.cash, 300.0)
+        self.assertEqual(engine.position("BBB"), 0)
+
+        free = {"AAA": pd.DataFrame({"close": [0.0, 0.0]}, index=self.data["AAA"].index[:2])}
+        strategy = RecordingStrategy({("AAA", 0): [(3,)]})
+        engine = EventDrivenBacktester(free, strategy, sink=NullSink())
+        engine.run()
+        self.assertEqual(strategy.submitted[0].status, FILLED)
+        self.assertEqual(engine.position("AAA"), 3)
+
+    def test_signal_strategies_and_bar_streams(self):
+        bars = list(bar_stream("AAA", self.data["AAA"]))
+        self.assertIsInstance(bars[0], Bar)
+        self.assertEqual((bars[3]["low"], bars[3].close), (8.5, 9.5))
+        engine = EventDrivenBacktester({"AAA": bars}, ThresholdStrategy(10.5, 11.0), sink=NullSink())
+        engine.run()
+        history = engine.portfolio.get_transaction_history().to_frame()
+        self.assertEqual(history["action"].tolist(), ["buy", "sell", "buy"])
+        self.assertEqual(history["price"].tolist(), [11.0, 12.0, 10.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
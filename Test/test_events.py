@@ -0,0 +1,47 @@
+import logging
+import unittest
+import pandas as pd
+from Engine.backtester import Backtester
+from Engine.events import BufferedSink, LoggingSink, NullSink
+from Engine.portfolio import Portfolio
+from Engine.strategy import ThresholdStrategy
+
+
+class TestTradeEventSinks(unittest.TestCase):
+    """
+    Unit tests for the pluggable trade event sinks.
+    """
+
+    def setUp(self):
+        self.data = pd.DataFrame({
+            "date": pd.date_range(start="2025-01-01", periods=6),
+            "close": [100, 102, 101, 105, 110, 99],
+        }).set_index("date")
+        self.strategy = ThresholdStrategy(lower_threshold=102, upper_threshold=105)
+
+    def test_buffered_events_match_between_run_modes(self):
+        looped, vectorized = BufferedSink(), BufferedSink()
+        Backtester(self.data, self.strategy, sink=looped).run()
+        Backtester(self.data, self.strategy, sink=vectorized).run(vectorized=True)
+        self.assertEqual(looped.events, vectorized.events)
+        self.assertEqual([event[0] for event in looped.events], ["buy", "buy", "sell", "buy"])
+        self.assertEqual(looped.messages()[0], "2025-01-01 00:00:00: Bought 1 share at 100.00")
+
+    def test_null_sink_is_silent(self):
+        sink = NullSink()
+        portfolio = Portfolio(initial_cash=100, sink=sink)
+        portfolio.buy("AAPL", price=150, quantity=1, date="2025-03-14")
+        self.assertFalse(sink.enabled)
+        self.assertEqual(len(portfolio.get_transaction_history()), 0)
+
+    def test_logging_sink_levels(self):
+        portfolio = Portfolio(initial_cash=1000, sink=LoggingSink(logging.getLogger("test.trades")))
+        with self.assertLogs("test.trades", level="INFO") as logs:
+            portfolio.buy("AAPL", price=150, quantity=2, date="2025-03-14")
+            portfolio.sell("AAPL", price=150, quantity=5, date="2025-03-15")
+        self.assertEqual([record.levelname for record in logs.records], ["INFO", "WARNING"])
+        self.assertEqual(logs.records[0].trade_event["quantity"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
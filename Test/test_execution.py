@@ -0,0 +1,100 @@
+import unittest
+import numpy as np
+import pandas as pd
+from Engine.backtester import Backtester
+from Engine.execution import execute_signals, numba
+from Engine.strategy import BUY, SELL, HOLD, ThresholdStrategy
+
+
+class TestExecuteSignals(unittest.TestCase):
+    """
+    Unit tests for the vectorized signal execution.
+    """
+
+    def test_sell_without_position_is_ignored(self):
+        signals = np.array([SELL, BUY, BUY, SELL, SELL, SELL, BUY])
+        close = np.array([10.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0])
+        cash, position, value = execute_signals(signals, close, 100)
+        np.testing.assert_array_equal(position, [0, 1, 2, 1, 0, 0, 1])
+        np.testing.assert_array_equal(cash, [100, 90, 79, 91, 104, 104, 89])
+        np.testing.assert_array_equal(value, cash + position * close)
+
+    def test_insufficient_cash_rejects_buy(self):
+        signals = np.array([BUY, BUY, BUY, SELL, BUY])
+        close = np.array([40.0, 40.0, 40.0, 40.0, 40.0])
+        cash, position, _ = execute_signals(signals, close, 100)
+        np.testing.assert_array_equal(position, [1, 2, 2, 1, 2])
+        np.testing.assert_array_equal(cash, [60, 20, 20, 60, 20])
+
+    def test_batched_rows_match_single_rows(self):
+        rng = np.random.default_rng(0)
+        signals = rng.choice([BUY, SELL, HOLD], size=(5, 50))
+        close = rng.uniform(5, 30, size=50)
+        cash, position, value = execute_signals(signals, close, 60)
+        for row in range(5):
+            expected = execute_signals(signals[row], close, 60)
+            np.testing.assert_array_equal(cash[row], expected[0])
+            np.testing.assert_array_equal(position[row], expected[1])
+            np.testing.assert_array_equal(value[row], expected[2])
+
+
+class TestExecutionEngines(unittest.TestCase):
+    """
+    Every execution engine must produce identical results to the reference loop.
+    """
+
+    engines = ["numpy", "python"] + (["numba"] if numba is not None else [])
+
+    def test_engines_match_reference(self):
+        rng = np.random.default_rng(11)
+        signals = rng.choice([BUY, SELL, HOLD], size=(40, 120), p=[0.5, 0.2, 0.3])
+        close = rng.uniform(5, 30, size=(40, 120))
+        expected = execute_signals(signals, close, 150, initial_position=2, engine="python")
+        for engine in self.engines:
+            with self.subTest(engine=engine):
+                result = execute_signals(signals, close, 150, initial_position=2, engine=engine)
+                for actual, reference in zip(result, expected):
+                    np.testing.assert_array_equal(actual, reference)
+
+    def test_single_row_and_unknown_engine(self):
+        signals = np.array([BUY, BUY, SELL, BUY])
+        close = np.array([60.0, 50.0, 55.0, 70.0])
+        for engine in self.engines:
+            with self.subTest(engine=engine):
+                cash, position, _ = execute_signals(signals, close, 100, engine=engine)
+                np.testing.assert_array_equal(position, [1, 1, 0, 1])
+                np.testing.assert_array_equal(cash, [40, 40, 95, 25])
+        with self.assertRaises(ValueError):
+            execute_signals(signals, close, 100, engine="cuda")
+
+    @unittest.skipIf(numba is not None, "numba is installed")
+    def test_numba_engine_requires_numba(self):
+        with self.assertRaises(ImportError):
+            execute_signals(np.array([BUY]), np.array([1.0]), 100, engine="numba")
+
+
+class TestVectorizedBacktester(unittest.TestCase):
+    """
+    The vectorized run mode must reproduce the per-row loop exactly.
+    """
+
+    def test_matches_row_loop(self):
+        rng = np.random.default_rng(1)
+        data = pd.DataFrame({
+            "date": pd.date_range(start="2025-01-01", periods=300),
+            "close": 100 + np.cumsum(rng.normal(0, 2, 300)),
+        }).set_index("date")
+        strategy = ThresholdStrategy(lower_threshold=98, upper_threshold=104)
+
+        looped = Backtester(data, strategy, initial_cash=1000)
+        looped.run()
+        vectorized = Backtester(data, strategy, initial_cash=1000)
+        vectorized.run(vectorized=True)
+
+        pd.testing.assert_frame_equal(vectorized.results(), looped.results(), check_dtype=False)
+        self.assertEqual(vectorized.cash, looped.cash)
+        self.assertEqual(vectorized.position, looped.position)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import numpy as np
+import pandas as pd
+from Utils.indicators import (
+    ExponentialMovingAverage, Indicators, RollingMean, RollingStd, ema, rolling_mean, rolling_std
+)
+
+
+class TestBatchIndicators(unittest.TestCase):
+    """
+    Unit tests for the vectorized rolling indicators and their memoization.
+    """
+
+    def setUp(self):
+        self.values = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, 500))
+        self.values[37] = np.nan
+        self.series = pd.Series(self.values)
+
+    def test_match_pandas(self):
+        np.testing.assert_allclose(rolling_mean(self.values, 20), self.series.rolling(20).mean(), rtol=1e-12)
+        np.testing.assert_allclose(rolling_std(self.values, 20), self.series.rolling(20).std(), rtol=1e-9)
+        clean = self.values[50:]
+        np.testing.assert_allclose(ema(clean, 10), pd.Series(clean).ewm(span=10, adjust=False).mean(), rtol=1e-12)
+
+    def test_flat_stretches_match_pandas_exactly(self):
+        values = self.values[50:350].copy()
+        values[100:160] = values[100]
+        series = pd.Series(values)
+        for window in (5, 20):
+            np.testing.assert_array_equal(rolling_mean(values, window)[119:160], series.rolling(window).mean()[119:160])
+            np.testing.assert_array_equal(rolling_std(values, window)[119:160], 0.0)
+        short, long = rolling_mean(values, 5), rolling_mean(values, 20)
+        pandas_short, pandas_long = series.rolling(5).mean(), series.rolling(20).mean()
+        np.testing.assert_array_equal(short > long, pandas_short > pandas_long)
+        np.testing.assert_array_equal(short < long, pandas_short < pandas_long)
+        mean, std = RollingMean(20), RollingStd(20)
+        self.assertEqual([mean.update(value) for value in values][159], values[100])
+        self.assertEqual([std.update(value) for value in values][159], 0.0)
+
+    def test_panel_rows_match_single_series(self):
+        panel = np.vstack([self.values, self.values[::-1]])
+        np.testing.assert_allclose(rolling_mean(panel, 5)[1], rolling_mean(self.values[::-1], 5))
+
+    def test_memoized_and_extended(self):
+        indicators = Indicators(self.values[:300])
+        self.assertIs(indicators.sma(20), indicators.sma(20))
+        indicators.ema(15)
+        indicators.extend(self.values[300:])
+        full = Indicators(self.values)
+        np.testing.assert_allclose(indicators.sma(20), full.sma(20), rtol=1e-12)
+        np.testing.assert_allclose(indicators.ema(15)[300:], ema(self.values[300:], 15, initial=ema(self.values[:300], 15)[-1]))
+
+
+class TestIncrementalIndicators(unittest.TestCase):
+    """
+    Unit tests for the O(1) streaming indicators.
+    """
+
+    def test_updates_match_batch(self):
+        values = 100 + np.cumsum(np.random.default_rng(1).normal(0, 1, 1000))
+        mean, std, average = RollingMean(30), RollingStd(30), ExponentialMovingAverage(12)
+        means = [mean.update(value) for value in values]
+        stds = [std.update(value) for value in values]
+        averages = [average.update(value) for value in values]
+        np.testing.assert_allclose(means, rolling_mean(values, 30), rtol=1e-12)
+        np.testing.assert_allclose(stds, rolling_std(values, 30), rtol=1e-9)
+        np.testing.assert_allclose(averages, ema(values, 12), rtol=1e-12)
+
+    def test_updates_recover_after_nans(self):
+        values = 100 + np.cumsum(np.random.default_rng(2).normal(0, 1, 200))
+        values[[0, 5, 57, 58, 130]] = np.nan
+        series = pd.Series(values)
+        for window in (1, 3, 10):
+            with self.subTest(window=window):
+                mean, std = RollingMean(window), RollingStd(window)
+                means = [mean.update(value) for value in values]
+                stds = [std.update(value) for value in values]
+                np.testing.assert_allclose(means, series.rolling(window).mean(), rtol=1e-12)
+                np.testing.assert_allclose(stds, series.rolling(window).std(), rtol=1e-9)
+
+    def test_window_must_be_positive(self):
+        for window in (0, -3):
+            for constructor in (RollingMean, RollingStd):
+                with self.assertRaises(ValueError):
+                    constructor(window)
+            for function in (rolling_mean, rolling_std):
+                with self.assertRaises(ValueError):
+                    function(np.arange(10.0), window)
+
+
+if __name__ == "__main__":
+    unittest.main()
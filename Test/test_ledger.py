@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from Engine.ledger import Ledger
+
+
+class TestLedger(unittest.TestCase):
+    """
+    Unit tests for the columnar Ledger and its spilling to disk.
+    """
+
+    def setUp(self):
+        self.fields = {"date": "datetime64[ns]", "cash": np.float64, "position": np.int64}
+
+    def test_append_grows_and_exports(self):
+        ledger = Ledger(self.fields, capacity=2)
+        for day in range(5):
+            ledger.append(date=np.datetime64("2025-01-01") + day, cash=100.0 - day, position=day)
+        self.assertEqual(len(ledger), 5)
+        self.assertEqual(ledger[-1]["cash"], 96.0)
+        frame = ledger.to_frame()
+        self.assertEqual(list(frame.columns), ["date", "cash", "position"])
+        np.testing.assert_array_equal(frame["position"], np.arange(5))
+
+    def test_to_frame_does_not_copy(self):
+        ledger = Ledger(self.fields)
+        ledger.extend(date=np.arange(3).astype("datetime64[D]"), cash=np.ones(3), position=np.zeros(3, dtype=int))
+        self.assertTrue(np.shares_memory(ledger.to_frame()["cash"].to_numpy(), ledger.column("cash")))
+
+    def test_spill_to_disk(self):
+        ledger = Ledger({"action": object, "price": np.float64}, capacity=4, spill_threshold=4)
+        for i in range(10):
+            ledger.append(action="buy" if i % 2 else "sell", price=float(i))
+        self.assertEqual(len(ledger._segments), 2)
+        self.assertEqual(len(ledger), 10)
+        np.testing.assert_array_equal(ledger.column("price"), np.arange(10.0))
+        self.assertEqual(ledger[5].to_dict(), {"action": "buy", "price": 5.0})
+        self.assertEqual(list(ledger.to_frame()["action"][:2]), ["sell", "buy"])
+
+    def test_spilled_numeric_columns_stay_memory_mapped(self):
+        ledger = Ledger(self.fields, capacity=4, spill_threshold=4)
+        for day in range(8):
+            ledger.append(date=np.datetime64("2025-01-01") + day, cash=100.0 - day, position=day)
+        cash = ledger.column("cash")
+        self.assertIsInstance(cash, np.memmap)
+        np.testing.assert_array_equal(cash, 100.0 - np.arange(8))
+        self.assertEqual(ledger[7]["position"], 7)
+        for day in range(8, 11):
+            ledger.append(date=np.datetime64("2025-01-01") + day, cash=100.0 - day, position=day)
+        frame = ledger.to_frame()
+        # Reading does not spill the rows still held in memory
+        self.assertEqual((ledger._segments, ledger._size), ([4, 4], 3))
+        self.assertEqual(len(frame), 11)
+        np.testing.assert_array_equal(frame["position"], np.arange(11))
+
+    def test_ledgers_sharing_a_spill_dir_are_isolated(self):
+        with tempfile.TemporaryDirectory() as spill_dir:
+            first = Ledger(self.fields, capacity=4, spill_threshold=4, spill_dir=spill_dir)
+            second = Ledger(self.fields, capacity=4, spill_threshold=4, spill_dir=spill_dir)
+            for day in range(8):
+                first.append(date=np.datetime64("2025-01-01") + day, cash=1.0, position=day)
+                second.append(date=np.datetime64("2025-01-01") + day, cash=2.0, position=day)
+            np.testing.assert_array_equal(first.column("cash"), np.ones(8))
+            np.testing.assert_array_equal(second.column("cash"), np.full(8, 2.0))
+            self.assertEqual(os.path.dirname(first.spill_dir), spill_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+from Utils.metrics import Metrics
+
+
+class TestBatchMetrics(unittest.TestCase):
+    """
+    Unit tests for the vectorized metrics over (paths, time) equity curves.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(4)
+        self.paths = 100 * np.cumprod(1 + rng.normal(0.0005, 0.01, size=(6, 300)), axis=1)
+
+    def test_matches_single_curve_methods(self):
+        batch = Metrics.calculate_batch_metrics(self.paths)
+        for row, values in enumerate(self.paths):
+            self.assertAlmostEqual(batch["annualized_return"][row],
+                                   Metrics.calculate_annualized_return(values, len(values)))
+            self.assertAlmostEqual(batch["annualized_volatility"][row], Metrics.calculate_annualized_volatility(values))
+            self.assertAlmostEqual(batch["sharpe_ratio"][row], Metrics.calculate_sharpe_ratio(values))
+            self.assertAlmostEqual(batch["max_drawdown"][row], Metrics.calculate_max_drawdown(values))
+
+    def test_one_dimensional_input(self):
+        batch = Metrics.calculate_batch_metrics(self.paths[0])
+        self.assertEqual(np.ndim(batch["sortino_ratio"]), 0)
+        self.assertEqual(batch["max_drawdown_duration"], Metrics.calculate_batch_metrics(self.paths[:1])["max_drawdown_duration"][0])
+
+    def test_single_bar_gives_nan_metrics(self):
+        for values in (np.array([100.0]), self.paths[:, :1]):
+            batch = Metrics.calculate_batch_metrics(values)
+            self.assertEqual(len(batch), 10)
+            for metric in batch.values():
+                self.assertEqual(np.shape(metric), values.shape[:-1])
+                self.assertTrue(np.all(np.isnan(metric)))
+
+    def test_drawdown_duration_and_tail_risk(self):
+        values = np.array([100, 110, 105, 100, 108, 111, 90, 95, 120])
+        batch = Metrics.calculate_batch_metrics(values, confidence_level=0.75)
+        self.assertEqual(batch["max_drawdown_duration"], 3)
+        returns = np.diff(values) / values[:-1]
+        cutoff = np.quantile(returns, 0.25)
+        self.assertAlmostEqual(batch["value_at_risk"], -cutoff)
+        self.assertAlmostEqual(batch["conditional_value_at_risk"], -returns[returns <= cutoff].mean())
+        self.assertGreaterEqual(batch["conditional_value_at_risk"], batch["value_at_risk"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -75,5 +75,69 @@ class TestMonteCarloSimulation(unittest.TestCase):
             np.allclose(paths[:, -1], expected_final_value, atol=1e-2)
         )
 
+    def test_seeded_runs_are_reproducible(self):
+        """
+        Test that the same seed yields the same paths and a different seed does not.
+        """
+        make = lambda seed: MonteCarloSimulation(100, 50, 20, 0.07, 0.2, seed=seed, chunk_size=16)
+        np.testing.assert_array_equal(make(42).run_simulation(), make(42).run_simulation())
+        self.assertFalse(np.array_equal(make(42).run_simulation(), make(43).run_simulation()))
+
+    def test_seed_sequence_is_not_consumed(self):
+        """
+        Test that a SeedSequence seed gives the same paths on every run and is left unchanged.
+        """
+        seed = np.random.SeedSequence(42)
+        simulator = MonteCarloSimulation(100, 50, 20, 0.07, 0.2, seed=seed, chunk_size=16)
+        first = simulator.run_simulation()
+        np.testing.assert_array_equal(first, simulator.run_simulation())
+        self.assertEqual(seed.n_children_spawned, 0)
+        self.assertEqual(simulator.summarize_streaming()["max"], first[:, -1].max())
+
+    def test_parallel_run_is_bit_identical(self):
+        """
+        Test that the merged result does not depend on the number of workers.
+        """
+        simulator = MonteCarloSimulation(100, 50, 20, 0.07, 0.2, seed=42, chunk_size=16)
+        serial = simulator.run_simulation()
+        parallel = simulator.run_simulation(workers=3)
+        np.testing.assert_array_equal(serial, parallel)
+
+    def test_streaming_summary_matches_paths(self):
+        """
+        Test that the streaming summary agrees with summarizing the full path matrix.
+        """
+        simulator = MonteCarloSimulation(100, 5000, 20, 0.07, 0.2, seed=3, chunk_size=700)
+        final_values = simulator.run_simulation()[:, -1]
+        summary = simulator.summarize_streaming(quantiles=(0.1, 0.9))
+
+        self.assertAlmostEqual(summary["mean"], np.mean(final_values))
+        self.assertAlmostEqual(summary["std_dev"], np.std(final_values))
+        self.assertEqual(summary["min"], np.min(final_values))
+        self.assertEqual(summary["max"], np.max(final_values))
+        for q, value in summary["quantiles"].items():
+            self.assertAlmostEqual(np.mean(final_values <= value), q, delta=0.02)
+        self.assertEqual(simulator.summarize_streaming(quantiles=(0.1, 0.9)), summary)
+
+    def test_run_simulation_reuses_buffer(self):
+        """
+        Test that a caller-supplied buffer is filled in place, including float32.
+        """
+        simulator = MonteCarloSimulation(100, 50, 20, 0.07, 0.2, seed=5, chunk_size=16)
+        buffer = np.empty((50, 21))
+        paths = simulator.run_simulation(out=buffer)
+        self.assertIs(paths, buffer)
+        np.testing.assert_array_equal(paths, simulator.run_simulation())
+
+        paths32 = simulator.run_simulation(dtype=np.float32)
+        self.assertEqual(paths32.dtype, np.float32)
+        self.assertEqual(paths32.shape, paths.shape)
+        self.assertTrue(np.all(paths32[:, 0] == 100))
+        self.assertTrue(np.all(paths32 > 0))
+
+        with self.assertRaises(ValueError):
+            simulator.run_simulation(out=np.empty((50, 20)))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+import numpy as np
+from Engine.multi_asset import MultiAssetMonteCarlo, factorize_covariance
+from Engine.portfolio import ArrayPortfolio
+from Engine.events import NullSink
+
+
+class TestMultiAssetMonteCarlo(unittest.TestCase):
+    """
+    Unit tests for the correlated multi-asset simulation.
+    """
+
+    def setUp(self):
+        self.covariance = np.array([[0.04, 0.018, 0.0], [0.018, 0.09, 0.01], [0.0, 0.01, 0.0625]])
+        self.simulator = MultiAssetMonteCarlo(
+            [100, 50, 20], [0.05, 0.08, 0.02], self.covariance, 20000, 12,
+            symbols=["AAPL", "MSFT", "XOM"], seed=4, chunk_size=3000,
+        )
+
+    def test_paths_match_covariance(self):
+        paths = self.simulator.run_simulation()
+        self.assertEqual(paths.shape, (20000, 13, 3))
+        np.testing.assert_array_equal(paths[:, 0], np.broadcast_to([100, 50, 20], (20000, 3)))
+        log_returns = np.log(paths[:, -1] / paths[:, 0])
+        np.testing.assert_allclose(np.cov(log_returns, rowvar=False), self.covariance, atol=0.005)
+        np.testing.assert_allclose(log_returns.mean(axis=0), [0.05, 0.08, 0.02], atol=0.01)
+
+    def test_chunks_and_workers_match_full_run(self):
+        paths = self.simulator.run_simulation()
+        chunks = np.concatenate([chunk.copy() for _, _, chunk in self.simulator.iter_chunks()])
+        np.testing.assert_array_equal(chunks, paths)
+        np.testing.assert_array_equal(self.simulator.run_simulation(workers=2), paths)
+
+    def test_semidefinite_covariance(self):
+        covariance = np.array([[0.04, 0.04], [0.04, 0.04]])
+        factor = factorize_covariance(covariance)
+        np.testing.assert_allclose(factor @ factor.T, covariance, atol=1e-12)
+        with self.assertRaises(ValueError):
+            factorize_covariance(np.array([[0.04, 0.1], [0.1, 0.04]]))
+
+    def test_portfolio_values(self):
+        portfolio = ArrayPortfolio(symbols=["XOM", "AAPL", "TSLA"], initial_cash=1000, sink=NullSink())
+        portfolio.buy_many(["XOM", "AAPL"], [20, 100], [10, 2], "2025-03-14")
+        values = self.simulator.portfolio_values(portfolio)
+        paths = self.simulator.run_simulation()
+        np.testing.assert_allclose(values, 600 + paths[..., 0] * 2 + paths[..., 2] * 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import numpy as np
+from Utils.online_stats import QuantileSketch, RunningMoments
+
+
+class TestRunningMoments(unittest.TestCase):
+    """
+    Unit tests for the mergeable running moments.
+    """
+
+    def test_blocks_match_numpy(self):
+        values = np.random.default_rng(0).normal(5, 2, 10000)
+        moments = RunningMoments()
+        for block in np.array_split(values, 7):
+            moments.update(block)
+        self.assertEqual(moments.count, len(values))
+        self.assertAlmostEqual(moments.mean, values.mean())
+        self.assertAlmostEqual(moments.std, values.std())
+        self.assertEqual(moments.min, values.min())
+        self.assertEqual(moments.max, values.max())
+
+
+class TestQuantileSketch(unittest.TestCase):
+    """
+    Unit tests for the mergeable quantile sketch.
+    """
+
+    def test_merged_sketches_approximate_quantiles(self):
+        values = np.random.default_rng(1).lognormal(0, 1, 200000)
+        sketch = QuantileSketch(k=256, seed=0)
+        for block in np.array_split(values, 20):
+            part = QuantileSketch(k=256, seed=1)
+            part.update(block)
+            sketch.merge(part)
+        estimates = sketch.quantile([0.05, 0.5, 0.95])
+        for q, estimate in zip([0.05, 0.5, 0.95], estimates):
+            self.assertAlmostEqual(np.mean(values <= estimate), q, delta=0.01)
+        self.assertLess(sum(len(level) for level in sketch.levels), 256 * len(sketch.levels))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from Engine.Monte_carlo import MonteCarloSimulation
+from Engine.backtester import Backtester
+from Engine.events import NullSink
+from Engine.strategy import ThresholdStrategy
+from Utils.price_panel import PricePanel
+
+
+def _negate_first(panel):
+    panel["close"][0] *= -1
+    return panel.owner
+
+
+class TestPricePanel(unittest.TestCase):
+    """
+    Unit tests for the shared-memory price panel.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.data = pd.DataFrame({
+            "date": pd.date_range(start="2025-01-01", periods=200),
+            "close": 100 + np.cumsum(rng.normal(0, 2, 200)),
+            "volume": rng.integers(100, 1000, 200),
+        }).set_index("date")
+
+    def test_workers_share_storage(self):
+        for backend in ("shared_memory", "memmap"):
+            with self.subTest(backend=backend), PricePanel(self.data, backend=backend) as panel:
+                self.assertLess(len(pickle.dumps(panel)), 2000 + len(pickle.dumps(self.data.index)))
+                with ProcessPoolExecutor(max_workers=2) as pool:
+                    self.assertFalse(pool.submit(_negate_first, panel).result())
+                self.assertEqual(panel["close"][0], -self.data["close"].iloc[0])
+                np.testing.assert_array_equal(panel["volume"], self.data["volume"])
+
+    def test_close_removes_storage(self):
+        panel = PricePanel({"close": np.arange(10.0)}, backend="memmap")
+        directory = panel.handle().directory
+        attached = panel.handle().attach()
+        attached.close()
+        self.assertTrue(os.path.isdir(directory))
+        panel.close()
+        panel.close()
+        self.assertFalse(os.path.exists(directory))
+
+        segment_panel = PricePanel({"close": np.arange(10.0)})
+        handle = segment_panel.handle()
+        segment_panel.close()
+        with self.assertRaises(FileNotFoundError):
+            handle.attach()
+
+    def test_backtester_accepts_panel(self):
+        strategy = ThresholdStrategy(lower_threshold=98, upper_threshold=104)
+        with PricePanel(self.data) as panel:
+            from_panel = Backtester(panel, strategy, initial_cash=1000, sink=NullSink())
+            from_panel.run(vectorized=True)
+        from_frame = Backtester(self.data, strategy, initial_cash=1000, sink=NullSink())
+        from_frame.run(vectorized=True)
+        pd.testing.assert_frame_equal(from_panel.results(), from_frame.results())
+
+    def test_monte_carlo_workers_write_into_panel(self):
+        simulator = MonteCarloSimulation(100, 50, 20, 0.07, 0.2, seed=9, chunk_size=16)
+        with PricePanel.empty({"paths": (50, 21)}) as panel:
+            paths = simulator.run_simulation(workers=2, out=panel)
+            self.assertTrue(np.shares_memory(paths, panel["paths"]))
+            np.testing.assert_array_equal(panel["paths"], simulator.run_simulation())
+
+
+if __name__ == "__main__":
+    unittest.main()
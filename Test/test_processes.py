@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+from Engine.Monte_carlo import MonteCarloSimulation
+from Engine.processes import (
+    Garch11Process,
+    GeometricBrownianMotion,
+    HestonProcess,
+    MertonJumpDiffusion,
+    OrnsteinUhlenbeckProcess,
+)
+
+
+class TestProcesses(unittest.TestCase):
+    """
+    Unit tests for the pluggable price processes of MonteCarloSimulation.
+    """
+
+    def simulate(self, process, initial_value=100, num_simulations=20000, workers=None):
+        simulator = MonteCarloSimulation(initial_value, num_simulations, 50, 0.07, 0.2, seed=2, chunk_size=6000,
+                                         process=process)
+        return simulator, simulator.run_simulation(workers=workers)
+
+    def test_default_process_is_gbm(self):
+        _, default = self.simulate(None, num_simulations=100)
+        _, explicit = self.simulate(GeometricBrownianMotion(0.07, 0.2), num_simulations=100)
+        np.testing.assert_array_equal(default, explicit)
+        with self.assertRaises(ValueError):
+            GeometricBrownianMotion(0.07, 0.2).simulate(np.empty((21, 10)).T, np.random.default_rng(0), 100)
+
+    def test_merton_log_return_moments(self):
+        _, paths = self.simulate(MertonJumpDiffusion(0.07, 0.2, jump_intensity=4, jump_mean=-0.05, jump_std=0.1))
+        log_returns = np.log(paths[:, -1] / paths[:, 0])
+        self.assertAlmostEqual(log_returns.mean(), 0.07 + 4 * -0.05, delta=0.01)
+        self.assertAlmostEqual(log_returns.var(), 0.2**2 + 4 * (0.05**2 + 0.1**2), delta=0.01)
+
+    def test_heston_without_vol_of_vol_is_gbm(self):
+        _, paths = self.simulate(HestonProcess(0.07, 0.04, 2.0, 0.04, vol_of_vol=0.0, correlation=-0.5))
+        log_returns = np.log(paths[:, -1] / paths[:, 0])
+        self.assertAlmostEqual(log_returns.mean(), 0.07, delta=0.01)
+        self.assertAlmostEqual(log_returns.std(), 0.2, delta=0.01)
+
+    def test_garch_and_ou_moments(self):
+        _, paths = self.simulate(Garch11Process(0.0, omega=1e-5, alpha=0.1, beta=0.8))
+        log_returns = np.diff(np.log(paths), axis=1)
+        self.assertAlmostEqual(log_returns.var(), 1e-5 / 0.1, delta=1e-5)
+
+        simulator, paths = self.simulate(OrnsteinUhlenbeckProcess(4.0, 0.03, 0.02), initial_value=0.06)
+        self.assertAlmostEqual(paths[:, -1].mean(), 0.03 + 0.03 * np.exp(-4), delta=5e-4)
+        self.assertAlmostEqual(paths[:, -1].std(), 0.02 * np.sqrt((1 - np.exp(-8)) / 8), delta=5e-4)
+        self.assertAlmostEqual(simulator.summarize_streaming()["mean"], paths[:, -1].mean())
+
+    def test_parallel_run_is_bit_identical(self):
+        process = HestonProcess(0.07, 0.04, 2.0, 0.04, 0.3, -0.7)
+        _, serial = self.simulate(process, num_simulations=13000)
+        _, parallel = self.simulate(process, num_simulations=13000, workers=2)
+        np.testing.assert_array_equal(serial, parallel)
+        with self.assertRaises(ValueError):
+            self.simulate(process, num_simulations=100)[0].estimate(method="antithetic")
+
+
+if __name__ == "__main__":
+    unittest.main()
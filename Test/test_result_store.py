@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from Engine.Monte_carlo import MonteCarloSimulation
+from Engine.costs import ExecutionModel
+from Engine.processes import HestonProcess
+from Engine.strategy import ThresholdStrategy
+from Utils.result_store import ResultStore
+
+
+class TestResultStore(unittest.TestCase):
+    """
+    Unit tests for the memoized result store.
+    """
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.store = ResultStore(self.cache_dir)
+        rng = np.random.default_rng(6)
+        self.data = pd.DataFrame({
+            "date": pd.date_range(start="2025-01-01", periods=300),
+            "close": 100 + np.cumsum(rng.normal(0, 2, 300)),
+        }).set_index("date")
+
+    def test_backtest_hit_returns_stored_run(self):
+        results, metrics = self.store.backtest(self.data, ThresholdStrategy(98, 104), initial_cash=1000)
+        cached, cached_metrics = self.store.backtest(self.data.copy(), ThresholdStrategy(98, 104), initial_cash=1000)
+        self.assertEqual((self.store.hits, self.store.misses), (1, 1))
+        pd.testing.assert_frame_equal(cached, results)
+        self.assertEqual(cached_metrics, metrics)
+        self.assertIn("sharpe_ratio", metrics)
+
+        self.store.backtest(self.data, ThresholdStrategy(98, 104), initial_cash=1000, execution_model=ExecutionModel())
+        self.assertEqual(self.store.hits, 2)
+        costly, costly_metrics = self.store.backtest(self.data, ThresholdStrategy(98, 104), initial_cash=1000,
+                                                     execution_model=ExecutionModel(fixed_fee=1.0))
+        self.assertEqual(self.store.misses, 2)
+        self.assertNotEqual(costly_metrics, metrics)
+
+    def test_key_covers_data_strategy_and_settings(self):
+        strategy = ThresholdStrategy(98, 104)
+        key = ResultStore.fingerprint("backtest", self.data, strategy, 1000)
+        changed = self.data.copy()
+        changed.iloc[5, 0] += 0.01
+        self.assertEqual(key, ResultStore.fingerprint("backtest", self.data.copy(), ThresholdStrategy(98, 104), 1000))
+        self.assertNotEqual(key, ResultStore.fingerprint("backtest", changed, strategy, 1000))
+        self.assertNotEqual(key, ResultStore.fingerprint("backtest", self.data, ThresholdStrategy(98, 105), 1000))
+        self.assertNotEqual(key, ResultStore.fingerprint("backtest", self.data, strategy, 2000))
+
+    def test_simulation_memoized_by_settings_and_seed(self):
+        make = lambda seed, **options: MonteCarloSimulation(100, 200, 30, 0.07, 0.2, seed=seed, **options)
+        paths, summary = self.store.simulation(make(1))
+        cached, cached_summary = self.store.simulation(make(1))
+        np.testing.assert_array_equal(cached, paths)
+        self.assertEqual(cached_summary, summary)
+        self.assertEqual(self.store.hits, 1)
+
+        self.store.simulation(make(2))
+        self.store.simulation(make(1, process=HestonProcess(0.07, 0.04, 2.0, 0.04, 0.3, -0.7)))
+        self.store.simulation(make(None))
+        self.assertEqual((self.store.hits, self.store.misses), (1, 3))
+        self.assertEqual(len(self.store.cache.entries()), 3)
+
+    def test_size_bound_evicts_least_recently_used(self):
+        store = ResultStore(os.path.join(self.cache_dir, "bounded"), max_bytes=80000)
+        for seed in range(4):
+            store.simulation(MonteCarloSimulation(100, 100, 30, 0.07, 0.2, seed=seed))
+        self.assertLessEqual(sum(entry[2] for entry in store.cache.entries()), 80000)
+        store.simulation(MonteCarloSimulation(100, 100, 30, 0.07, 0.2, seed=3))
+        self.assertEqual(store.hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
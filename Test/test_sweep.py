@@ -0,0 +1,44 @@
+import unittest
+import numpy as np
+import pandas as pd
+from Engine.backtester import Backtester
+from Engine.strategy import MovingAverageCrossoverStrategy, ThresholdStrategy
+from Engine.sweep import ParameterSweep
+from Utils.data_loader import DataLoader
+
+
+class TestParameterSweep(unittest.TestCase):
+    """
+    The batched sweep must agree with one Backtester per combination.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.data = pd.DataFrame({
+            "date": pd.date_range(start="2025-01-01", periods=120),
+            "close": 100 + np.cumsum(rng.normal(0, 1.5, 120)),
+        }).set_index("date")
+        self.sweep = ParameterSweep(self.data, initial_cash=2000, batch_size=3)
+
+    def test_moving_average_grid(self):
+        results = self.sweep.moving_average_crossover([3, 5], [10, 20, 30])
+        self.assertEqual(len(results), 6)
+        for _, row in results.iterrows():
+            data = DataLoader.add_moving_averages(self.data.copy(), int(row["short_window"]), int(row["long_window"]))
+            strategy = MovingAverageCrossoverStrategy(int(row["short_window"]), int(row["long_window"]))
+            backtester = Backtester(data, strategy, initial_cash=2000)
+            backtester.run(vectorized=True)
+            self.assertEqual(row["final_value"], backtester.results()["portfolio_value"].iloc[-1])
+
+    def test_threshold_grid(self):
+        results = self.sweep.threshold([95, 98], [102, 105])
+        self.assertEqual(list(results.columns[:2]), ["lower_threshold", "upper_threshold"])
+        for _, row in results.iterrows():
+            backtester = Backtester(self.data, ThresholdStrategy(row["lower_threshold"], row["upper_threshold"]), 2000)
+            backtester.run(vectorized=True)
+            self.assertEqual(row["final_value"], backtester.results()["portfolio_value"].iloc[-1])
+            self.assertIn("sharpe_ratio", results.columns)
+
+
+if __name__ == "__main__":
+    unittest.main()
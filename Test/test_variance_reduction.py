@@ -0,0 +1,82 @@
+import unittest
+import numpy as np
+from Engine.Monte_carlo import MonteCarloSimulation
+from Engine.variance_reduction import antithetic_normals, brownian_bridge_increments, moment_matched_normals
+
+
+class TestVarianceReduction(unittest.TestCase):
+    """
+    Unit tests for the variance-reduction estimators of MonteCarloSimulation.
+    """
+
+    def setUp(self):
+        self.simulator = MonteCarloSimulation(100, 4096, 32, 0.07, 0.2, seed=7, chunk_size=1000)
+        self.expected = 100 * np.exp(0.07 + 0.2**2 / 2)
+
+    def test_shock_generators(self):
+        rng = np.random.default_rng(0)
+        shocks = antithetic_normals(rng, 7, 5)
+        self.assertEqual(shocks.shape, (8, 5))
+        np.testing.assert_array_equal(shocks[:4], -shocks[4:])
+
+        matched = moment_matched_normals(rng, 100, 5)
+        np.testing.assert_allclose(matched.mean(axis=0), 0, atol=1e-12)
+        np.testing.assert_allclose(matched.std(axis=0), 1)
+
+    def test_brownian_bridge_preserves_covariance(self):
+        normals = np.random.default_rng(1).standard_normal((200000, 6))
+        increments = brownian_bridge_increments(normals)
+        np.testing.assert_allclose(np.cov(increments, rowvar=False), np.eye(6), atol=0.02)
+        np.testing.assert_allclose(increments.sum(axis=1), np.sqrt(6) * normals[:, 0])
+
+    def test_plain_matches_run_simulation(self):
+        result = self.simulator.estimate()
+        final_values = self.simulator.run_simulation()[:, -1]
+        self.assertAlmostEqual(result["estimate"], np.mean(final_values))
+        self.assertAlmostEqual(result["effective_sample_size"], len(final_values))
+        self.assertLess(result["ci_low"], result["estimate"])
+        self.assertGreater(result["ci_high"], result["estimate"])
+
+    def test_methods_reduce_standard_error(self):
+        plain = self.simulator.estimate()
+        for method in ("antithetic", "moment_matching", "sobol"):
+            with self.subTest(method=method):
+                result = self.simulator.estimate(method=method)
+                self.assertLess(result["std_error"], plain["std_error"])
+                self.assertGreater(result["effective_sample_size"], result["num_paths"])
+                self.assertAlmostEqual(result["estimate"], self.expected, delta=5 * result["std_error"] + 0.05)
+
+        average = lambda paths: paths.mean(axis=1)
+        controlled = self.simulator.estimate(average, method="control_variate")
+        self.assertLess(controlled["std_error"], self.simulator.estimate(average)["std_error"] / 2)
+
+        with self.assertRaises(ValueError):
+            self.simulator.estimate(method="importance")
+
+    def test_degenerate_settings_are_rejected(self):
+        with self.assertRaises(ValueError):
+            self.simulator.estimate(method="control_variate")
+        with self.assertRaises(ValueError):
+            self.simulator.estimate(lambda paths: paths[:, -1], method="control_variate")
+        small = MonteCarloSimulation(100, 8, 32, 0.07, 0.2, seed=7)
+        one_path_each = MonteCarloSimulation(100, 20, 32, 0.07, 0.2, seed=7)
+        for method in ("moment_matching", "sobol"):
+            with self.subTest(method=method):
+                with self.assertRaises(ValueError):
+                    small.estimate(method=method, num_replicates=16)
+                with self.assertRaises(ValueError):
+                    one_path_each.estimate(method=method, num_replicates=16)
+                with self.assertRaises(ValueError):
+                    small.estimate(method=method, num_replicates=1)
+
+    def test_replicates_drop_the_remainder(self):
+        simulator = MonteCarloSimulation(100, 35, 32, 0.07, 0.2, seed=7)
+        for method in ("moment_matching", "sobol"):
+            with self.subTest(method=method):
+                result = simulator.estimate(method=method, num_replicates=4)
+                self.assertEqual(result["num_paths"], 32)
+                self.assertTrue(np.isfinite(result["std_error"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
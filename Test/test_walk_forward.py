@@ -0,0 +1,56 @@
+import unittest
+import numpy as np
+import pandas as pd
+from Engine.backtester import Backtester
+from Engine.strategy import MovingAverageCrossoverStrategy
+from Engine.sweep import ParameterSweep
+from Engine.walk_forward import WalkForward
+from Utils.data_loader import DataLoader
+
+
+class TestWalkForward(unittest.TestCase):
+    """
+    Unit tests for the walk-forward orchestrator.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        self.data = pd.DataFrame({
+            "date": pd.date_range(start="2020-01-01", periods=400),
+            "close": 100 + np.cumsum(rng.normal(0, 1.5, 400)),
+        }).set_index("date")
+
+    def test_windows(self):
+        rolling = WalkForward(self.data, train_size=150, test_size=100).windows()
+        self.assertEqual(rolling, [(0, 150, 250), (100, 250, 350), (200, 350, 400)])
+        anchored = WalkForward(self.data, train_size=150, test_size=100, anchored=True).windows()
+        self.assertEqual([window[0] for window in anchored], [0, 0, 0])
+
+    def test_sweep_warmup_only_feeds_indicators(self):
+        results = ParameterSweep(self.data, initial_cash=2000, warmup=150).moving_average_crossover([5], [20])
+        data = DataLoader.add_moving_averages(self.data.copy(), 5, 20).iloc[150:]
+        backtester = Backtester(data, MovingAverageCrossoverStrategy(5, 20), initial_cash=2000)
+        backtester.run(vectorized=True)
+        self.assertEqual(results["final_value"].iloc[0], backtester.results()["portfolio_value"].iloc[-1])
+
+    def test_best_train_parameters_are_tested(self):
+        walk_forward = WalkForward(self.data, train_size=150, test_size=100, initial_cash=2000)
+        results = walk_forward.moving_average_crossover([3, 5, 8], [20, 40])
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results["test_start"].iloc[1], self.data.index[250])
+
+        train = ParameterSweep(self.data.iloc[100:250], initial_cash=2000).moving_average_crossover([3, 5, 8], [20, 40])
+        best = train.loc[train["sharpe_ratio"].idxmax()]
+        self.assertEqual(results["short_window"].iloc[1], best["short_window"])
+        self.assertEqual(results["long_window"].iloc[1], best["long_window"])
+        self.assertEqual(results["train_sharpe_ratio"].iloc[1], best["sharpe_ratio"])
+
+    def test_process_pool_matches_serial(self):
+        walk_forward = WalkForward(self.data, train_size=150, test_size=100, initial_cash=2000)
+        serial = walk_forward.threshold([95, 98, 101], [103, 106])
+        parallel = walk_forward.threshold([95, 98, 101], [103, 106], workers=2)
+        pd.testing.assert_frame_equal(serial, parallel)
+
+
+if __name__ == "__main__":
+    unittest.main()
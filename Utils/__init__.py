@@ -1,7 +1,12 @@
 from .data_loader import DataLoader
+from .disk_cache import DiskCache
+from .indicators import ExponentialMovingAverage, Indicators, RollingMean, RollingStd
 from .metrics import Metrics
+from .online_stats import QuantileSketch, RunningMoments
+from .price_panel import PricePanel
+from .result_store import ResultStore
 
 # __init__.py
 
 
-__all__ = ['DataLoader', 'Metrics']
\ No newline at end of file
+__all__ = ['DataLoader', 'DiskCache', 'Indicators', 'RollingMean', 'RollingStd', 'ExponentialMovingAverage', 'Metrics', 'QuantileSketch', 'RunningMoments', 'PricePanel', 'ResultStore']
\ No newline at end of file
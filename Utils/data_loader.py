@@ -1,12 +1,17 @@
+import os
+
+import numpy as np
 import pandas as pd
 
+from .indicators import Indicators
+
 class DataLoader:
     """
     A class to load and preprocess historical market data.
     """
 
     @staticmethod
-    def load_csv(file_path, date_column, price_column):
+    def load_csv(file_path, date_column, price_column, cache=None):
         """
         Load historical data from a CSV file.
 
@@ -14,20 +19,72 @@ class DataLoader:
             file_path (str): Path to the CSV file.
             date_column (str): Name of the column containing dates.
             price_column (str): Name of the column containing prices.
+            cache (DiskCache): Optional cache of parsed frames. Entries are keyed by
+                the file path, modification time, size and column selection, and
+                are loaded memory-mapped instead of re-parsing the CSV.
 
         Returns:
             pd.DataFrame: A DataFrame with the historical data, indexed by date.
         """
+        if cache is not None:
+            source = os.path.abspath(file_path)
+            stat = os.stat(source)
+            key = cache.make_key("load_csv", source, stat.st_mtime_ns, stat.st_size, date_column, price_column)
+            cached = cache.load(key)
+            if cached is not None:
+                columns, _ = cached
+                return pd.DataFrame(
+                    {"close": columns["close"]}, index=pd.DatetimeIndex(columns["date"], name="date"), copy=False
+                )
+
         data = pd.read_csv(file_path)
         data[date_column] = pd.to_datetime(data[date_column])
         data = data[[date_column, price_column]].rename(
             columns={date_column: "date", price_column: "close"}
         )
         data.set_index("date", inplace=True)
+
+        if cache is not None and data["close"].dtype != object and isinstance(data.index.dtype, np.dtype):
+            cache.store(
+                key,
+                {"date": data.index.to_numpy(), "close": data["close"].to_numpy()},
+                meta={"source": source, "date_column": date_column, "price_column": price_column},
+            )
         return data
 
     @staticmethod
-    def add_moving_averages(data, short_window, long_window):
+    def iter_csv(file_path, date_column, price_column, chunksize=100000, price_dtype="float64"):
+        """
+        Stream historical data from a CSV file in date-indexed blocks.
+
+        Only the date and price columns are read, with explicit dtypes, so files
+        larger than memory can be processed block by block.
+
+        Parameters:
+            file_path (str): Path to the CSV file.
+            date_column (str): Name of the column containing dates.
+            price_column (str): Name of the column containing prices.
+            chunksize (int): Number of rows per block.
+            price_dtype (str or np.dtype): dtype of the price column.
+
+        Yields:
+            pd.DataFrame: Blocks with a "close" column, indexed by date.
+        """
+        with pd.read_csv(
+            file_path,
+            usecols=[date_column, price_column],
+            dtype={date_column: str, price_column: price_dtype},
+            chunksize=chunksize,
+        ) as reader:
+            for chunk in reader:
+                chunk[date_column] = pd.to_datetime(chunk[date_column])
+                chunk = chunk[[date_column, price_column]].rename(
+                    columns={date_column: "date", price_column: "close"}
+                )
+                yield chunk.set_index("date")
+
+    @staticmethod
+    def add_moving_averages(data, short_window, long_window, indicators=None, copy=False):
         """
         Add moving averages to the historical data.
 
@@ -35,10 +92,17 @@ class DataLoader:
             data (pd.DataFrame): Historical data with a "close" column.
             short_window (int): Lookback period for the short-term moving average.
             long_window (int): Lookback period for the long-term moving average.
+            indicators (Indicators): Memoized indicators of ``data["close"]``, so
+                repeated calls with the same windows do not recompute them.
+            copy (bool): If True, add the columns to a copy instead of ``data``.
 
         Returns:
             pd.DataFrame: DataFrame with additional columns for moving averages.
         """
-        data[f"short_ma_{short_window}"] = data["close"].rolling(window=short_window).mean()
-        data[f"long_ma_{long_window}"] = data["close"].rolling(window=long_window).mean()
+        if indicators is None:
+            indicators = Indicators(data["close"].to_numpy(dtype=float))
+        if copy:
+            data = data.copy()
+        data[f"short_ma_{short_window}"] = indicators.sma(short_window)
+        data[f"long_ma_{long_window}"] = indicators.sma(long_window)
         return data
@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+META_FILE = "meta.json"
+
+
+class DiskCache:
+    """
+    A directory of cached NumPy column sets with size-bounded LRU eviction.
+
+    Each entry is a subdirectory named by its key holding one ``.npy`` file per
+    column and a ``meta.json`` file. Entries are read back memory-mapped, so a
+    hit costs no parsing or copying. The meta file's modification time is the
+    entry's last access time for eviction.
+    """
+
+    def __init__(self, cache_dir, max_bytes=None):
+        """
+        Initialize the DiskCache.
+
+        Parameters:
+            cache_dir (str): Directory holding the cache entries; created if missing.
+            max_bytes (int): Total size above which least recently used entries
+                are evicted. None disables eviction.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts):
+        """
+        Build a cache key from hashable parts.
+
+        Parameters:
+            *parts: Values identifying the entry; their repr is hashed.
+
+        Returns:
+            str: Hex digest usable as a directory name.
+        """
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def _entry_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def load(self, key):
+        """
+        Load an entry and mark it as recently used.
+
+        Parameters:
+            key (str): Cache key.
+
+        Returns:
+            tuple: (columns, meta) with memory-mapped arrays, or None on a miss.
+        """
+        entry_dir = self._entry_dir(key)
+        meta_path = os.path.join(entry_dir, META_FILE)
+        try:
+            with open(meta_path) as file:
+                meta = json.load(file)
+            columns = {
+                name: np.load(os.path.join(entry_dir, f"{name}.npy"), mmap_mode="r") for name in meta["columns"]
+            }
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+        os.utime(meta_path)
+        return columns, meta
+
+    def store(self, key, columns, meta=None):
+        """
+        Write an entry, replacing any existing one with the same key, then evict.
+
+        Parameters:
+            key (str): Cache key.
+            columns (dict): Column name to NumPy array (no object dtypes).
+            meta (dict): JSON-serializable metadata stored with the entry.
+        """
+        staging_dir = tempfile.mkdtemp(prefix=".staging_", dir=self.cache_dir)
+        try:
+            for name, values in columns.items():
+                np.save(os.path.join(staging_dir, f"{name}.npy"), values, allow_pickle=False)
+            with open(os.path.join(staging_dir, META_FILE), "w") as file:
+                json.dump(dict(meta or {}, columns=list(columns)), file)
+            entry_dir = self._entry_dir(key)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(staging_dir, entry_dir)
+        except BaseException:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+        self.evict()
+
+    def entries(self):
+        """
+        List the cache entries.
+
+        Returns:
+            list: (key, meta, size_in_bytes, last_access_time) for every entry.
+        """
+        entries = []
+        for key in os.listdir(self.cache_dir):
+            entry_dir = self._entry_dir(key)
+            meta_path = os.path.join(entry_dir, META_FILE)
+            if key.startswith(".") or not os.path.exists(meta_path):
+                continue
+            with open(meta_path) as file:
+                meta = json.load(file)
+            size = sum(entry.stat().st_size for entry in os.scandir(entry_dir))
+            entries.append((key, meta, size, os.stat(meta_path).st_mtime))
+        return entries
+
+    def invalidate(self, key=None, **match):
+        """
+        Remove entries explicitly.
+
+        Parameters:
+            key (str): Remove only this entry.
+            **match: Remove entries whose metadata has all these values. With
+                neither a key nor a match, the whole cache is cleared.
+        """
+        if key is not None:
+            shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+            return
+        for entry_key, meta, _, _ in self.entries():
+            if all(meta.get(name) == value for name, value in match.items()):
+                shutil.rmtree(self._entry_dir(entry_key), ignore_errors=True)
+
+    def evict(self):
+        """
+        Remove least recently used entries until the cache fits in max_bytes.
+        """
+        if self.max_bytes is None:
+            return
+        entries = sorted(self.entries(), key=lambda entry: entry[3])
+        total = sum(entry[2] for entry in entries)
+        for key, _, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+            total -= size
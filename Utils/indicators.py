@@ -0,0 +1,354 @@
+import math
+
+import numpy as np
+from scipy.signal import lfilter
+
+
+def _window_sums(values, window):
+    """
+    Rolling sums of values and squares over the last axis, with valid-value counts.
+
+    Values are shifted by their mean before the cumulative sums to limit
+    cancellation error; NaNs are counted as missing.
+
+    Returns:
+        tuple: (sums, squares, counts, reference) for windows ending at index window - 1 onwards.
+    """
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    reference = filled.sum(axis=-1, keepdims=True) / np.maximum(valid.sum(axis=-1, keepdims=True), 1)
+    shifted = np.where(valid, filled - reference, 0.0)
+
+    def rolling(x):
+        total = np.cumsum(x, axis=-1)
+        lagged = np.concatenate([np.zeros(total.shape[:-1] + (1,)), total[..., :-window]], axis=-1)
+        return total[..., window - 1:] - lagged
+
+    return rolling(shifted), rolling(shifted * shifted), rolling(valid.astype(np.int64)), reference
+
+
+def _check_window(window):
+    """
+    Raise ValueError unless the lookback period is at least one bar.
+    """
+    if window < 1:
+        raise ValueError(f"window must be at least 1, got {window}.")
+
+
+def _constant_windows(values, window):
+    """
+    Mask of the windows whose values are all equal, for windows ending at index window - 1 onwards.
+
+    Like pandas, the rolling statistics return such windows exactly (the value
+    itself, or a zero deviation) instead of the cumulative-sum result, whose
+    rounding error would otherwise turn equal moving averages into crossovers.
+    """
+    positions = np.arange(values.shape[-1])
+    changed = np.ones(values.shape, dtype=bool)
+    changed[..., 1:] = values[..., 1:] != values[..., :-1]
+    run_start = np.maximum.accumulate(np.where(changed, positions, 0), axis=-1)
+    return (positions - run_start + 1)[..., window - 1:] >= window
+
+
+def rolling_mean(values, window):
+    """
+    Simple moving average along the last axis, using cumulative sums.
+
+    Matches ``pd.Series.rolling(window).mean()``: the first window - 1 values, and
+    any window containing a NaN, are NaN, and windows of equal values give that
+    value exactly.
+
+    Parameters:
+        values (np.ndarray): Input series, 1-D or a (paths, time) panel.
+        window (int): Lookback period.
+
+    Returns:
+        np.ndarray: Moving averages, same shape as values.
+    """
+    _check_window(window)
+    values = np.asarray(values, dtype=float)
+    out = np.full(values.shape, np.nan)
+    if window > values.shape[-1]:
+        return out
+    sums, _, counts, reference = _window_sums(values, window)
+    means = np.where(counts == window, sums / window + reference, np.nan)
+    out[..., window - 1:] = np.where(_constant_windows(values, window), values[..., window - 1:], means)
+    return out
+
+
+def rolling_std(values, window, ddof=1):
+    """
+    Rolling standard deviation along the last axis, using cumulative sums.
+
+    Parameters:
+        values (np.ndarray): Input series, 1-D or a (paths, time) panel.
+        window (int): Lookback period.
+        ddof (int): Delta degrees of freedom (1 as in pandas).
+
+    Returns:
+        np.ndarray: Rolling standard deviations, same shape as values.
+    """
+    _check_window(window)
+    values = np.asarray(values, dtype=float)
+    out = np.full(values.shape, np.nan)
+    if window > values.shape[-1] or window <= ddof:
+        return out
+    sums, squares, counts, _ = _window_sums(values, window)
+    variance = np.maximum(squares - sums * sums / window, 0.0) / (window - ddof)
+    stds = np.where(counts == window, np.sqrt(variance), np.nan)
+    out[..., window - 1:] = np.where(_constant_windows(values, window), 0.0, stds)
+    return out
+
+
+def ema(values, span, initial=None):
+    """
+    Exponential moving average along the last axis with smoothing 2 / (span + 1).
+
+    Uses the recursive form ``y[t] = a * x[t] + (1 - a) * y[t - 1]``, as
+    ``pd.Series.ewm(span=span, adjust=False).mean()``.
+
+    Parameters:
+        values (np.ndarray): Input series, 1-D or a (paths, time) panel.
+        span (float): Span of the average.
+        initial (np.ndarray): Average before the first value, to continue a
+            previous run. Defaults to starting at the first value.
+
+    Returns:
+        np.ndarray: Exponential moving averages, same shape as values.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.shape[-1] == 0:
+        return values.copy()
+    alpha = 2 / (span + 1)
+    if initial is None:
+        initial = values[..., :1]
+    zi = (1 - alpha) * np.asarray(initial, dtype=float).reshape(values.shape[:-1] + (1,))
+    out, _ = lfilter([alpha], [1, alpha - 1], values, axis=-1, zi=zi)
+    return out
+
+
+class Indicators:
+    """
+    A class to compute and memoize batch indicators for one price series.
+
+    Each (indicator, window) pair is computed once. New bars can be appended with
+    ``extend``, which only computes the new tail of every memoized indicator.
+    """
+
+    def __init__(self, values):
+        """
+        Initialize Indicators.
+
+        Parameters:
+            values (np.ndarray): Price series, 1-D or a (paths, time) panel.
+        """
+        self.values = np.asarray(values, dtype=float)
+        self._memo = {}
+
+    def sma(self, window):
+        """
+        Returns:
+            np.ndarray: Simple moving average over ``window`` bars.
+        """
+        return self._get("sma", window)
+
+    def rolling_std(self, window):
+        """
+        Returns:
+            np.ndarray: Rolling standard deviation over ``window`` bars.
+        """
+        return self._get("rolling_std", window)
+
+    def ema(self, span):
+        """
+        Returns:
+            np.ndarray: Exponential moving average with the given span.
+        """
+        return self._get("ema", span)
+
+    def _get(self, name, window):
+        key = (name, window)
+        if key not in self._memo:
+            self._memo[key] = self._compute(name, window, self.values)
+        return self._memo[key]
+
+    @staticmethod
+    def _compute(name, window, values, previous=None):
+        if name == "sma":
+            return rolling_mean(values, window)
+        if name == "rolling_std":
+            return rolling_std(values, window)
+        return ema(values, window, initial=previous)
+
+    def extend(self, new_values):
+        """
+        Append new bars and update every memoized indicator from its tail only.
+
+        Parameters:
+            new_values (np.ndarray): New bars along the last axis.
+        """
+        new_values = np.asarray(new_values, dtype=float)
+        count = new_values.shape[-1]
+        values = np.concatenate([self.values, new_values], axis=-1)
+        for (name, window), result in self._memo.items():
+            if name == "ema":
+                tail = self._compute(name, window, new_values, previous=result[..., -1:] if result.shape[-1] else None)
+            else:
+                tail = self._compute(name, window, values[..., -(window - 1 + count):])[..., -count:]
+            self._memo[(name, window)] = np.concatenate([result, tail], axis=-1)
+        self.values = values
+
+
+class RollingMean:
+    """
+    Incremental simple moving average with O(1) updates from a ring buffer.
+    """
+
+    def __init__(self, window):
+        """
+        Parameters:
+            window (int): Lookback period.
+        """
+        _check_window(window)
+        self.window = window
+        self._buffer = np.zeros(window)
+        self._count = 0  # Bars seen so far
+        self._sum = 0.0  # Sum of the non-NaN values in the buffer
+        self._nans = 0  # NaNs in the buffer
+        self._last = np.nan
+        self._run = 0  # Consecutive bars equal to the last one
+
+    def update(self, value):
+        """
+        Add a new bar.
+
+        Parameters:
+            value (float): The new value.
+
+        Returns:
+            float: The moving average, NaN until ``window`` bars were seen.
+        """
+        slot = self._count % self.window
+        old = self._buffer[slot]
+        # NaNs are counted instead of summed, so the sum recovers once they leave the window
+        if math.isnan(old):
+            self._nans -= 1
+        else:
+            self._sum -= old
+        if math.isnan(value):
+            self._nans += 1
+        else:
+            self._sum += value
+        self._buffer[slot] = value
+        self._count += 1
+        self._run = self._run + 1 if value == self._last else 1
+        self._last = value
+        if slot == self.window - 1:
+            # Re-sum once per window to stop rounding drift (amortized O(1))
+            self._sum = np.nansum(self._buffer)
+        return self.value
+
+    @property
+    def value(self):
+        if self._count < self.window or self._nans:
+            return np.nan
+        # A window of equal values is exact, as in rolling_mean
+        return self._last if self._run >= self.window else self._sum / self.window
+
+
+class RollingStd:
+    """
+    Incremental rolling standard deviation with O(1) updates from a ring buffer.
+    """
+
+    def __init__(self, window, ddof=1):
+        """
+        Parameters:
+            window (int): Lookback period.
+            ddof (int): Delta degrees of freedom (1 as in pandas).
+        """
+        _check_window(window)
+        self.window = window
+        self.ddof = ddof
+        self._buffer = np.zeros(window)
+        self._count = 0
+        self._reference = None  # Values are shifted by the first non-NaN bar to limit cancellation
+        self._sum = 0.0  # Sums of the non-NaN shifted values in the buffer and of their squares
+        self._squares = 0.0
+        self._nans = 0  # NaNs in the buffer
+        self._last = np.nan
+        self._run = 0  # Consecutive bars equal to the last one
+
+    def update(self, value):
+        """
+        Add a new bar.
+
+        Parameters:
+            value (float): The new value.
+
+        Returns:
+            float: The rolling standard deviation, NaN until ``window`` bars were seen.
+        """
+        if self._reference is None and not math.isnan(value):
+            self._reference = value
+        shifted = value if math.isnan(value) else value - self._reference
+        slot = self._count % self.window
+        old = self._buffer[slot]
+        if math.isnan(old):
+            self._nans -= 1
+        else:
+            self._sum -= old
+            self._squares -= old * old
+        if math.isnan(shifted):
+            self._nans += 1
+        else:
+            self._sum += shifted
+            self._squares += shifted * shifted
+        self._buffer[slot] = shifted
+        self._count += 1
+        self._run = self._run + 1 if value == self._last else 1
+        self._last = value
+        if slot == self.window - 1:
+            valid = np.where(np.isnan(self._buffer), 0.0, self._buffer)
+            self._sum = valid.sum()
+            self._squares = np.dot(valid, valid)
+        return self.value
+
+    @property
+    def value(self):
+        if self._count < self.window or self.window <= self.ddof or self._nans:
+            return np.nan
+        if self._run >= self.window:
+            return 0.0
+        variance = max(self._squares - self._sum * self._sum / self.window, 0.0) / (self.window - self.ddof)
+        return np.sqrt(variance)
+
+
+class ExponentialMovingAverage:
+    """
+    Incremental exponential moving average with smoothing 2 / (span + 1).
+    """
+
+    def __init__(self, span):
+        """
+        Parameters:
+            span (float): Span of the average.
+        """
+        self.alpha = 2 / (span + 1)
+        self.value = np.nan
+
+    def update(self, value):
+        """
+        Add a new bar.
+
+        Parameters:
+            value (float): The new value.
+
+        Returns:
+            float: The exponential moving average.
+        """
+        if np.isnan(self.value):
+            self.value = value
+        else:
+            self.value = self.alpha * value + (1 - self.alpha) * self.value
+        return self.value
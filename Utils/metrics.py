@@ -79,3 +79,62 @@ class Metrics:
         cumulative_max = np.maximum.accumulate(portfolio_values)
         drawdowns = (portfolio_values - cumulative_max) / cumulative_max
         return np.min(drawdowns)
+
+    @staticmethod
+    def calculate_batch_metrics(portfolio_values, risk_free_rate=0.01, confidence_level=0.95):
+        """
+        Calculate every metric for many equity curves in one vectorized pass.
+
+        Returns, running maxima and drawdowns are computed once and shared by all
+        metrics. Annualized return, volatility, Sharpe ratio and maximum drawdown
+        agree with the single-curve methods.
+
+        Parameters:
+            portfolio_values (np.ndarray): Daily portfolio values, shape (time,) or (paths, time).
+            risk_free_rate (float): Risk-free rate (default: 1%).
+            confidence_level (float): Confidence level of the historical VaR and CVaR.
+
+        Returns:
+            dict: Metric name to an array with one value per path (a scalar array for 1-D input):
+                cumulative_return, annualized_return, annualized_volatility, sharpe_ratio,
+                sortino_ratio, calmar_ratio, max_drawdown, max_drawdown_duration (in bars),
+                value_at_risk and conditional_value_at_risk (daily losses as positive numbers).
+                Every metric is NaN for curves shorter than two values, which have no returns.
+        """
+        values = np.asarray(portfolio_values, dtype=float)
+        num_days = values.shape[-1]
+        if num_days < 2:
+            names = ("cumulative_return", "annualized_return", "annualized_volatility", "sharpe_ratio",
+                     "sortino_ratio", "calmar_ratio", "max_drawdown", "max_drawdown_duration", "value_at_risk",
+                     "conditional_value_at_risk")
+            return {name: np.full(values.shape[:-1], np.nan) for name in names}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            daily_returns = np.diff(values, axis=-1) / values[..., :-1]
+
+            total_return = values[..., -1] / values[..., 0] - 1
+            annualized_return = (1 + total_return) ** (252 / num_days) - 1
+            annualized_volatility = np.std(daily_returns, axis=-1) * np.sqrt(252)
+            downside_deviation = np.sqrt(np.mean(np.minimum(daily_returns, 0) ** 2, axis=-1)) * np.sqrt(252)
+
+            cumulative_max = np.maximum.accumulate(values, axis=-1)
+            max_drawdown = np.min((values - cumulative_max) / cumulative_max, axis=-1)
+            bars = np.arange(num_days)
+            last_peak = np.maximum.accumulate(np.where(values < cumulative_max, 0, bars), axis=-1)
+            max_drawdown_duration = np.max(bars - last_peak, axis=-1)
+
+            cutoff = np.quantile(daily_returns, 1 - confidence_level, axis=-1, keepdims=True)
+            tail = daily_returns <= cutoff
+            expected_shortfall = np.sum(np.where(tail, daily_returns, 0), axis=-1) / np.sum(tail, axis=-1)
+
+            return {
+                "cumulative_return": total_return,
+                "annualized_return": annualized_return,
+                "annualized_volatility": annualized_volatility,
+                "sharpe_ratio": (annualized_return - risk_free_rate) / annualized_volatility,
+                "sortino_ratio": (annualized_return - risk_free_rate) / downside_deviation,
+                "calmar_ratio": annualized_return / np.abs(max_drawdown),
+                "max_drawdown": max_drawdown,
+                "max_drawdown_duration": max_drawdown_duration,
+                "value_at_risk": -cutoff[..., 0],
+                "conditional_value_at_risk": -expected_shortfall,
+            }
@@ -0,0 +1,143 @@
+import numpy as np
+
+
+class RunningMoments:
+    """
+    A class to accumulate count, mean, standard deviation, min and max over blocks of values.
+
+    Accumulators can be merged, so blocks may be processed independently and combined.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty accumulator.
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        """
+        Add a block of values.
+
+        Parameters:
+            values (np.ndarray): Values to add.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        if len(values) == 0:
+            return
+        block = RunningMoments()
+        block.count = len(values)
+        block.mean = values.mean()
+        block.m2 = np.square(values - block.mean).sum()
+        block.min = values.min()
+        block.max = values.max()
+        self.merge(block)
+
+    def merge(self, other):
+        """
+        Merge another accumulator into this one (Chan et al. parallel update).
+
+        Parameters:
+            other (RunningMoments): Accumulator to merge.
+        """
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta**2 * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def std(self):
+        """
+        Population standard deviation of the values seen so far (as np.std).
+        """
+        return np.sqrt(self.m2 / self.count) if self.count else np.nan
+
+
+class QuantileSketch:
+    """
+    A mergeable sketch for approximate quantiles in bounded memory.
+
+    Values are kept in levels of sorted compactors; level h holds items of weight 2**h.
+    Whenever a level grows beyond k items it is sorted and every other item (from a
+    random offset) is promoted to the next level, so memory stays O(k log(n / k)).
+    """
+
+    def __init__(self, k=512, seed=None):
+        """
+        Initialize an empty sketch.
+
+        Parameters:
+            k (int): Capacity of each level; larger values give more accurate quantiles.
+            seed (int or np.random.SeedSequence): Seed for the compaction offsets.
+        """
+        self.k = k
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        """
+        Add a block of values.
+
+        Parameters:
+            values (np.ndarray): Values to add.
+        """
+        self.levels[0] = np.concatenate([self.levels[0], np.asarray(values, dtype=float).ravel()])
+        self._compress()
+
+    def merge(self, other):
+        """
+        Merge another sketch into this one.
+
+        Parameters:
+            other (QuantileSketch): Sketch to merge.
+        """
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+
+    def _compress(self):
+        """
+        Compact every level that exceeds the capacity.
+        """
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.k:
+                items = np.sort(items)
+                keep = len(items) % 2
+                offset = self._rng.integers(2)
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], items[keep + offset::2]])
+                self.levels[level] = items[:keep]
+            level += 1
+
+    def quantile(self, q):
+        """
+        Estimate one or more quantiles.
+
+        Parameters:
+            q (float or array-like): Quantile(s) between 0 and 1.
+
+        Returns:
+            float or np.ndarray: Estimated quantile value(s).
+        """
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0**h) for h, level in enumerate(self.levels)])
+        if len(items) == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        order = np.argsort(items)
+        cumulative = np.cumsum(weights[order])
+        ranks = np.asarray(q) * cumulative[-1]
+        index = np.minimum(np.searchsorted(cumulative, ranks), len(items) - 1)
+        return items[order][index]
@@ -0,0 +1,251 @@
+import os
+import shutil
+import tempfile
+import weakref
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+BACKENDS = ("shared_memory", "memmap")
+
+
+def _open_segment(name):
+    """
+    Attach to an existing shared memory segment without registering it for cleanup
+    in this process, so a worker exiting does not unlink the owner's segment.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no track argument
+        return shared_memory.SharedMemory(name=name)
+
+
+def _release(segments, directory, unlink):
+    """
+    Unmap the segments of a panel and, for the owner, delete the underlying storage.
+
+    Module-level so that weakref.finalize does not keep the panel alive.
+    """
+    for segment in segments:
+        try:
+            segment.close()
+        except BufferError:
+            pass  # Arrays handed out still map the segment; it is unmapped when they are freed
+        if unlink:
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+    if unlink and directory is not None:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+class PricePanelHandle:
+    """
+    A small picklable description of a PricePanel's storage, used to reattach in another process.
+    """
+
+    __slots__ = ("backend", "specs", "index", "directory")
+
+    def __init__(self, backend, specs, index, directory):
+        """
+        Parameters:
+            backend (str): "shared_memory" or "memmap".
+            specs (dict): Column name to (shape, dtype string, segment name or file path).
+            index (pd.Index): Row labels of the 1-D columns, or None.
+            directory (str): Directory of the memmap files, or None.
+        """
+        self.backend = backend
+        self.specs = specs
+        self.index = index
+        self.directory = directory
+
+    def __getstate__(self):
+        return self.backend, self.specs, self.index, self.directory
+
+    def __setstate__(self, state):
+        self.backend, self.specs, self.index, self.directory = state
+
+    def attach(self):
+        """
+        Map the panel into this process without copying.
+
+        Returns:
+            PricePanel: A non-owning view of the panel.
+        """
+        return PricePanel.attach(self)
+
+
+class PricePanel:
+    """
+    Named price and indicator columns stored in shared memory or memory-mapped files.
+
+    The process that creates a panel owns its storage. Pickling a panel, e.g. as
+    an argument to a ProcessPoolExecutor task, sends only a PricePanelHandle; the
+    worker reattaches to the same pages zero-copy. The owner deletes the storage
+    on close(), when used as a context manager, or when it is garbage collected.
+    """
+
+    def __init__(self, columns, index=None, backend="shared_memory", directory=None):
+        """
+        Copy columns into a new shared panel.
+
+        Parameters:
+            columns (dict or pd.DataFrame): Column name to NumPy array. The numeric
+                columns of a DataFrame are used, with its index.
+            index (pd.Index): Row labels for to_frame. Defaults to the DataFrame's index.
+            backend (str): "shared_memory" (POSIX shared memory) or "memmap" (.npy
+                files, which can exceed RAM and be paged from disk).
+            directory (str): Parent directory of the memmap files. Defaults to the
+                system temporary directory.
+        """
+        if isinstance(columns, pd.DataFrame):
+            index = columns.index if index is None else index
+            columns = {name: columns[name].to_numpy() for name in columns.select_dtypes("number").columns}
+        columns = {name: np.asarray(values) for name, values in columns.items()}
+        self._create({name: (values.shape, values.dtype) for name, values in columns.items()}, index, backend,
+                     directory)
+        for name, values in columns.items():
+            self._arrays[name][...] = values
+
+    @classmethod
+    def empty(cls, shapes, dtype=np.float64, index=None, backend="shared_memory", directory=None):
+        """
+        Allocate an uninitialized panel, e.g. as an output buffer for parallel workers.
+
+        Parameters:
+            shapes (dict): Column name to array shape.
+            dtype (np.dtype): dtype of every column.
+            index (pd.Index): Row labels for to_frame.
+            backend (str): "shared_memory" or "memmap".
+            directory (str): Parent directory of the memmap files.
+
+        Returns:
+            PricePanel: The owning panel.
+        """
+        panel = cls.__new__(cls)
+        panel._create({name: (tuple(np.atleast_1d(shape)), np.dtype(dtype)) for name, shape in shapes.items()},
+                      index, backend, directory)
+        return panel
+
+    def _create(self, layout, index, backend, directory):
+        """
+        Allocate storage for every column and map it.
+
+        Parameters:
+            layout (dict): Column name to (shape, dtype).
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}; expected one of {BACKENDS}.")
+        self.owner = True
+        self.index = index
+        self.backend = backend
+        self._arrays = {}
+        self._segments = []
+        self._directory = tempfile.mkdtemp(prefix="price_panel_", dir=directory) if backend == "memmap" else None
+        specs = {}
+
+        for position, (name, (shape, dtype)) in enumerate(layout.items()):
+            nbytes = int(np.prod(shape)) * dtype.itemsize
+            if backend == "shared_memory":
+                segment = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+                self._segments.append(segment)
+                self._arrays[name] = np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+                specs[name] = (shape, dtype.str, segment.name)
+            else:
+                path = os.path.join(self._directory, f"{position}.npy")
+                self._arrays[name] = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+                specs[name] = (shape, dtype.str, path)
+
+        self._handle = PricePanelHandle(backend, specs, index, self._directory)
+        self._finalizer = weakref.finalize(self, _release, self._segments, self._directory, True)
+
+    @classmethod
+    def attach(cls, handle):
+        """
+        Map an existing panel into this process without copying.
+
+        Parameters:
+            handle (PricePanelHandle): Handle from PricePanel.handle().
+
+        Returns:
+            PricePanel: A non-owning view; close() detaches without deleting the storage.
+        """
+        panel = cls.__new__(cls)
+        panel.owner = False
+        panel.index = handle.index
+        panel.backend = handle.backend
+        panel._arrays = {}
+        panel._segments = []
+        panel._directory = handle.directory
+        panel._handle = handle
+
+        for name, (shape, dtype, location) in handle.specs.items():
+            if handle.backend == "shared_memory":
+                segment = _open_segment(location)
+                panel._segments.append(segment)
+                panel._arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+            else:
+                panel._arrays[name] = np.load(location, mmap_mode="r+")
+
+        panel._finalizer = weakref.finalize(panel, _release, panel._segments, None, False)
+        return panel
+
+    def handle(self):
+        """
+        Picklable handle to send to worker processes.
+
+        Returns:
+            PricePanelHandle: Handle whose attach() maps the panel.
+        """
+        return self._handle
+
+    def __reduce__(self):
+        return PricePanel.attach, (self._handle,)
+
+    @property
+    def columns(self):
+        return list(self._arrays)
+
+    def __getitem__(self, name):
+        return self._arrays[name]
+
+    def __contains__(self, name):
+        return name in self._arrays
+
+    def __len__(self):
+        first = next(iter(self._arrays.values()), None)
+        return 0 if first is None else len(first)
+
+    @property
+    def nbytes(self):
+        return sum(values.nbytes for values in self._arrays.values())
+
+    def to_frame(self, columns=None):
+        """
+        DataFrame of 1-D columns, e.g. to pass to Backtester.
+
+        Parameters:
+            columns (list of str): Columns to include. Defaults to every 1-D column.
+
+        Returns:
+            pd.DataFrame: Frame indexed by the panel's index.
+        """
+        if columns is None:
+            columns = [name for name, values in self._arrays.items() if values.ndim == 1]
+        return pd.DataFrame({name: self._arrays[name] for name in columns}, index=self.index, copy=False)
+
+    def close(self):
+        """
+        Unmap the panel in this process; the owner also deletes the storage.
+
+        Safe to call more than once.
+        """
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
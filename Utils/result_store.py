@@ -0,0 +1,190 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from .disk_cache import DiskCache
+from .metrics import Metrics
+
+
+def _update_fingerprint(hasher, value):
+    """
+    Feed a value's content into a hash, recursing into containers and plain objects.
+
+    Arrays and frames contribute their bytes, so two equal datasets hash equally
+    however they were built; objects such as strategies and stochastic processes
+    contribute their class and attributes.
+    """
+    if isinstance(value, pd.DataFrame):
+        hasher.update(b"frame")
+        _update_fingerprint(hasher, [str(dtype) for dtype in value.dtypes])
+        _update_fingerprint(hasher, list(value.columns))
+        hasher.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, (pd.Series, pd.Index)):
+        _update_fingerprint(hasher, value.to_frame())
+    elif isinstance(value, np.ndarray):
+        hasher.update(f"array{value.dtype.str}{value.shape}".encode())
+        if value.dtype == object:
+            _update_fingerprint(hasher, value.tolist())
+        else:
+            hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, np.random.SeedSequence):
+        _update_fingerprint(hasher, ("SeedSequence", value.entropy, value.spawn_key, value.n_children_spawned))
+    elif isinstance(value, (list, tuple)):
+        hasher.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            _update_fingerprint(hasher, item)
+    elif isinstance(value, dict):
+        hasher.update(f"dict{len(value)}".encode())
+        for name in sorted(value, key=repr):
+            _update_fingerprint(hasher, name)
+            _update_fingerprint(hasher, value[name])
+    elif hasattr(value, "__dict__") and not isinstance(value, type):
+        hasher.update(f"{type(value).__module__}.{type(value).__qualname__}".encode())
+        _update_fingerprint(hasher, vars(value))
+    else:
+        hasher.update(f"{type(value).__name__}:{value!r}".encode())
+
+
+class ResultStore:
+    """
+    A persistent, size-bounded memo of backtest and simulation results.
+
+    Results are keyed by a content hash of everything that determines them: the
+    input data, the strategy class and parameters, the simulation settings and
+    the seed. Curves are stored as ``.npy`` columns and scalar metrics as entry
+    metadata in a DiskCache, so a hit is a memory-mapped read.
+    """
+
+    def __init__(self, cache_dir, max_bytes=None):
+        """
+        Initialize the ResultStore.
+
+        Parameters:
+            cache_dir (str): Directory holding the stored results; created if missing.
+            max_bytes (int): Total size above which least recently used results are
+                evicted. None disables eviction.
+        """
+        self.cache = DiskCache(cache_dir, max_bytes=max_bytes)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(*parts):
+        """
+        Content hash of the inputs of a run.
+
+        Parameters:
+            *parts: Arrays, frames, strategies, settings and seeds identifying the run.
+
+        Returns:
+            str: Hex digest usable as a cache key.
+        """
+        hasher = hashlib.sha256()
+        _update_fingerprint(hasher, parts)
+        return hasher.hexdigest()
+
+    def get_or_compute(self, key, compute):
+        """
+        Return a stored result, or compute and store it.
+
+        Parameters:
+            key (str): Cache key, e.g. from fingerprint.
+            compute (callable): Returns (columns, meta): a dict of NumPy arrays and
+                a JSON-serializable dict.
+
+        Returns:
+            tuple: (columns, meta); columns are memory-mapped on a hit.
+        """
+        cached = self.cache.load(key)
+        if cached is not None:
+            self.hits += 1
+            columns, meta = cached
+            meta.pop("columns", None)
+            return columns, meta
+        self.misses += 1
+        columns, meta = compute()
+        self.cache.store(key, columns, meta)
+        return columns, meta
+
+    def backtest(self, historical_data, strategy, initial_cash=100000, vectorized=True, execution_model=None):
+        """
+        Run a Backtester, or return the stored run with the same inputs.
+
+        Parameters:
+            historical_data (pd.DataFrame): Historical price data.
+            strategy (object): Strategy object; its class and attributes are part of the key.
+            initial_cash (float): Starting cash for the portfolio.
+            vectorized (bool): Passed to Backtester.run.
+            execution_model (ExecutionModel): Transaction costs and position sizing;
+                its settings are part of the key.
+
+        Returns:
+            tuple: (results, metrics): the Backtester.results() frame and the
+                Metrics.calculate_batch_metrics of its portfolio values.
+        """
+        from Engine.backtester import Backtester
+        from Engine.costs import ExecutionModel
+        from Engine.events import NullSink
+
+        def compute():
+            backtester = Backtester(historical_data, strategy, initial_cash=initial_cash, sink=NullSink(),
+                                    execution_model=execution_model)
+            backtester.run(vectorized=vectorized)
+            results = backtester.results()
+            return {name: results[name].to_numpy() for name in results.columns}, {
+                "kind": "backtest",
+                "metrics": _scalar_metrics(results["portfolio_value"].to_numpy(dtype=float)),
+            }
+
+        key = self.fingerprint("backtest", historical_data, strategy, initial_cash, vectorized,
+                               execution_model if execution_model is not None else ExecutionModel())
+        if historical_data.index.dtype == object or not isinstance(historical_data.index.dtype, np.dtype):
+            # Object and timezone-aware dates cannot be stored as .npy columns
+            columns, meta = compute()
+        else:
+            columns, meta = self.get_or_compute(key, compute)
+        return pd.DataFrame(columns), meta["metrics"]
+
+    def simulation(self, simulator, workers=None):
+        """
+        Run a MonteCarloSimulation, or return the stored paths of the same settings and seed.
+
+        Simulations without a fixed seed are random by design and are never stored.
+
+        Parameters:
+            simulator (MonteCarloSimulation): The configured simulation.
+            workers (int): Passed to run_simulation on a miss.
+
+        Returns:
+            tuple: (paths, summary): the simulated paths and summarize_simulation(paths).
+        """
+        def compute():
+            paths = simulator.run_simulation(workers=workers)
+            summary = {name: float(value) for name, value in simulator.summarize_simulation(paths).items()}
+            return {"paths": paths}, {"kind": "simulation", "summary": summary}
+
+        if simulator.seed is None:
+            columns, meta = compute()
+        else:
+            columns, meta = self.get_or_compute(self.fingerprint("simulation", simulator), compute)
+        return columns["paths"], meta["summary"]
+
+    def clear(self, kind=None):
+        """
+        Remove stored results.
+
+        Parameters:
+            kind (str): "backtest" or "simulation" to remove only that kind; None removes all.
+        """
+        if kind is None:
+            self.cache.invalidate()
+        else:
+            self.cache.invalidate(kind=kind)
+
+
+def _scalar_metrics(portfolio_values):
+    """
+    Batch metrics of one equity curve as JSON-serializable floats.
+    """
+    return {name: float(value) for name, value in Metrics.calculate_batch_metrics(portfolio_values).items()}
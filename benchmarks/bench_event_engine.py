@@ -0,0 +1,49 @@
+"""
+Benchmark the event throughput of EventDrivenBacktester over many symbols.
+
+Run from the repository root:
+    python -m benchmarks.bench_event_engine
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from Engine.event_engine import LIMIT, EventDrivenBacktester
+from Engine.events import NullSink
+
+
+class IdleStrategy:
+    def on_bar(self, bar, engine):
+        pass
+
+
+class MeanReversionStrategy:
+    """
+    Rests a limit buy below the close when the price dips, sells at market when it recovers.
+    """
+
+    def on_bar(self, bar, engine):
+        if bar.close < 99 and engine.position(bar.symbol) == 0:
+            engine.submit_order(bar.symbol, 10, LIMIT, bar.close * 0.999)
+        elif bar.close > 101 and engine.position(bar.symbol) > 0:
+            engine.submit_order(bar.symbol, -engine.position(bar.symbol))
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    num_symbols, num_bars = 50, 20000
+    index = pd.date_range("2020-01-01", periods=num_bars, freq="min")
+    data = {
+        f"S{i:02d}": pd.DataFrame({"close": 100 * np.exp(np.cumsum(rng.normal(0, 0.001, num_bars)))}, index=index)
+        for i in range(num_symbols)
+    }
+
+    for strategy in (IdleStrategy(), MeanReversionStrategy()):
+        engine = EventDrivenBacktester(data, strategy, sink=NullSink())
+        start = time.perf_counter()
+        engine.run()
+        elapsed = time.perf_counter() - start
+        print(f"{type(strategy).__name__:24s} {engine.events_processed:,d} events {elapsed:6.2f} s   "
+              f"{engine.events_processed / elapsed * 3600 / 1e6:5.0f}M events/hour   "
+              f"{len(engine.portfolio.get_transaction_history()):,d} fills")
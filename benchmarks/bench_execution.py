@@ -0,0 +1,33 @@
+"""
+Benchmark execute_signals for every sizing method against the uncompiled reference loop.
+
+Run from the repository root:
+    python -m benchmarks.bench_execution
+"""
+import time
+
+import numpy as np
+
+from Engine.costs import ExecutionModel
+from Engine.execution import execute_signals
+from Engine.strategy import BUY, HOLD, SELL
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    models = [
+        ExecutionModel(fixed_fee=1.0, proportional_fee=0.001),
+        ExecutionModel(sizing="fraction", size=0.1),
+        ExecutionModel(sizing="target_weight", size=0.5, fractional=True),
+    ]
+    for num_rows, num_bars in ((1, 50000), (8, 10000), (256, 2000)):
+        signals = rng.choice([BUY, SELL, HOLD], size=(num_rows, num_bars))
+        close = 50 * np.exp(np.cumsum(rng.normal(0, 0.01, size=(num_rows, num_bars)), axis=1))
+        for model in models:
+            timings = {}
+            for engine in ("numpy", "python"):
+                start = time.perf_counter()
+                execute_signals(signals, close, 10000, engine=engine, execution_model=model)
+                timings[engine] = time.perf_counter() - start
+            print(f"{num_rows:4d} x {num_bars:6,d} bars {model.sizing:14s} numpy {timings['numpy'] * 1e3:8.1f} ms   "
+                  f"python {timings['python'] * 1e3:8.1f} ms   {timings['python'] / timings['numpy']:5.1f}x")
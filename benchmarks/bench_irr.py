@@ -0,0 +1,38 @@
+"""
+Benchmark the batched yield solver against one scipy.optimize call per bond.
+
+Run from the repository root:
+    python -m benchmarks.bench_irr
+"""
+import time
+
+import numpy as np
+from scipy.optimize import brentq
+
+from Engine.cash_flow_analysis import bond_cash_flows, npv, price_bonds, solve_yield_to_maturity
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    num_bonds, sample = 100000, 2000
+    face = rng.uniform(100, 1000, num_bonds)
+    coupon = rng.uniform(0, 0.1, num_bonds)
+    ytm = rng.uniform(0.01, 0.1, num_bonds)
+    periods = rng.integers(1, 61, num_bonds)
+    frequency = rng.choice([1, 2, 4], num_bonds)
+    price = price_bonds(face, coupon, ytm, periods, frequency)
+
+    start = time.perf_counter()
+    result = solve_yield_to_maturity(price, face, coupon, periods, frequency)
+    batched = time.perf_counter() - start
+    print(f"batched Newton   {num_bonds:7,d} bonds {batched * 1e3:9.1f} ms   "
+          f"converged {result['converged'].mean():.2%}   max error {np.abs(result['yield_to_maturity'] - ytm).max():.1e}")
+
+    cash_flows = bond_cash_flows(face[:sample], coupon[:sample], periods[:sample], frequency[:sample])
+    cash_flows[:, 0] -= price[:sample]
+    start = time.perf_counter()
+    for row in cash_flows:
+        brentq(npv, -0.99, 1.0, args=(row,), xtol=1e-12)
+    looped = (time.perf_counter() - start) * num_bonds / sample
+    print(f"scipy brentq     {num_bonds:7,d} bonds {looped * 1e3:9.1f} ms   (extrapolated from {sample:,d})   "
+          f"{looped / batched:5.1f}x slower")
@@ -0,0 +1,59 @@
+"""
+Benchmark the in-place GBM kernel against the original allocating implementation.
+
+Run from the repository root:
+    python -m benchmarks.bench_monte_carlo
+"""
+import time
+import tracemalloc
+
+import numpy as np
+
+from Engine.Monte_carlo import MonteCarloSimulation
+
+
+def allocating_simulation(initial_value, num_simulations, time_horizon, drift, volatility):
+    """
+    The original run_simulation body, kept as the baseline.
+    """
+    dt = 1 / time_horizon
+    random_shocks = np.random.normal(loc=0, scale=np.sqrt(dt), size=(num_simulations, time_horizon))
+    price_changes = drift * dt + volatility * random_shocks
+    paths = np.exp(np.cumsum(price_changes, axis=1))
+    paths = initial_value * paths
+    return np.insert(paths, 0, initial_value, axis=1)
+
+
+def measure(label, func, output_bytes, repeats=5):
+    """
+    Print the best wall time and the peak traced memory of ``func``.
+    """
+    func()  # warm up
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<32} {min(timings) * 1e3:9.1f} ms   peak {peak / 2**20:8.1f} MiB   "
+          f"({peak / output_bytes:4.1f}x output size)")
+
+
+if __name__ == "__main__":
+    initial_value, num_simulations, time_horizon, drift, volatility = 100000, 20000, 252, 0.07, 0.2
+    output_bytes = num_simulations * (time_horizon + 1) * 8
+    simulator = MonteCarloSimulation(initial_value, num_simulations, time_horizon, drift, volatility,
+                                     seed=0, chunk_size=num_simulations)
+    buffer = np.empty((num_simulations, time_horizon + 1))
+    buffer32 = np.empty((num_simulations, time_horizon + 1), dtype=np.float32)
+
+    measure("allocating (original)",
+            lambda: allocating_simulation(initial_value, num_simulations, time_horizon, drift, volatility),
+            output_bytes)
+    measure("kernel, new buffer", simulator.run_simulation, output_bytes)
+    measure("kernel, reused buffer", lambda: simulator.run_simulation(out=buffer), output_bytes)
+    measure("kernel, reused float32 buffer", lambda: simulator.run_simulation(out=buffer32), output_bytes)
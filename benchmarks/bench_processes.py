@@ -0,0 +1,50 @@
+"""
+Benchmark the throughput of every price process against GBM.
+
+Run from the repository root:
+    python -m benchmarks.bench_processes
+"""
+import time
+
+import numpy as np
+
+from Engine.Monte_carlo import MonteCarloSimulation
+from Engine.processes import (
+    Garch11Process,
+    GeometricBrownianMotion,
+    HestonProcess,
+    MertonJumpDiffusion,
+    OrnsteinUhlenbeckProcess,
+)
+
+
+def paths_per_second(process, initial_value, num_simulations, time_horizon, repeats=3):
+    """
+    Best-of-``repeats`` simulated paths per second into a reused buffer.
+    """
+    simulator = MonteCarloSimulation(initial_value, num_simulations, time_horizon, 0.07, 0.2,
+                                     seed=0, process=process)
+    buffer = np.empty((num_simulations, time_horizon + 1))
+    simulator.run_simulation(out=buffer)  # warm up
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        simulator.run_simulation(out=buffer)
+        timings.append(time.perf_counter() - start)
+    return num_simulations / min(timings)
+
+
+if __name__ == "__main__":
+    num_simulations, time_horizon = 50000, 252
+    processes = {
+        "GBM": (GeometricBrownianMotion(0.07, 0.2), 100),
+        "Merton jump-diffusion": (MertonJumpDiffusion(0.07, 0.2, 5, -0.02, 0.05), 100),
+        "Heston": (HestonProcess(0.07, 0.04, 2.0, 0.04, 0.3, -0.7), 100),
+        "GARCH(1,1)": (Garch11Process(0.0003, 1e-6, 0.08, 0.9), 100),
+        "Ornstein-Uhlenbeck": (OrnsteinUhlenbeckProcess(5.0, 0.03, 0.01), 0.05),
+    }
+    baseline = None
+    for label, (process, initial_value) in processes.items():
+        rate = paths_per_second(process, initial_value, num_simulations, time_horizon)
+        baseline = baseline or rate
+        print(f"{label:<24} {rate:12,.0f} paths/s   {rate / baseline:5.2f}x GBM")
@@ -0,0 +1,48 @@
+"""
+Benchmark the per-trade cost of each trade event sink.
+
+Run from the repository root:
+    python -m benchmarks.bench_trade_events
+"""
+import contextlib
+import logging
+import os
+import time
+
+from Engine.events import BufferedSink, LoggingSink, NullSink, PrintSink
+from Engine.portfolio import Portfolio
+
+
+def trade_loop(sink, num_trades):
+    """
+    Alternate buys and sells (every fifth buy rejected) and return the seconds taken.
+    """
+    portfolio = Portfolio(initial_cash=1000, sink=sink)
+    start = time.perf_counter()
+    for i in range(num_trades):
+        if i % 2 == 0:
+            portfolio.buy("AAPL", price=2000 if i % 10 == 0 else 100, quantity=1, date=i)
+        else:
+            portfolio.sell("AAPL", price=100, quantity=1, date=i)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    num_trades = 200000
+    logger = logging.getLogger("bench.trades")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    sinks = {
+        "print (to /dev/null)": PrintSink(),
+        "logging, INFO": LoggingSink(logger),
+        "logging, filtered out": LoggingSink(logger, level=logging.DEBUG, rejected_level=logging.DEBUG),
+        "buffered": BufferedSink(),
+        "silent": NullSink(),
+    }
+    with open(os.devnull, "w") as devnull:
+        for label, sink in sinks.items():
+            with contextlib.redirect_stdout(devnull):
+                seconds = trade_loop(sink, num_trades)
+            print(f"{label:<24} {seconds / num_trades * 1e6:7.2f} us/trade")